@@ -0,0 +1,747 @@
+"""Asynchronous KE-chain client based on `asyncio` and `aiohttp`.
+
+.. versionadded:: 1.13
+
+This module requires python 3.6 or later and the optional `aiohttp` dependency (`pip install pykechain[async]`).
+It is therefore not imported in the `pykechain` package itself: import it with
+`from pykechain.async_client import AsyncClient`.
+"""
+import asyncio
+
+import aiohttp
+import requests
+from six import text_type
+
+from typing import Any, Optional  # flake8: noqa
+
+from pykechain.cache import ResponseCache
+from pykechain.client import Client
+from pykechain.codec import default_codec
+from pykechain.enums import Category
+from pykechain.exceptions import ForbiddenError, NotFoundError, MultipleFoundError, APIError, IllegalArgumentError
+from pykechain.models import Scope, Activity, Part, PartSet, Property
+from pykechain.retry import RetryPolicy
+
+
+# the options of the list methods of the `Client` that are not available on the `AsyncClient`
+SYNC_ONLY_OPTIONS = ('prefetch', 'deadline', 'max_workers', 'progress')
+
+
+def _check_options(method, kwargs):
+    """Raise a TypeError for the options of the synchronous list methods, which would be sent as filters otherwise."""
+    sync_only_options = sorted(set(SYNC_ONLY_OPTIONS).intersection(kwargs))
+    if sync_only_options:
+        raise TypeError("{}() of the AsyncClient does not support the option(s) {}".format(
+            method, ', '.join(sync_only_options)))
+
+
+class AsyncResponse(object):
+    """The response of a request made by the :class:`AsyncClient`.
+
+    Provides the part of the interface of a `requests.Response` that is used by pykechain, with the body already
+    read from the connection.
+    """
+
+    def __init__(self, status_code, url, headers, content, request=None, codec=None):
+        """Construct a response from the data of an `aiohttp.ClientResponse`.
+
+        :param request: the request of the response, as a `requests.PreparedRequest`
+        :param codec: the json codec of the client, used to decode the body
+        """
+        self.status_code = status_code
+        self.url = url
+        self.headers = headers
+        self.content = content
+        self.request = request
+        self._codec = codec or default_codec()
+
+    def __repr__(self):  # pragma: no cover
+        return "<AsyncResponse [{}]>".format(self.status_code)
+
+    def json(self):
+        """Return the deserialised json body of the response, using the json codec of the client."""
+        return self._codec.loads(self.content)
+
+
+class AsyncClient(Client):
+    """The asynchronous KE-chain 2 python client, for use inside an `asyncio` event loop.
+
+    It mirrors the retrieval methods of the :class:`pykechain.Client`, but these are coroutines that need to be
+    awaited. All requests share a single `aiohttp` connection pool, so many concurrent operations can be run with
+    `asyncio.gather()` without a thread per request. The models that are retrieved by this client return awaitables
+    from their navigation methods (eg. `await part.children()`, `await part.parent()`, `await scope.parts()`).
+
+    The synchronous methods of the :class:`pykechain.Client` and its models that perform a request (eg. setting
+    `Property.value`, `client.parts_query()` or `part.subtree()`) are not available on this client: these raise a
+    `TypeError` or `NotImplementedError` instead of returning a never awaited coroutine. To update the value of a
+    property use `await client.update_property(prop, value)` or `await part.update(update_dict=...)`.
+
+    The response cache, retry policy and timeout of the client are applied to the requests as by the
+    :class:`pykechain.Client`, waiting between the attempts of a request without blocking the event loop.
+
+    Example
+    -------
+    >>> import asyncio
+    >>> from pykechain.async_client import AsyncClient
+    >>> async def main():
+    ...     async with AsyncClient(url='https://default.localhost:9443') as client:
+    ...         client.login(token='<some-super-long-secret-token>')
+    ...         project = await client.scope('Bike Project')
+    ...         bike = await project.part('Bike')
+    ...         wheels, frames = await asyncio.gather(client.parts(name='Wheel'), client.parts(name='Frame'))
+    ...         async for part in client.iter_parts(parent=bike.id):
+    ...             print(part.name)
+    >>> asyncio.get_event_loop().run_until_complete(main())
+
+    """
+
+    def __init__(self, url='http://localhost:8000/', check_certificates=True, identity_map=False, cache=None,
+                 retry=None, timeout=None, pool_size=100):
+        # type: (str, bool, bool, Optional[ResponseCache], Optional[RetryPolicy], Any, int) -> None
+        """Create an asynchronous KE-chain client with given settings.
+
+        :param url: the url of the KE-chain instance to connect to (defaults to http://localhost:8000)
+        :param check_certificates: if to check TLS/SSL Certificates. Defaults to True
+        :param identity_map: if to keep a single live model object per KE-chain id. Defaults to False
+        :param cache: (optional) a :class:`pykechain.cache.ResponseCache` to answer repeated GET requests from
+        :param retry: (optional) a :class:`pykechain.retry.RetryPolicy` to retry requests that fail because KE-chain
+                      is busy or because the connection failed. Defaults to no retries.
+        :param timeout: (optional) timeout in seconds of every request, either a single value or a (connect, read)
+                        tuple. Defaults to no timeout.
+        :param pool_size: the maximum number of simultaneous connections in the connection pool (defaults to 100)
+        """
+        super(AsyncClient, self).__init__(url=url, check_certificates=check_certificates, identity_map=identity_map,
+                                          cache=cache, retry=retry, timeout=timeout)
+
+        # the aiohttp session is created on the first request, as it needs to be bound to the running event loop
+        self.session = None
+        self.pool_size = pool_size
+        self.check_certificates = check_certificates
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke AsyncClient '{}'>".format(self.api_root)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the connection pool of this client."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _live_object(self, pk):
+        """Navigation is not answered from the identity map, as the navigation methods need to return awaitables."""
+        return None
+
+    @staticmethod
+    def _clean(values):
+        """Remove the `None` values and stringify other values, as `requests` does for params and form data."""
+        if not isinstance(values, dict):
+            return values
+        return dict((key, value if isinstance(value, (str, text_type)) else str(value))
+                    for key, value in values.items() if value is not None)
+
+    def _request(self, method, url, **kwargs):
+        """Refuse to perform a synchronous request, as made by the methods inherited from the `Client`."""
+        raise TypeError("The AsyncClient cannot perform a synchronous request, use the coroutines of the client "
+                        "and its models instead (eg. `await client.update_property(prop, value)` to set the value "
+                        "of a property)")
+
+    def _client_timeout(self):
+        """Return the timeout of the client as an `aiohttp.ClientTimeout`."""
+        if isinstance(self.timeout, tuple):
+            connect, read = self.timeout
+            return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=self.timeout)
+
+    async def _request_async(self, method, url, params=None, data=None, json=None):
+        """Perform the request on the API.
+
+        See :meth:`pykechain.Client._request`: GET requests are answered from the cache of the client if possible and
+        requests are retried according to the retry policy of the client.
+        """
+        cacheable = self.cache is not None and method == 'GET'
+        if cacheable:
+            cached_response = self.cache.get(url, params)
+            if cached_response is not None:
+                self.last_response = cached_response
+                self.last_request = cached_response.request
+                self.last_url = cached_response.url
+                self.last_attempts, self.last_backoff = 0, 0.0
+                return cached_response
+
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.pool_size, ssl=None if self.check_certificates else False)
+            self.session = aiohttp.ClientSession(connector=connector, json_serialize=self.codec.dumps)
+
+        self.last_request = None
+        self.last_response = response = await self._send_async(method, url, params=self._clean(params),
+                                                               data=self._clean(data), json=json)
+        self.last_request = response.request
+        self.last_url = response.url
+
+        if response.status_code == requests.codes.forbidden:
+            raise ForbiddenError(self._decode(response)['results'][0]['detail'])
+
+        if cacheable and response.status_code == requests.codes.ok:
+            self.cache.set(url, params, response)
+        elif self.cache is not None and method != 'GET':
+            self.cache.invalidate(url)
+
+        return response
+
+    async def _send_async(self, method, url, **kwargs):
+        """Send the request to the API, retrying it according to the retry policy of the client.
+
+        See :meth:`pykechain.Client._send`.
+        """
+        auth = aiohttp.BasicAuth(*self.auth) if self.auth else None
+        attempts, backoff = 0, 0.0
+
+        try:
+            while True:
+                attempts += 1
+                try:
+                    async with self.session.request(method, url, headers=self.headers, auth=auth,
+                                                    timeout=self._client_timeout(), **kwargs) as r:
+                        request = requests.Request(r.request_info.method, str(r.request_info.url),
+                                                   headers=dict(r.request_info.headers)).prepare()
+                        response = AsyncResponse(r.status, str(r.url), r.headers, await r.read(),
+                                                 request=request, codec=self.codec)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if self.retry is None or not self.retry.is_retryable(method, attempts):
+                        raise
+                    delay = self.retry.backoff_time(attempts)
+                else:
+                    if self.retry is None or not self.retry.is_retryable(method, attempts, response):
+                        return response
+                    delay = self.retry.backoff_time(attempts, response)
+
+                await asyncio.sleep(delay)
+                backoff += delay
+        finally:
+            self.last_attempts, self.last_backoff = attempts, backoff
+            if self.retry is not None:
+                self.retry.record(attempts, backoff)
+
+    async def _get_page_async(self, url, params=None, resource='results'):
+        """Retrieve a single page of a list endpoint of the API as json."""
+        r = await self._request_async('GET', url, params=params)
+
+        if r.status_code != requests.codes.ok:  # pragma: no cover
+            raise NotFoundError("Could not retrieve {}".format(resource))
+
+        return self._decode(r)
+
+    async def _iter_results(self, url, params=None, limit=None, resource='results'):
+        """Iterate asynchronously over the json results of a paginated list endpoint of the API.
+
+        See :meth:`pykechain.Client._iter_results`.
+        """
+        count = 0
+
+        while url:
+            data = await self._get_page_async(url, params=params, resource=resource)
+            url, params, results = data.get('next'), None, data['results']
+            del data
+
+            for result in results:
+                yield result
+                count += 1
+                # respect the limit if set to > 0
+                if limit and count >= limit:
+                    return
+
+    async def _iter_objects(self, factory, resource, params, limit=None, batch=None, partial=False):
+        """Iterate asynchronously over the model objects of a paginated list endpoint of the API.
+
+        See :meth:`pykechain.Client._iter_objects`.
+        """
+        if limit and (batch is None or limit < batch):
+            batch = limit
+        request_params = dict(params, limit=batch)
+
+        async for result_json in self._iter_results(self._build_url(resource), params=request_params, limit=limit,
+                                                    resource=resource):
+            yield self._load_object(factory, result_json, partial=partial)
+
+    async def _retrieve_users(self):
+        """Retrieve user objects of the entire administration."""
+        return {'results': [user async for user in self._iter_results(self._build_url('users'), resource='users')]}
+
+    async def _count(self, resource, params):
+        """Return the number of results of a list endpoint of the API, without retrieving the results.
+
+        See :meth:`pykechain.Client._count`.
+        """
+        url = self._build_url(resource)
+        data = await self._get_page_async(url, params=dict(params, limit=1), resource=resource)
+
+        if data.get('count') is not None:
+            return data['count']
+        if not data.get('next'):
+            return len(data['results'])
+
+        params = dict(params, limit=None, fields=self._fields_param(['id']))
+        return len([result async for result in self._iter_results(url, params=params, resource=resource)])
+
+    async def scopes(self, name=None, pk=None, status='ACTIVE', limit=None, batch=None):
+        """Return all scopes visible / accessible for the logged in user.
+
+        See :meth:`pykechain.Client.scopes`.
+        """
+        return [scope async for scope in self.iter_scopes(name=name, pk=pk, status=status, limit=limit, batch=batch)]
+
+    async def iter_scopes(self, name=None, pk=None, status='ACTIVE', limit=None, batch=None):
+        """Iterate asynchronously over the scopes while they are retrieved page by page.
+
+        Use as `async for scope in client.iter_scopes(...)`. See :meth:`pykechain.Client.iter_scopes`.
+        """
+        request_params = {
+            'name': name,
+            'id': pk,
+            'status': status
+        }
+        async for scope in self._iter_objects(AsyncScope, 'scopes', request_params, limit=limit, batch=batch):
+            yield scope
+
+    async def scope(self, *args, **kwargs):
+        """Return a single scope based on the provided name.
+
+        See :meth:`pykechain.Client.scope`.
+        """
+        _scopes = await self.scopes(*args, **dict(kwargs, limit=2))
+
+        if len(_scopes) == 0:
+            raise NotFoundError("No scope fits criteria")
+        if len(_scopes) != 1:
+            raise MultipleFoundError("Multiple scopes fit criteria")
+
+        return _scopes[0]
+
+    async def activities(self, name=None, pk=None, scope=None, limit=None, batch=None, **kwargs):
+        """Search on activities with optional name filter.
+
+        See :meth:`pykechain.Client.activities`.
+        """
+        return [activity async for activity in self.iter_activities(name=name, pk=pk, scope=scope, limit=limit,
+                                                                    batch=batch, **kwargs)]
+
+    async def iter_activities(self, name=None, pk=None, scope=None, limit=None, batch=None, **kwargs):
+        """Iterate asynchronously over the activities while they are retrieved page by page.
+
+        Use as `async for activity in client.iter_activities(...)`. See :meth:`pykechain.Client.iter_activities`.
+
+        :raises: TypeError for the options `prefetch`, `deadline`, `max_workers` and `progress` of the `Client`
+        """
+        _check_options('iter_activities', kwargs)
+        request_params = {
+            'id': pk,
+            'name': name,
+            'scope': scope
+        }
+        if kwargs:
+            request_params.update(**kwargs)
+
+        async for activity in self._iter_objects(AsyncActivity, 'activities', request_params, limit=limit,
+                                                 batch=batch):
+            yield activity
+
+    async def activity(self, *args, **kwargs):
+        """Search for a single activity.
+
+        See :meth:`pykechain.Client.activity`.
+        """
+        _activities = await self.activities(*args, **dict(kwargs, limit=2))
+
+        if len(_activities) == 0:
+            raise NotFoundError("No activity fits criteria")
+        if len(_activities) != 1:
+            raise MultipleFoundError("Multiple activities fit criteria")
+
+        return _activities[0]
+
+    async def count_activities(self, name=None, pk=None, scope=None, **kwargs):
+        """Count the activities that fit the filters, without retrieving them.
+
+        See :meth:`pykechain.Client.count_activities`.
+        """
+        _check_options('count_activities', kwargs)
+        request_params = {
+            'id': pk,
+            'name': name,
+            'scope': scope
+        }
+        if kwargs:
+            request_params.update(**kwargs)
+
+        return await self._count('activities', request_params)
+
+    async def iter_parts(self, name=None, pk=None, model=None, category=Category.INSTANCE, bucket=None, parent=None,
+                         activity=None, limit=None, batch=100, fields=None, property_fields=None, **kwargs):
+        """Iterate asynchronously over KE-chain parts while they are retrieved page by page.
+
+        Use as `async for part in client.iter_parts(...)`. See :meth:`pykechain.Client.iter_parts`. The attributes
+        of the fields that are not retrieved with `fields` need a synchronous request on access, which raises a
+        `TypeError`.
+
+        :raises: TypeError for the options `prefetch`, `deadline`, `max_workers` and `progress` of the `Client`
+        """
+        _check_options('iter_parts', kwargs)
+        request_params = self._parts_params(name=name, pk=pk, model=model, category=category, bucket=bucket,
+                                            parent=parent, activity=activity, limit=limit, batch=batch,
+                                            fields=fields, property_fields=property_fields, **kwargs)
+
+        async for part_json in self._iter_results(self._build_url('parts'), params=request_params, limit=limit,
+                                                  resource='parts'):
+            yield self._load_object(AsyncPart, part_json, partial=fields is not None)
+
+    async def count_parts(self, name=None, pk=None, model=None, category=Category.INSTANCE, bucket=None, parent=None,
+                          activity=None, **kwargs):
+        """Count the KE-chain parts that fit the filters, without retrieving them.
+
+        See :meth:`pykechain.Client.count_parts`.
+        """
+        _check_options('count_parts', kwargs)
+        request_params = self._parts_params(name=name, pk=pk, model=model, category=category, bucket=bucket,
+                                            parent=parent, activity=activity, **kwargs)
+        return await self._count('parts', request_params)
+
+    def parts_query(self, **kwargs):
+        """Refuse to build a lazy query of parts, which is not available on the asynchronous client.
+
+        :raises: NotImplementedError
+        """
+        raise NotImplementedError("Lazy part queries are not available on the AsyncClient, use "
+                                  "`client.iter_parts()` and filter the parts while iterating")
+
+    def part_tree(self, root, depth=None, max_workers=None):
+        """Refuse to retrieve the subtree of a part, which is not available on the asynchronous client.
+
+        :raises: NotImplementedError
+        """
+        raise NotImplementedError("Subtrees of parts cannot be retrieved with the AsyncClient, use "
+                                  "`await part.children()` per level of the tree")
+
+    def batch(self, objects=None, max_url_length=None):
+        """Refuse to batch the navigation of parts, which is not available on the asynchronous client.
+
+        :raises: NotImplementedError
+        """
+        raise NotImplementedError("Batched navigation is not available on the AsyncClient, use `asyncio.gather()` "
+                                  "to navigate from many parts concurrently")
+
+    async def parts(self, *args, **kwargs):
+        """Retrieve multiple KE-chain parts.
+
+        See :meth:`pykechain.Client.parts`.
+        """
+        return PartSet([part async for part in self.iter_parts(*args, **kwargs)])
+
+    async def part(self, *args, **kwargs):
+        """Retrieve single KE-chain part.
+
+        See :meth:`pykechain.Client.part`.
+        """
+        _parts = await self.parts(*args, **dict(kwargs, limit=2))
+
+        if len(_parts) == 0:
+            raise NotFoundError("No part fits criteria")
+        if len(_parts) != 1:
+            raise MultipleFoundError("Multiple parts fit criteria")
+
+        return _parts[0]
+
+    async def model(self, *args, **kwargs):
+        """Retrieve single KE-chain part model.
+
+        See :meth:`pykechain.Client.model`.
+        """
+        kwargs['category'] = Category.MODEL
+        _parts = await self.parts(*args, **dict(kwargs, limit=2))
+
+        if len(_parts) == 0:
+            raise NotFoundError("No model fits criteria")
+        if len(_parts) != 1:
+            raise MultipleFoundError("Multiple model fit criteria")
+
+        return _parts[0]
+
+    async def properties(self, name=None, pk=None, category=Category.INSTANCE, limit=None, batch=None):
+        """Retrieve properties.
+
+        See :meth:`pykechain.Client.properties`.
+        """
+        return [prop async for prop in self.iter_properties(name=name, pk=pk, category=category, limit=limit,
+                                                            batch=batch)]
+
+    async def iter_properties(self, name=None, pk=None, category=Category.INSTANCE, limit=None, batch=None):
+        """Iterate asynchronously over the properties while they are retrieved page by page.
+
+        Use as `async for prop in client.iter_properties(...)`. See :meth:`pykechain.Client.iter_properties`.
+        """
+        request_params = {
+            'name': name,
+            'id': pk,
+            'category': category
+        }
+        async for prop in self._iter_objects(Property.create, 'properties', request_params, limit=limit,
+                                             batch=batch):
+            yield prop
+
+    async def create_activity(self, process, name, activity_class="UserTask"):
+        """Create a new activity.
+
+        See :meth:`pykechain.Client.create_activity`.
+        """
+        r = await self._request_async('POST', self._build_url('activities'), data={
+            "name": name,
+            "process": process,
+            "activity_class": activity_class
+        })
+
+        if r.status_code != requests.codes.created:  # pragma: no cover
+            raise APIError("Could not create activity")
+
+        return self._load_object(AsyncActivity, self._decode(r)['results'][0])
+
+    async def _create_part(self, action, data):
+        r = await self._request_async('POST', self._build_url('parts'), params={"select_action": action}, data=data)
+
+        if r.status_code != requests.codes.created:  # pragma: no cover
+            raise APIError("Could not create part, {}: {}".format(str(r), r.content))
+
+        return self._load_object(AsyncPart, self._decode(r)['results'][0])
+
+    async def create_property(self, model, name, description=None, property_type='CHAR', default_value=None):
+        """Create a new property model under a given model.
+
+        See :meth:`pykechain.Client.create_property`.
+        """
+        if model.category != Category.MODEL:
+            raise IllegalArgumentError("The model should be of category MODEL")
+
+        r = await self._request_async('POST', self._build_url('properties'), data={
+            "name": name,
+            "part": model.id,
+            "description": description,
+            "property_type": property_type.upper() + '_VALUE',
+            "value": default_value
+        })
+
+        if r.status_code != requests.codes.created:
+            raise APIError("Could not create property")
+
+        prop = self._load_object(Property.create, self._decode(r)['results'][0])
+
+        model.properties.append(prop)
+
+        return prop
+
+    async def update_property(self, prop, value):
+        """Update the value of a property in KE-chain.
+
+        This is the asynchronous variant of setting `Property.value`.
+
+        :param prop: the :class:`pykechain.models.Property` to update
+        :param value: the new value. A reference property accepts a `Part`, `Part` id or None.
+        :raises: APIError
+        """
+        if isinstance(value, Part):
+            value = value.id
+
+        r = await self._request_async('PUT', self._build_url('property', property_id=prop.id), json={'value': value})
+
+        if r.status_code != requests.codes.ok:  # pragma: no cover
+            raise APIError("Could not update property value")
+
+        prop._value = self._decode(r)['results'][0]['value']
+        prop._json_data['value'] = prop._value
+
+
+class AsyncScope(Scope):
+    """A KE-chain scope retrieved by the :class:`AsyncClient`.
+
+    The retrieval methods delegate to the client and return awaitables.
+    """
+
+    async def part_graph(self, **kwargs):
+        """Retrieve all parts of this scope as a :class:`pykechain.models.PartGraph`.
+
+        The graph is not attached to the parts, as their navigation methods return awaitables. Navigate
+        the graph itself instead, e.g. with :meth:`pykechain.models.PartGraph.children`.
+
+        :param kwargs: (optional) additional search arguments of :meth:`AsyncClient.parts`
+        :return: a :class:`pykechain.models.PartGraph`
+
+        Example
+        -------
+        >>> graph = await scope.part_graph()
+        >>> wheels = graph.children(graph.get(name='Bike'))
+
+        """
+        from pykechain.models.partgraph import PartGraph
+        return PartGraph(await self.parts(**dict(dict(category=None), **kwargs)))
+
+    async def add_member(self, member):
+        """Add a single member to the scope."""
+        await self._update_scope_project_team(select_action='add_member', user=member, user_type='member')
+
+    async def remove_member(self, member):
+        """Remove a single member from the scope."""
+        await self._update_scope_project_team(select_action='remove_member', user=member, user_type='member')
+
+    async def add_manager(self, manager):
+        """Add a single manager to the scope."""
+        await self._update_scope_project_team(select_action='add_manager', user=manager, user_type='manager')
+
+    async def remove_manager(self, manager):
+        """Remove a single manager from the scope."""
+        await self._update_scope_project_team(select_action='remove_manager', user=manager, user_type='manager')
+
+    async def _update_scope_project_team(self, select_action, user, user_type):
+        if not isinstance(user, (str, text_type)):
+            raise TypeError("User {} should be defined as a string".format(user))
+
+        users = await self._client._retrieve_users()
+        user_object = next((item for item in users['results'] if item["username"] == user), None)
+        if not user_object:
+            raise NotFoundError("User {} does not exist".format(user))
+
+        url = self._client._build_url('scope', scope_id=self.id)
+        r = await self._client._request_async('PUT', url, params={'select_action': select_action},
+                                              data={'user_id': user_object['pk']})
+        if r.status_code != requests.codes.ok:  # pragma: no cover
+            raise APIError("Could not {} {} in Scope".format(select_action.split('_')[0], user_type))
+
+
+class AsyncActivity(Activity):
+    """A KE-chain activity retrieved by the :class:`AsyncClient`.
+
+    The retrieval methods delegate to the client and return awaitables.
+    """
+
+    async def associated_parts(self, *args, **kwargs):
+        """Retrieve models and instances belonging to this activity.
+
+        See :meth:`pykechain.models.Activity.associated_parts`.
+        """
+        return await self.parts(category=Category.MODEL, *args, **kwargs), \
+            await self.parts(category=Category.INSTANCE, *args, **kwargs)
+
+    async def configure(self, inputs, outputs):
+        """Configure activity input and output.
+
+        See :meth:`pykechain.models.Activity.configure`.
+        """
+        url = self._client._build_url('activity', activity_id=self.id)
+
+        r = await self._client._request_async('PUT', url, params={'select_action': 'update_associations'}, json={
+            'inputs': [p.id for p in inputs],
+            'outputs': [p.id for p in outputs]
+        })
+
+        if r.status_code != requests.codes.ok:  # pragma: no cover
+            raise APIError("Could not configure activity")
+
+    async def delete(self):
+        """Delete this activity."""
+        r = await self._client._request_async('DELETE', self._client._build_url('activity', activity_id=self.id))
+
+        if r.status_code != requests.codes.no_content:  # pragma: no cover
+            raise APIError("Could not delete activity: {} with id {}".format(self.name, self.id))
+
+
+class AsyncPart(Part):
+    """A KE-chain part retrieved by the :class:`AsyncClient`.
+
+    The retrieval methods delegate to the client and return awaitables.
+    """
+
+    async def parent(self):
+        """Retrieve the parent of this `Part`.
+
+        See :meth:`pykechain.models.Part.parent`.
+        """
+        if self.parent_id:
+            return await self._client.part(pk=self.parent_id, category=self.category)
+        else:
+            return None
+
+    async def siblings(self):
+        """Retrieve the siblings of this `Part` as `Partset`.
+
+        See :meth:`pykechain.models.Part.siblings`.
+        """
+        if self.parent_id:
+            return await self._client.parts(parent=self.parent_id, category=self.category)
+        else:
+            return PartSet(parts=[])
+
+    async def instance(self):
+        """Retrieve the single (expected) instance of this 'Part' (of `Category.MODEL`) as a 'Part'.
+
+        See :meth:`pykechain.models.Part.instance`.
+        """
+        instances_list = list(await self.instances())
+        if len(instances_list) == 1:
+            return instances_list[0]
+        else:
+            raise MultipleFoundError("Part {} has more than a single instance. "
+                                     "Use the `Part.instances()` method".format(self.name))
+
+    async def delete(self):
+        """Delete this part."""
+        r = await self._client._request_async('DELETE', self._client._build_url('part', part_id=self.id))
+
+        if r.status_code != requests.codes.no_content:  # pragma: no cover
+            raise APIError("Could not delete part: {} with id {}".format(self.name, self.id))
+
+    async def edit(self, name=None, description=None, **kwargs):
+        """Edit the details of a part (model or instance).
+
+        See :meth:`pykechain.models.Part.edit`.
+        """
+        update_dict = {'id': self.id}
+        if name:
+            if not isinstance(name, (str, text_type)):
+                raise IllegalArgumentError("name should be provided as a string")
+            update_dict.update({'name': name})
+        if description:
+            if not isinstance(description, (str, text_type)):
+                raise IllegalArgumentError("description should be provided as a string")
+            update_dict.update({'description': description})
+        if kwargs:  # pragma: no cover
+            update_dict.update(**kwargs)
+
+        r = await self._client._request_async('PUT', self._client._build_url('part', part_id=self.id), json=update_dict)
+
+        if r.status_code != requests.codes.ok:  # pragma: no cover
+            raise APIError("Could not update Part ({})".format(r))
+
+        if name:
+            self.name = name
+
+    async def update(self, name=None, update_dict=None, bulk=True, **kwargs):
+        """Edit part name and property values in one go.
+
+        See :meth:`pykechain.models.Part.update`.
+        """
+        if bulk and len(update_dict.keys()) > 1:
+            if name and not isinstance(name, (str, text_type)):
+                raise IllegalArgumentError("Name of the part should be provided as a string")
+
+            request_body = self._client.codec.dumps(dict([(self.property(property_name).id, property_value)
+                                                          for property_name, property_value in update_dict.items()]))
+            r = await self._client._request_async('PUT', self._client._build_url('part', part_id=self.id),
+                                                  data=dict(name=name, properties=request_body, **kwargs),
+                                                  params=dict(select_action='bulk_update_properties'))
+            if r.status_code != requests.codes.ok:  # pragma: no cover
+                raise APIError('{}: {}'.format(str(r), r.content))
+        else:
+            for property_name, property_value in update_dict.items():
+                await self._client.update_property(self.property(property_name), property_value)
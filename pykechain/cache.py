@@ -0,0 +1,141 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple  # flake8: noqa
+
+from six.moves.urllib.parse import urlparse, parse_qsl
+
+from pykechain.utils import monotonic
+
+# writes to a resource that change the representation of other resources as well, eg. the parts embed their
+# properties, the activities embed their widget configuration and the associations of an activity change the parts
+# retrieved with `parts(activity=...)`
+RELATED_RESOURCES = {
+    'activities': ('parts',),
+    'parts': ('properties',),
+    'properties': ('parts',),
+    'widget_config': ('activities',),
+}
+
+
+def resource_of(url):
+    # type: (str) -> Optional[str]
+    """Return the name of the api resource of an url, eg. 'parts' for both `api/parts.json` and `api/parts/<id>.json`.
+
+    :param url: url of the KE-chain api
+    :return: name of the resource or None when the url is not an api url
+    """
+    segments = urlparse(url).path.strip('/').split('/')
+    if 'api' not in segments[:-1]:
+        return None
+    resource = segments[segments.index('api') + 1]
+    return resource[:-len('.json')] if resource.endswith('.json') else resource
+
+
+class ResponseCache(object):
+    """A cache of the responses to GET requests of a :class:`pykechain.Client`, limited in time and size.
+
+    Responses are cached under their url and their normalised parameters for `ttl` seconds. When more than `maxsize`
+    responses are cached the least recently used response is evicted. Any other request (PUT, POST, DELETE) through
+    the client invalidates the cached responses of the resource that it changes.
+
+    Another cache implementation can be used by the client, as long as it provides the `get`, `set`, `invalidate` and
+    `clear` methods.
+
+    :ivar hits: number of requests that were answered from the cache
+    :ivar misses: number of cacheable requests that were not found in the cache
+
+    Example
+    -------
+    >>> client = Client(url='https://default.localhost:9443', cache=ResponseCache(ttl=300, maxsize=1000))
+    >>> for wheel in wheels:
+    ...     wheel_model = client.model(pk=wheel_model_id)  # only the first call makes a request
+    >>> client.cache.stats
+    {'hits': 99, 'misses': 1, 'size': 1}
+
+    """
+
+    def __init__(self, ttl=60, maxsize=256):
+        # type: (float, int) -> None
+        """Create an empty response cache.
+
+        :param ttl: time to live of a cached response in seconds (defaults to 60 seconds)
+        :param maxsize: maximum number of cached responses (defaults to 256 responses)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke {} object {} responses>".format(self.__class__.__name__, len(self))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def stats(self):
+        # type: () -> Dict[str, int]
+        """Return the number of hits, misses and cached responses."""
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self)}
+
+    @staticmethod
+    def key(url, params=None):
+        # type: (str, Optional[Dict[str, Any]]) -> Tuple
+        """Return the cache key of a request, independent of the order of the parameters.
+
+        The parameters in the query of the url and the `params` are combined, leaving out `None` values as these
+        are not sent to the server.
+        """
+        parsed_url = urlparse(url)
+        query = parse_qsl(parsed_url.query, keep_blank_values=True)
+        query.extend((key, str(value)) for key, value in (params or {}).items() if value is not None)
+        return parsed_url._replace(query='', fragment='').geturl(), tuple(sorted(query))
+
+    def get(self, url, params=None):
+        # type: (str, Optional[Dict[str, Any]]) -> Any
+        """Return the cached response of a GET request, or None when it is not cached or expired."""
+        key = self.key(url, params)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > monotonic():
+                # mark as most recently used
+                del self._entries[key]
+                self._entries[key] = entry
+                self.hits += 1
+                return entry[2]
+
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, url, params, response):
+        # type: (str, Optional[Dict[str, Any]], Any) -> None
+        """Cache the response of a GET request."""
+        key = self.key(url, params)
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (monotonic() + self.ttl, resource_of(url), response)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url):
+        # type: (str) -> None
+        """Remove the cached responses of the resource (and related resources) changed by a request to the url."""
+        resource = resource_of(url)
+        resources = (resource,) + RELATED_RESOURCES.get(resource, ())
+
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if entry[1] in resources]:
+                del self._entries[key]
+
+    def clear(self):
+        # type: () -> None
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
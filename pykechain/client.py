@@ -1,13 +1,27 @@
-from typing import Dict, Tuple, Optional, Any, List  # flake8: noqa
+from typing import Dict, Tuple, Optional, Any, List, Iterable, Iterator, Callable  # flake8: noqa
 
 import requests
+import threading
+import time
 import warnings
+from collections import deque
+from itertools import islice
+from multiprocessing.pool import ThreadPool
 from envparse import env
-from requests.compat import urljoin, urlparse  # type: ignore
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+from requests.compat import urljoin, urlparse, urlencode, quote  # type: ignore
 
 from pykechain.enums import Category, KechainEnv
 from .__about__ import version
-from .exceptions import ForbiddenError, NotFoundError, MultipleFoundError, APIError, ClientError, IllegalArgumentError
+from .exceptions import ForbiddenError, NotFoundError, MultipleFoundError, APIError, ClientError, \
+    IllegalArgumentError, DeadlineExceededError
+from .cache import ResponseCache
+from .codec import default_codec
+from .identity_map import IdentityMap
+from .loader import BatchLoader, prefetch_related, prefetch_children
+from .query import PartQuery
+from .retry import RetryPolicy
+from .utils import monotonic
 from .models import Scope, Activity, Part, PartSet, Property
 
 API_PATH = {
@@ -26,6 +40,25 @@ API_PATH = {
     'users': 'api/users.json'
 }
 
+# fields that are always retrieved when only some fields of parts and properties are requested
+REQUIRED_PART_FIELDS = ('id', 'category')
+REQUIRED_PROPERTY_FIELDS = ('id', 'property_type')
+
+# maximum length of the url of a request, well within the limits of common web servers and proxies
+MAX_URL_LENGTH = 2000
+
+
+def _thread_local_property(name, default=None):
+    # type: (str, Any) -> property
+    """Create a property of which the value is stored per thread in the `_local` storage of the client."""
+    def fget(self):
+        return getattr(self._local, name, default)
+
+    def fset(self, value):
+        setattr(self._local, name, value)
+
+    return property(fget, fset)
+
 
 class Client(object):
     """The KE-chain 2 python client to connect to a KE-chain (version 2) instance.
@@ -33,17 +66,62 @@ class Client(object):
     :ivar last_request: last executed request. Which is of type `requests.Request`_
     :ivar last_response: last executed response. Which is of type `requests.Response`_
     :ivar last_url: last called api url
+    :ivar last_attempts: number of attempts made for the last request, see :class:`pykechain.retry.RetryPolicy`
+    :ivar last_backoff: time in seconds waited between the attempts of the last request
 
     .. _requests.Request: http://docs.python-requests.org/en/master/api/#requests.Request
     .. _requests.Response: http://docs.python-requests.org/en/master/api/#requests.Response
+
+    Thread safety
+    -------------
+    A single (authenticated) client can be shared by many threads, eg. in a thread pool for bulk jobs. The `last_*`
+    bookkeeping of the requests is stored per thread, so every thread sees its own last request. The connection
+    pool, the identity map, the response cache and the retry policy are safe to share. Use `pool_maxsize` to allow a
+    connection per thread and login before sharing the client with other threads.
+
+    >>> from multiprocessing.pool import ThreadPool
+    >>> client = Client(url='https://default.localhost:9443', pool_maxsize=16)
+    >>> client.login(token='<some-super-long-secret-token>')
+    >>> ThreadPool(16).map(lambda model: client.parts(model=model), models)  # doctest: Ellipsis
+    ...
+
     """
 
-    def __init__(self, url='http://localhost:8000/', check_certificates=True):
-        # type: (str, bool) -> None
+    last_request = _thread_local_property('last_request')
+    last_response = _thread_local_property('last_response')
+    last_url = _thread_local_property('last_url')
+    last_attempts = _thread_local_property('last_attempts', 0)
+    last_backoff = _thread_local_property('last_backoff', 0.0)
+    _batch_loader = _thread_local_property('_batch_loader')
+
+    def __init__(self, url='http://localhost:8000/', check_certificates=True, identity_map=False, cache=None,
+                 retry=None, timeout=None, pool_connections=DEFAULT_POOLSIZE, pool_maxsize=DEFAULT_POOLSIZE,
+                 compact=False, codec=None, fast_lookups=True):
+        # type: (...) -> None
         """Create a KE-chain client with given settings.
 
         :param url: the url of the KE-chain instance to connect to (defaults to http://localhost:8000)
         :param check_certificates: if to check TLS/SSL Certificates. Defaults to True
+        :param identity_map: if to keep a single live model object per KE-chain id. Retrieved data refreshes the
+                             existing object in place and navigation (eg. `Part.parent()`, `Part.model()`) is
+                             answered from the live objects before a request is made. Defaults to False
+        :param cache: (optional) a :class:`pykechain.cache.ResponseCache` to answer repeated GET requests from.
+                      Other requests invalidate the cached responses of the resource they change.
+        :param retry: (optional) a :class:`pykechain.retry.RetryPolicy` to retry requests that fail because KE-chain
+                      is busy (eg. status 429 or 503) or because the connection failed. Defaults to no retries.
+        :param timeout: (optional) timeout in seconds of every request, either a single value or a (connect, read)
+                        tuple. Defaults to no timeout.
+        :param pool_connections: number of connection pools (one per host) to cache (defaults to 10)
+        :param pool_maxsize: maximum number of connections to keep in a pool, set this to at least the number of
+                             threads that share this client (defaults to 10)
+        :param compact: if to drop the keys of the retrieved json of parts and properties that are not used by
+                        pykechain, to reduce the memory use when retrieving many parts. Defaults to False
+        :param codec: (optional) a :class:`pykechain.codec.JSONCodec` to decode the responses and encode the json
+                      in requests with. Defaults to `orjson` or `ujson` when installed, otherwise the standard library.
+        :param fast_lookups: if to retrieve a single object (eg. `part()`, `scope()`) with a single small request: from
+                             the detail endpoint of the api for a lookup on `pk`, otherwise at most two objects of the
+                             list endpoint. Set to False to retrieve all matching objects of the list endpoint, as
+                             pykechain 1.12 does. Defaults to True
 
         Examples
         --------
@@ -53,18 +131,46 @@ class Client(object):
         >>> from pykechain import Client
         >>> client = Client(url='https://default-tst.localhost:9443', check_certificates=False)
 
+        >>> client = Client(url='https://default-tst.localhost:9443', identity_map=True)
+        >>> client.part('Bike') is client.part('Bike')
+        True
+
+        >>> from pykechain.cache import ResponseCache
+        >>> client = Client(url='https://default-tst.localhost:9443', cache=ResponseCache(ttl=300, maxsize=1000))
+
+        >>> from pykechain.retry import RetryPolicy
+        >>> client = Client(url='https://default-tst.localhost:9443', retry=RetryPolicy(max_attempts=5))
+
+        >>> client = Client(url='https://default-tst.localhost:9443', timeout=(3.05, 30), pool_maxsize=32)
+
+        >>> client = Client(url='https://default-tst.localhost:9443', compact=True)
+
+        >>> from pykechain.codec import JSONCodec
+        >>> client = Client(url='https://default-tst.localhost:9443', codec=JSONCodec())
+
         """
         parsed_url = urlparse(url)
         if not (parsed_url.scheme and parsed_url.netloc):
             raise ClientError("Please provide a valid URL to a KE-chain instance")
 
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.timeout = timeout  # type: Any
         self.api_root = url
         self.headers = {'X-Requested-With': 'XMLHttpRequest', 'PyKechain-Version': version}  # type: Dict[str, str]
         self.auth = None  # type: Optional[Tuple[str, str]]
+        self._local = threading.local()
         self.last_request = None  # type: Optional[requests.PreparedRequest]
         self.last_response = None  # type: Optional[requests.Response]
         self.last_url = None  # type: Optional[str]
+        self.identity_map = IdentityMap() if identity_map else None  # type: Optional[IdentityMap]
+        self.cache = cache  # type: Optional[ResponseCache]
+        self.retry = retry  # type: Optional[RetryPolicy]
+        self.compact = compact
+        self.codec = codec or default_codec()
+        self.fast_lookups = fast_lookups
 
         if not check_certificates:
             self.session.verify = False
@@ -147,11 +253,121 @@ class Client(object):
             self.headers.pop('Authorization', None)
             self.auth = (username, password)
 
+        # cached responses could have been retrieved with the permissions of another user
+        if self.cache is not None:
+            self.cache.clear()
+
     def _build_url(self, resource, **kwargs):
         # type: (str, **str) -> str
         """Build the correct API url."""
         return urljoin(self.api_root, API_PATH[resource].format(**kwargs))
 
+    def _load_object(self, factory, json, **kwargs):
+        # type: (Any, Dict, **Any) -> Any
+        """Create a model object from json, or refresh the live object with its id when using the identity map."""
+        if self.identity_map is None:
+            obj = factory(json, client=self, **kwargs)
+        else:
+            obj = self.identity_map.load(factory, json, client=self, **kwargs)
+
+        if self._batch_loader is not None:
+            self._batch_loader.track(obj)
+        return obj
+
+    def _live_object(self, pk):
+        # type: (Optional[str]) -> Any
+        """Return the live model object with the id when using the identity map, otherwise None."""
+        if self.identity_map is None:
+            return None
+        return self.identity_map.get(pk)
+
+    def _related_part(self, obj, relation, pk, retrieve, **kwargs):
+        # type: (Any, str, str, Callable, **Any) -> Any
+        """Return the part related to a part or property, eg. the model of a part, for the navigation methods.
+
+        The part is answered from the identity map or, within a :meth:`batch` scope, loaded together with the
+        related parts of the other objects of the scope. Otherwise it is retrieved with `retrieve(pk=pk, **kwargs)`.
+
+        :param obj: the :class:`pykechain.models.Part` or :class:`pykechain.models.Property` to navigate from
+        :param relation: the relation, see :meth:`pykechain.loader.PartLoader.load_related`
+        :param pk: the id of the related part
+        :param retrieve: the method to retrieve a single part with, eg. `self.model`
+        :param kwargs: additional filters of the retrieve method, eg. the `category`
+        """
+        live_part = self._live_object(pk)
+        if live_part is not None:
+            return live_part
+        if self._batch_loader is not None:
+            return self._batch_loader.related(obj, relation, pk)
+        return retrieve(pk=pk, **kwargs)
+
+    def batch(self, objects=None, max_url_length=None):
+        # type: (Optional[Iterable[Any]], Optional[int]) -> BatchLoader
+        """Batch the navigation between parts and properties into a few `id__in` requests.
+
+        Use the returned scope in a `with` block. Within the scope the parts and properties retrieved by the client
+        (and the `objects` provided) are tracked. When a navigation method needs a part that is not loaded yet, eg.
+        `Part.model()`, `Part.parent()`, `Part.proxy_model()`, `Property.part` or the `value` of a reference
+        property, the related parts of all tracked objects for that relation are loaded together. Looping over
+        many parts then makes a few requests instead of a request per part. The scope is kept per thread.
+
+        :param objects: (optional) parts and properties retrieved before the scope to batch the navigation of
+        :param max_url_length: (optional) maximum length of the url of a request, defaults to `MAX_URL_LENGTH`
+        :return: :class:`pykechain.loader.BatchLoader`
+
+        Example
+        -------
+        Retrieve the models of all wheels in a single request instead of a request per wheel
+
+        >>> with client.batch():
+        ...     wheels = client.parts(name='Wheel')
+        ...     for wheel in wheels:
+        ...         print(wheel.model().name)
+
+        Batch the navigation of parts that were retrieved before
+
+        >>> with client.batch(objects=bikes):
+        ...     frames = [bike.parent() for bike in bikes]
+
+        """
+        return BatchLoader(self, objects=objects, max_url_length=max_url_length)
+
+    def _forget_object(self, pk):
+        # type: (str) -> None
+        """Remove the model object with the id from the identity map, eg. after it is deleted."""
+        if self.identity_map is not None:
+            self.identity_map.discard(pk)
+
+    @staticmethod
+    def _fields_param(fields, required=('id',), property_fields=None):
+        # type: (Optional[List[str]], Tuple[str, ...], Optional[List[str]]) -> Optional[str]
+        """Build the `fields` parameter to retrieve only some fields of the json of a list api.
+
+        :param fields: the fields to retrieve, or None to retrieve all fields
+        :param required: the fields that are always retrieved, as they are needed to create the model
+        :param property_fields: (optional) the fields of the nested properties of parts to retrieve
+        :return: comma separated fields, with the fields of the properties as `properties.<field>`, or None
+        """
+        if fields is None and property_fields is None:
+            return None
+
+        if fields is None:
+            fields = [key for key in Part.json_keys if key != 'properties']
+        if property_fields is not None:
+            fields = [field for field in fields if field != 'properties'] + [
+                'properties.{}'.format(field) for field in REQUIRED_PROPERTY_FIELDS + tuple(property_fields)]
+
+        selected_fields = []  # type: List[str]
+        for field in tuple(required) + tuple(fields):
+            if field not in selected_fields:
+                selected_fields.append(field)
+        return ','.join(selected_fields)
+
+    def _decode(self, response):
+        # type: (requests.Response) -> Any
+        """Return the decoded json body of a response, using the json codec of the client."""
+        return self.codec.loads(response.content)
+
     def _retrieve_users(self):
         """
         Retrieve user objects of the entire administration.
@@ -161,32 +377,107 @@ class Client(object):
 
         """
         users_url = self._build_url('users')
-        response = self._request('GET', users_url)
-        users = response.json()
-        return users
+        return {'results': list(self._iter_results(users_url, resource='users'))}
 
     def _request(self, method, url, **kwargs):
         # type: (str, str, **Any) -> requests.Response
-        """Perform the request on the API."""
+        """Perform the request on the API.
+
+        When the client has a cache, GET requests are answered from the cache if possible and other requests
+        invalidate the cached responses of the resource they change. When the client has a retry policy, the
+        request is retried according to that policy. A `json` body is encoded with the json codec of the client.
+
+        With a `deadline` (a `monotonic()` time) the timeout of every attempt is shortened to end at the deadline,
+        and a `DeadlineExceededError` is raised instead of waiting for a retry that cannot start before it.
+        """
+        cacheable = self.cache is not None and method == 'GET'
+        if cacheable:
+            cached_response = self.cache.get(url, kwargs.get('params'))
+            if cached_response is not None:
+                self.last_response = cached_response
+                self.last_request = cached_response.request
+                self.last_url = cached_response.url
+                self.last_attempts, self.last_backoff = 0, 0.0
+                return cached_response
+
+        if kwargs.get('deadline') is None:
+            kwargs.setdefault('timeout', self.timeout)
+        if kwargs.get('json') is not None:
+            # encode the json body with the codec of the client
+            kwargs['data'] = self.codec.dumps(kwargs.pop('json'))
+            kwargs['headers'] = dict(self.headers, **{'Content-Type': 'application/json'})
+
         self.last_request = None
-        self.last_response = self.session.request(method, url, auth=self.auth, headers=self.headers, **kwargs)
-        self.last_request = self.last_response.request
-        self.last_url = self.last_response.url
+        self.last_response = response = self._send(method, url, **kwargs)
+        self.last_request = response.request
+        self.last_url = response.url
+
+        if response.status_code == requests.codes.forbidden:
+            raise ForbiddenError(self._decode(response)['results'][0]['detail'])
+
+        if cacheable and response.status_code == requests.codes.ok:
+            self.cache.set(url, kwargs.get('params'), response)
+        elif self.cache is not None and method != 'GET':
+            self.cache.invalidate(url)
 
-        if self.last_response.status_code == requests.codes.forbidden:
-            raise ForbiddenError(self.last_response.json()['results'][0]['detail'])
+        return response
 
-        return self.last_response
+    def _send(self, method, url, deadline=None, **kwargs):
+        # type: (str, str, Optional[float], **Any) -> requests.Response
+        """Send the request to the API, retrying it according to the retry policy of the client.
 
-    def scopes(self, name=None, pk=None, status='ACTIVE'):
-        # type: (Optional[str], Optional[str], Optional[str]) -> List[Scope]
+        :raises: DeadlineExceededError when the backoff before the next attempt would end after the `deadline`
+        """
+        attempts, backoff = 0, 0.0
+        headers = kwargs.pop('headers', self.headers)
+
+        try:
+            while True:
+                attempts += 1
+                if deadline is not None:
+                    kwargs['timeout'] = self._timeout_within(deadline)
+                try:
+                    response = self.session.request(method, url, auth=self.auth, headers=headers, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                    if self.retry is None or not self.retry.is_retryable(method, attempts):
+                        raise
+                    delay = self.retry.backoff_time(attempts)
+                else:
+                    if self.retry is None or not self.retry.is_retryable(method, attempts, response):
+                        return response
+                    delay = self.retry.backoff_time(attempts, response)
+
+                if deadline is not None and monotonic() + delay >= deadline:
+                    raise DeadlineExceededError("Could not retry the request before the deadline")
+                time.sleep(delay)
+                backoff += delay
+        finally:
+            self.last_attempts, self.last_backoff = attempts, backoff
+            if self.retry is not None:
+                self.retry.record(attempts, backoff)
+
+    def scopes(self, name=None, pk=None, status='ACTIVE', fields=None, limit=None, batch=None, max_workers=None,
+               deadline=None, progress=None):
+        # type: (...) -> List[Scope]
         """Return all scopes visible / accessible for the logged in user.
 
+        All pages of results are retrieved before the list is returned. Use :meth:`iter_scopes` to process the
+        scopes while they are being retrieved.
+
         :param name: if provided, filter the search for a scope/project by name
         :param pk: if provided, filter the search by scope_id
         :param status: if provided, filter the search for the status. eg. 'ACTIVE', 'TEMPLATE', 'LIBRARY'
+        :param fields: (optional) list of fields to retrieve, eg. ['name', 'bucket']. The id is always retrieved.
+                       Other attributes are retrieved on first access.
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :param deadline: (optional) maximum time in seconds to retrieve all batches, otherwise a
+                         `DeadlineExceededError` is raised
+        :param progress: (optional) function that is called after every retrieved batch with the number of
+                         retrieved scopes and the total number of scopes (or None when unknown)
         :return: :obj:`list` of :obj:`Scope`
-        :raises: NotFoundError
+        :raises: NotFoundError, DeadlineExceededError
 
         Example
         -------
@@ -202,27 +493,83 @@ class Client(object):
         >>> last_request = client.last_request  # doctest: Ellipsis
         ...
         """
-        r = self._request('GET', self._build_url('scopes'), params={
+        return list(self.iter_scopes(name=name, pk=pk, status=status, fields=fields, limit=limit, batch=batch,
+                                     max_workers=max_workers, deadline=deadline, progress=progress))
+
+    def iter_scopes(self, name=None, pk=None, status='ACTIVE', fields=None, limit=None, batch=None, max_workers=None,
+                    deadline=None, progress=None):
+        # type: (...) -> Iterator[Scope]
+        """Iterate over the scopes visible / accessible for the logged in user while they are retrieved.
+
+        Uses the same interface as the :meth:`scopes` method, but returns a generator that yields the scopes of a
+        page as soon as that page is retrieved.
+
+        :return: generator of :obj:`Scope`
+        :raises: NotFoundError, DeadlineExceededError
+        """
+        request_params = {
             'name': name,
             'id': pk,
-            'status': status
-        })
+            'status': status,
+            'fields': self._fields_param(fields)
+        }
+        return self._iter_objects(Scope, 'scopes', request_params, limit=limit, batch=batch, max_workers=max_workers,
+                                  deadline=deadline, progress=progress, partial=fields is not None)
+
+    def _retrieve_single(self, list_method, detail_resource, factory, defaults, args, kwargs):
+        # type: (Callable, str, Callable, Dict[str, Any], Tuple[Any, ...], Dict[str, Any]) -> List[Any]
+        """Retrieve the objects for a single object lookup, with a single small request.
+
+        A lookup on `pk` (optionally combined with the `defaults` filters of the list method, eg. the category of a
+        part) is retrieved from the detail endpoint of the api. Any other lookup retrieves at most two objects from
+        the list endpoint, which is enough to tell a single match from multiple matches.
+
+        :param list_method: the list method of the client, eg. `self.parts`
+        :param detail_resource: the api resource of a single object, eg. 'part'
+        :param factory: model class to create the object from the json of the detail endpoint with
+        :param defaults: the filters of the list method with their default value that can be checked on the json of
+                         the detail endpoint, eg. `{'category': Category.INSTANCE}`
+        :param args: the positional arguments of the lookup
+        :param kwargs: the keyword arguments of the lookup
+        :return: list of zero, one or two objects (or all matching objects without `fast_lookups`)
+        """
+        if not self.fast_lookups:
+            return list_method(*args, **kwargs)
+
+        filters = dict(defaults, **kwargs)
+        pk = filters.pop('pk', None)
+
+        if pk is None or args or not set(filters).issubset(defaults):
+            return list_method(*args, **dict(kwargs, limit=2))
 
+        r = self._request('GET', self._build_url(detail_resource, **{detail_resource + '_id': pk}))
+        if r.status_code == requests.codes.not_found:
+            return []
         if r.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve scopes")
+            raise NotFoundError("Could not retrieve {} with id {}".format(detail_resource, pk))
 
-        data = r.json()
+        results = self._decode(r)['results']
+        for key, value in filters.items():
+            results = [result for result in results if value is None or self._json_id(result.get(key)) == value]
+        return [self._load_object(factory, result) for result in results]
 
-        return [Scope(s, client=self) for s in data['results']]
+    @staticmethod
+    def _json_id(value):
+        # type: (Any) -> Any
+        """Return the id of a related object in the json (eg. `{'id': ..., 'name': ...}`) or the value itself."""
+        return value.get('id') if isinstance(value, dict) else value
 
     def scope(self, *args, **kwargs):
         # type: (*Any, **Any) -> Scope
         """Return a single scope based on the provided name.
 
+        A scope is retrieved with a single request: a lookup on `pk` uses the detail endpoint of the api and other
+        lookups retrieve at most two scopes.
+
         :return: a single :obj:`Scope`
         :raises: NotFoundError, MultipleFoundError
         """
-        _scopes = self.scopes(*args, **kwargs)
+        _scopes = self._retrieve_single(self.scopes, 'scope', Scope, {'status': 'ACTIVE'}, args, kwargs)
 
         if len(_scopes) == 0:
             raise NotFoundError("No scope fits criteria")
@@ -231,42 +578,82 @@ class Client(object):
 
         return _scopes[0]
 
-    def activities(self, name=None, pk=None, scope=None, **kwargs):
-        # type: (Optional[str], Optional[str], Optional[str], **Any) -> List[Activity]
+    def activities(self, name=None, pk=None, scope=None, fields=None, limit=None, batch=None, max_workers=None,
+                   deadline=None, progress=None, **kwargs):
+        # type: (...) -> List[Activity]
         """Search on activities with optional name filter.
 
+        All pages of results are retrieved before the list is returned. Use :meth:`iter_activities` to process the
+        activities while they are being retrieved.
+
         :param pk: id (primary key) of the activity to retrieve
         :param name: filter the activities by name
         :param scope: filter by scope id
+        :param fields: (optional) list of fields to retrieve, eg. ['name', 'status']. The id is always retrieved.
+                       Other attributes are retrieved on first access.
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :param deadline: (optional) maximum time in seconds to retrieve all batches, otherwise a
+                         `DeadlineExceededError` is raised
+        :param progress: (optional) function that is called after every retrieved batch with the number of
+                         retrieved activities and the total number of activities (or None when unknown)
+        :param kwargs: additional keyword, value arguments for the api which are passed to the /activities/ api as
+                       filters
         :return: :obj:`list` of :obj:`Activity`
-        :raises: NotFoundError
+        :raises: NotFoundError, DeadlineExceededError
+
+        Example
+        -------
+        Retrieve all activities of a large project in batches of 500, while reporting the progress
+
+        >>> def report(retrieved, total):
+        ...     print('{} of {} activities'.format(retrieved, total))
+        >>> activities = client.activities(scope=project.id, batch=500, progress=report)
+        500 of 1200 activities
+        1000 of 1200 activities
+        1200 of 1200 activities
+
+        """
+        return list(self.iter_activities(name=name, pk=pk, scope=scope, fields=fields, limit=limit, batch=batch,
+                                         max_workers=max_workers, deadline=deadline, progress=progress, **kwargs))
+
+    def iter_activities(self, name=None, pk=None, scope=None, fields=None, limit=None, batch=None, max_workers=None,
+                        deadline=None, progress=None, **kwargs):
+        # type: (...) -> Iterator[Activity]
+        """Iterate over activities while they are retrieved page by page.
+
+        Uses the same interface as the :meth:`activities` method, but returns a generator that yields the
+        activities of a page as soon as that page is retrieved.
+
+        :return: generator of :obj:`Activity`
+        :raises: NotFoundError, DeadlineExceededError
         """
         request_params = {
             'id': pk,
             'name': name,
-            'scope': scope
+            'scope': scope,
+            'fields': self._fields_param(fields)
         }
         if kwargs:
             request_params.update(**kwargs)
 
-        r = self._request('GET', self._build_url('activities'), params=request_params)
-
-        if r.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve activities. Server responded with {}".format(str(r)))
-
-        data = r.json()
-
-        return [Activity(a, client=self) for a in data['results']]
+        return self._iter_objects(Activity, 'activities', request_params, limit=limit, batch=batch,
+                                  max_workers=max_workers, deadline=deadline, progress=progress,
+                                  partial=fields is not None)
 
     def activity(self, *args, **kwargs):
         # type: (*Any, **Any) -> Activity
         """Search for a single activity.
 
+        An activity is retrieved with a single request: a lookup on `pk` uses the detail endpoint of the api and
+        other lookups retrieve at most two activities.
+
         :param name: Name of the activity to search
         :return: a single :obj:`Activity`
         :raises: NotFoundError, MultipleFoundError
         """
-        _activities = self.activities(*args, **kwargs)
+        _activities = self._retrieve_single(self.activities, 'activity', Activity, {'scope': None}, args, kwargs)
 
         if len(_activities) == 0:
             raise NotFoundError("No activity fits criteria")
@@ -275,6 +662,226 @@ class Client(object):
 
         return _activities[0]
 
+    def count_activities(self, name=None, pk=None, scope=None, **kwargs):
+        # type: (Optional[str], Optional[str], Optional[str], **Any) -> int
+        """Count the activities that fit the filters, without retrieving them.
+
+        Uses the same filters as the :meth:`activities` method. See :meth:`count_parts`.
+
+        :return: the number of activities
+        :raises: NotFoundError
+
+        Example
+        -------
+        >>> client.count_activities(scope=project.id, status='OPEN')
+        12
+
+        """
+        request_params = {
+            'id': pk,
+            'name': name,
+            'scope': scope
+        }
+        if kwargs:
+            request_params.update(**kwargs)
+
+        return self._count('activities', request_params)
+
+    def _count(self, resource, params):
+        # type: (str, Dict[str, Any]) -> int
+        """Return the number of results of a list endpoint of the API, without retrieving the results.
+
+        A single page with a single result is retrieved to read the total count of the paginated response. When the
+        endpoint does not provide the total count, the results of all pages are counted, retrieving only their id.
+
+        :param resource: the name of the api resource, eg. 'parts'
+        :param params: request parameters (filters) of the list endpoint
+        :return: the number of results
+        """
+        url = self._build_url(resource)
+        data = self._get_page(url, params=dict(params, limit=1), resource=resource)
+
+        if data.get('count') is not None:
+            return data['count']
+        if not data.get('next'):
+            return len(data['results'])
+
+        params = dict(params, limit=None, fields=self._fields_param(['id']))
+        return sum(1 for _ in self._iter_results(url, params=params, resource=resource))
+
+    def _timeout_within(self, deadline):
+        # type: (Optional[float]) -> Any
+        """Return the timeout of the client, shortened to end at the deadline (a `monotonic()` time) if provided.
+
+        :raises: DeadlineExceededError when the deadline has passed
+        """
+        if deadline is None:
+            return self.timeout
+
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError("The deadline to retrieve the results has passed")
+
+        if isinstance(self.timeout, tuple):
+            return tuple(min(t, remaining) if t is not None else remaining for t in self.timeout)
+        return min(self.timeout, remaining) if self.timeout is not None else remaining
+
+    def _get_page(self, url, params=None, resource='results', deadline=None):
+        # type: (str, Optional[Dict[str, Any]], str, Optional[float]) -> Dict[str, Any]
+        """Retrieve a single page of a list endpoint of the API as json, optionally before a deadline."""
+        try:
+            r = self._request('GET', url, params=params, deadline=deadline)
+        except requests.exceptions.Timeout:
+            if deadline is not None and deadline <= monotonic():
+                raise DeadlineExceededError("Could not retrieve {} before the deadline".format(resource))
+            raise
+
+        if r.status_code != requests.codes.ok:  # pragma: no cover
+            raise NotFoundError("Could not retrieve {}".format(resource))
+
+        return self._decode(r)
+
+    def _iter_pages(self, url, params=None, limit=None, resource='results', max_workers=None, deadline=None):
+        # type: (...) -> Iterator[Tuple[Optional[int], List[Dict[str, Any]]]]
+        """Iterate over the total count and the page of results of every page of a paginated list endpoint.
+
+        Sequentially the `next` link of a page is only followed when the iteration moves on to the next page.
+
+        When `max_workers` is provided, the total count of results is read from the first page and the remaining
+        pages are retrieved concurrently using their offset, with at most `max_workers` pages being retrieved (or
+        waiting to be consumed) at the same time. The pages are still provided in the order of the server. When the
+        endpoint does not provide a total count the pages are retrieved sequentially.
+        """
+        data = self._get_page(url, params=params, resource=resource, deadline=deadline)
+        count, next_url, results = data.get('count'), data.get('next'), data['results']
+        del data
+
+        yield count, results
+
+        if not next_url or (limit and len(results) >= limit):
+            return
+
+        if not max_workers or max_workers <= 1 or count is None or not results:
+            while next_url:
+                data = self._get_page(next_url, resource=resource, deadline=deadline)
+                count, next_url, results = data.get('count', count), data.get('next'), data['results']
+                del data
+                yield count, results
+            return
+
+        page_size = len(results)
+        total = min(count, limit) if limit else count
+        page_params = dict(params or {}, limit=page_size)
+        offsets = iter(range(page_size, total, page_size))
+
+        def retrieve_page(offset):
+            return pool.apply_async(self._get_page, (url, dict(page_params, offset=offset), resource, deadline))
+
+        pool = ThreadPool(max_workers)
+        pending = deque(retrieve_page(offset) for offset in islice(offsets, max_workers))
+        try:
+            while pending:
+                results = pending.popleft().get()['results']
+                pending.extend(retrieve_page(offset) for offset in islice(offsets, 1))
+                yield count, results
+        finally:
+            pool.terminate()
+
+    def _iter_results(self, url, params=None, limit=None, resource='results', max_workers=None, deadline=None,
+                      progress=None):
+        # type: (...) -> Iterator[Dict[str, Any]]
+        """Iterate over the json results of a paginated list endpoint of the API.
+
+        This is the paginator of all list methods of the client. The pages are retrieved lazily: the `next` link of
+        a page is only followed when all results of that page are consumed. The json of a page is released as soon
+        as the iteration moves on to the next page.
+
+        :param url: url of the list endpoint
+        :param params: request parameters (filters) for the first page, the `next` links contain these already
+        :param limit: stop after # results (default unlimited, so iterate over all results)
+        :param resource: name of the resource used in the error message
+        :param max_workers: (optional) retrieve the pages concurrently with this number of threads
+        :param deadline: (optional) the `monotonic()` time before which every page should be retrieved
+        :param progress: (optional) function called after every retrieved page with the number of retrieved results
+                         and the total number of results (or None when the endpoint does not provide a count)
+        :return: iterator over the json `dict` of every result
+        :raises: NotFoundError, DeadlineExceededError
+        """
+        count = 0
+        retrieved = 0
+
+        for total, results in self._iter_pages(url, params=params, limit=limit, resource=resource,
+                                               max_workers=max_workers, deadline=deadline):
+            if progress is not None:
+                retrieved += len(results)
+                if limit:
+                    retrieved = min(retrieved, limit)
+                    total = min(total, limit) if total is not None else None
+                progress(retrieved, total)
+
+            results.reverse()
+
+            while results:
+                # pop the results from the page to release the json when consumed
+                yield results.pop()
+                count += 1
+                # respect the limit if set to > 0
+                if limit and count >= limit:
+                    return
+
+    def _iter_objects(self, factory, resource, params, limit=None, batch=None, max_workers=None, deadline=None,
+                      progress=None, partial=False):
+        # type: (...) -> Iterator[Any]
+        """Iterate over the model objects of a paginated list endpoint of the API while they are retrieved.
+
+        :param factory: model class or function (eg. `Property.create`) to create the model objects with
+        :param resource: the name of the api resource, eg. 'activities'
+        :param params: request parameters (filters) of the list endpoint
+        :param limit: stop after # results (default unlimited, so iterate over all results)
+        :param batch: (optional) the number of results per page, defaults to the page size of KE-chain
+        :param max_workers: (optional) retrieve the pages concurrently with this number of threads
+        :param deadline: (optional) maximum time in seconds to retrieve all pages
+        :param progress: (optional) function called after every retrieved page, see :meth:`_iter_results`
+        :param partial: if the objects are retrieved with only some of their fields
+        :return: generator of model objects
+        """
+        # if limit is provided and the batchsize is bigger than the limit, ensure that the batch size is maximised
+        if limit and (batch is None or limit < batch):
+            batch = limit
+        request_params = dict(params, limit=batch)
+
+        deadline = monotonic() + deadline if deadline is not None else None
+
+        for result_json in self._iter_results(self._build_url(resource), params=request_params, limit=limit,
+                                              resource=resource, max_workers=max_workers, deadline=deadline,
+                                              progress=progress):
+            yield self._load_object(factory, result_json, partial=partial)
+
+    def _parts_params(self, name=None, pk=None, model=None, category=Category.INSTANCE, bucket=None, parent=None,
+                      activity=None, limit=None, batch=100, fields=None, property_fields=None, **kwargs):
+        # type: (...) -> Dict[str, Any]
+        """Build the request parameters for the `/parts` api."""
+        # if limit is provided and the batchsize is bigger than the limit, ensure that the batch size is maximised
+        if limit and limit < batch:
+            batch = limit
+
+        request_params = {
+            'id': pk,
+            'name': name,
+            'model': model.id if isinstance(model, Part) else model,
+            'category': category,
+            'bucket': bucket,
+            'parent': parent,
+            'activity_id': activity,
+            'limit': batch,
+            'fields': self._fields_param(fields, required=REQUIRED_PART_FIELDS, property_fields=property_fields)
+        }
+
+        if kwargs:
+            request_params.update(**kwargs)
+
+        return request_params
+
     def parts(self,
               name=None,  # type: Optional[str]
               pk=None,  # type: Optional[str]
@@ -285,23 +892,47 @@ class Client(object):
               activity=None,  # type: Optional[str]
               limit=None,  # type: Optional[int]
               batch=100,  # type: int
+              max_workers=None,  # type: Optional[int]
+              deadline=None,  # type: Optional[float]
+              prefetch=None,  # type: Optional[List[str]]
+              fields=None,  # type: Optional[List[str]]
+              property_fields=None,  # type: Optional[List[str]]
+              progress=None,  # type: Optional[Callable[[int, Optional[int]], Any]]
               **kwargs):
         # type: (...) -> PartSet
         """Retrieve multiple KE-chain parts.
 
+        All pages of results are retrieved before the :obj:`PartSet` is returned. Use :meth:`iter_parts` to
+        process the parts while they are being retrieved.
+
         :param name: filter on name
         :param pk: filter on primary key
-        :param model: filter on model_id
+        :param model: filter on the model (a :class:`Part` or the id of the model)
         :param category: filter on category (INSTANCE, MODEL, None)
         :param bucket: filter on bucket_id
         :param parent: filter on the parent_id, returns all childrent of the parent_id
         :param activity: filter on activity_id
         :param limit: limit the return to # items (default unlimited, so return all results)
         :param batch: limit the batch size to # items (defaults to 100 items per batch)
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads. The total
+                            number of parts is read from the first batch, after which the remaining batches are
+                            retrieved in parallel. The order of the parts is kept as provided by KE-chain.
+        :param deadline: (optional) maximum time in seconds to retrieve all batches, otherwise a
+                         `DeadlineExceededError` is raised
+        :param prefetch: (optional) list of relations to retrieve for all parts in a few batched requests after the
+                         parts are retrieved: 'model', 'parent', 'references' (the values of the reference
+                         properties) and/or 'children'. Navigating these relations then makes no requests.
+        :param fields: (optional) list of fields of the parts to retrieve, eg. ['name', 'parent'], to reduce the
+                       size of the responses. The id and category are always retrieved. Other attributes are
+                       retrieved for a single part on first access.
+        :param property_fields: (optional) list of fields of the properties of the parts to retrieve, eg. ['name',
+                                'value']. The id and property type are always retrieved.
+        :param progress: (optional) function that is called after every retrieved batch with the number of
+                         retrieved parts and the total number of parts (or None when unknown)
         :param kwargs: additional keyword, value arguments for the api with are passed to the /parts/ api as filters
                        please refer to the full KE-chain 2 REST API documentation.
         :return: :obj:`PartSet`
-        :raises: NotFoundError
+        :raises: NotFoundError, DeadlineExceededError, IllegalArgumentError
 
         Examples
         --------
@@ -322,55 +953,222 @@ class Client(object):
         >>> client.parts(limit=5)  # doctest:Ellipsis
         ...
 
+        Retrieve a large number of parts in batches of 500 parts, using 8 concurrent requests
+
+        >>> client.parts(model=bolt_model, batch=500, max_workers=8)  # doctest:Ellipsis
+        ...
+
+        Retrieve the wheels together with their models and parents, to navigate to these without further requests
+
+        >>> wheels = client.parts(name='Wheel', prefetch=['model', 'parent'])
+        >>> [wheel.model().name for wheel in wheels]
+        ['Wheel', 'Wheel']
+
+        Retrieve only the names and parents of the parts, and the names and values of their properties
+
+        >>> client.parts(fields=['name', 'parent', 'properties'], property_fields=['name', 'value'])
+        ...
+
         """
-        # if limit is provided and the batchsize is bigger than the limit, ensure that the batch size is maximised
-        if limit and limit < batch:
-            batch = limit
+        parts = list(self.iter_parts(name=name, pk=pk, model=model, category=category, bucket=bucket,
+                                     parent=parent, activity=activity, limit=limit, batch=batch,
+                                     max_workers=max_workers, deadline=deadline, fields=fields,
+                                     property_fields=property_fields, progress=progress, **kwargs))
+        if prefetch:
+            prefetch_related(self, parts, prefetch)
+        return PartSet(parts)
+
+    def iter_parts(self,
+                   name=None,  # type: Optional[str]
+                   pk=None,  # type: Optional[str]
+                   model=None,  # type: Optional[Part]
+                   category=Category.INSTANCE,  # type: Optional[str]
+                   bucket=None,  # type: Optional[str]
+                   parent=None,  # type: Optional[str]
+                   activity=None,  # type: Optional[str]
+                   limit=None,  # type: Optional[int]
+                   batch=100,  # type: int
+                   max_workers=None,  # type: Optional[int]
+                   deadline=None,  # type: Optional[float]
+                   fields=None,  # type: Optional[List[str]]
+                   property_fields=None,  # type: Optional[List[str]]
+                   progress=None,  # type: Optional[Callable[[int, Optional[int]], Any]]
+                   **kwargs):
+        # type: (...) -> Iterator[Part]
+        """Iterate over KE-chain parts while they are retrieved page by page.
+
+        Uses the same interface as the :meth:`parts` method, but instead of a :obj:`PartSet` it returns a generator
+        that yields the parts of a page as soon as that page is retrieved. The next page is only requested once
+        all parts of the current page are consumed, so the memory footprint is limited to a single page of results
+        (plus the parts that you keep a reference to).
+
+        The `deadline` starts at the first iteration and includes the time spent processing the parts.
+
+        :return: generator of :obj:`Part`
+        :raises: NotFoundError, DeadlineExceededError
 
-        request_params = {
-            'id': pk,
-            'name': name,
-            'model': model.id if model else None,
-            'category': category,
-            'bucket': bucket,
-            'parent': parent,
-            'activity_id': activity,
-            'limit': batch
-        }
+        Example
+        -------
+        >>> for part in client.iter_parts(model=wheel_model, batch=500):
+        ...     print(part.name)
 
-        if kwargs:
-            request_params.update(**kwargs)
+        Stop after the first 1000 parts
 
-        r = self._request('GET', self._build_url('parts'), params=request_params)
+        >>> first_parts = list(client.iter_parts(limit=1000))
 
-        if r.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve parts")
+        Prefetch up to 4 batches concurrently while iterating
+
+        >>> for part in client.iter_parts(model=wheel_model, max_workers=4):
+        ...     print(part.name)
 
-        data = r.json()
+        """
+        request_params = self._parts_params(name=name, pk=pk, model=model, category=category, bucket=bucket,
+                                            parent=parent, activity=activity, limit=limit, batch=batch,
+                                            fields=fields, property_fields=property_fields, **kwargs)
+        return self._iter_objects(Part, 'parts', request_params, limit=limit, batch=batch, max_workers=max_workers,
+                                  deadline=deadline, progress=progress, partial=request_params['fields'] is not None)
+
+    def count_parts(self,
+                    name=None,  # type: Optional[str]
+                    pk=None,  # type: Optional[str]
+                    model=None,  # type: Optional[Part]
+                    category=Category.INSTANCE,  # type: Optional[str]
+                    bucket=None,  # type: Optional[str]
+                    parent=None,  # type: Optional[str]
+                    activity=None,  # type: Optional[str]
+                    **kwargs):
+        # type: (...) -> int
+        """Count the KE-chain parts that fit the filters, without retrieving them.
+
+        Uses the same filters as the :meth:`parts` method. Only a single part is requested, to read the total count
+        of the paginated response. When the api does not provide the total count, the ids of all parts are
+        retrieved and counted instead.
+
+        :return: the number of parts
+        :raises: NotFoundError
+
+        Example
+        -------
+        Count the instances of the wheel model
 
-        part_results = data['results']
+        >>> client.count_parts(model=wheel_model)
+        2
 
-        if batch and data.get('next'):
-            while data['next']:
-                # respect the limit if set to > 0
-                if limit and len(part_results) >= limit:
-                    break
-                r = self._request('GET', data['next'])
-                data = r.json()
-                part_results.extend(data['results'])
+        """
+        request_params = self._parts_params(name=name, pk=pk, model=model, category=category, bucket=bucket,
+                                            parent=parent, activity=activity, **kwargs)
+        return self._count('parts', request_params)
+
+    def parts_query(self, **kwargs):
+        # type: (**Any) -> PartQuery
+        """Build a lazy query of KE-chain parts.
+
+        The conditions of the query that the api supports are sent as filters of the request, the other conditions
+        are evaluated on the parts while they are streamed. See :class:`pykechain.query.PartQuery`.
+
+        :param kwargs: (optional) conditions of the query, eg. `name='Wheel'` or `properties__Diameter__gt=60`
+        :return: :class:`pykechain.query.PartQuery`
+        :raises: IllegalArgumentError when a condition is not supported
+
+        Example
+        -------
+        >>> query = client.parts_query(model=wheel_model).filter(properties__Diameter__gt=60).only('name')
+        >>> print(query.explain())
+        api:    category = 'INSTANCE', model = 'edc8eba0-47c5-415d-8727-6d927543ee3b'
+        client: properties__Diameter__gt = 60
+        fields: name, properties
+        >>> wheels = query.all()
+
+        """
+        return PartQuery(self, **kwargs)
+
+    def _iter_parts_in(self, field, values, max_url_length=None, **kwargs):
+        # type: (str, Iterable[str], Optional[int], **Any) -> Iterator[Part]
+        """Iterate over the parts of which the field is one of the values, using `<field>__in` filters.
+
+        The values are split over as few requests as possible, while keeping the url of every request below the
+        maximum url length.
 
-        return PartSet((Part(p, client=self) for p in part_results))
+        :param field: the field to filter on, eg. 'id' or 'parent'
+        :param values: the ids to filter on
+        :param max_url_length: (optional) maximum length of the url of a request, defaults to `MAX_URL_LENGTH`
+        :param kwargs: additional arguments for :meth:`iter_parts`
+        :return: generator of :obj:`Part`
+        """
+        request_params = self._parts_params(**kwargs)
+        available_length = (max_url_length or MAX_URL_LENGTH) - len(self._build_url('parts')) - len(
+            urlencode([(k, v) for k, v in request_params.items() if v is not None])) - len('?&offset=&{}__in='.format(
+                field)) - 10
+
+        chunk, chunk_length = [], 0
+        for value in values:
+            value_length = len(quote(str(value), safe=''))
+            if chunk and chunk_length + value_length + len('%2C') > available_length:
+                for part in self.iter_parts(**dict(kwargs, **{field + '__in': ','.join(chunk)})):
+                    yield part
+                chunk, chunk_length = [], 0
+            chunk.append(str(value))
+            chunk_length += value_length + len('%2C')
+
+        if chunk:
+            for part in self.iter_parts(**dict(kwargs, **{field + '__in': ','.join(chunk)})):
+                yield part
+
+    def part_tree(self, root, depth=None, max_workers=None):
+        # type: (Part, Optional[int], Optional[int]) -> PartSet
+        """Retrieve the tree of parts below the root part, a complete level of the tree per request.
+
+        The tree is retrieved breadth first: the children of all parts of a level are retrieved together with
+        batched `parent__in` requests, so the number of requests grows with the depth of the tree rather than with
+        the number of parts. The parent and children of every part in the tree are attached to the part, so
+        `Part.parent()` and `Part.children()` navigate the tree without further requests.
+
+        :param root: the root :class:`pykechain.models.Part` of the tree
+        :param depth: (optional) the number of levels below the root to retrieve, defaults to the complete tree
+        :param max_workers: (optional) retrieve the batches of a large level concurrently using this number of
+                            threads, see :meth:`parts`
+        :return: :obj:`PartSet` with the root and all parts below it, level by level
+        :raises: NotFoundError
+
+        Example
+        -------
+        >>> bike = client.part('Bike')
+        >>> bike_tree = client.part_tree(bike)
+        >>> len(bike_tree)
+        5000
+        >>> front_wheel = bike.children()[0]  # no requests are made
+        >>> front_wheel.parent() is bike
+        True
+
+        Retrieve the root with its children and grandchildren only
+
+        >>> client.part_tree(bike, depth=2)  # doctest:Ellipsis
+        ...
+
+        """
+        tree = [root]
+        level = [root]
+        level_depth = 0
+
+        while level and (depth is None or level_depth < depth):
+            level = prefetch_children(self, level, max_workers=max_workers)
+            tree.extend(level)
+            level_depth += 1
+
+        return PartSet(tree)
 
     def part(self, *args, **kwargs):
         # type: (*Any, **Any) -> Part
         """Retrieve single KE-chain part.
 
-        Uses the same interface as the `part` method but returns only a single pykechain `Part` instance.
+        Uses the same interface as the `part` method but returns only a single pykechain `Part` instance. The part
+        is retrieved with a single request: a lookup on `pk` uses the detail endpoint of the api and other lookups
+        retrieve at most two parts.
 
         :return: a single :obj:`Part`
         :raises: NotFoundError, MultipleFoundError
         """
-        _parts = self.parts(*args, **kwargs)
+        _parts = self._retrieve_single(self.parts, 'part', Part, {'category': Category.INSTANCE}, args, kwargs)
 
         if len(_parts) == 0:
             raise NotFoundError("No part fits criteria")
@@ -383,13 +1181,14 @@ class Client(object):
         # type: (*Any, **Any) -> Part
         """Retrieve single KE-chain part model.
 
-        Uses the same interface as the `part` method but returns only a single pykechain `Part` instance.
+        Uses the same interface as the `part` method but returns only a single pykechain `Part` instance. The model
+        is retrieved with a single request, see :meth:`part`.
 
         :return: a single :obj:`Part`
         :raises: NotFoundError, MultipleFoundError
         """
         kwargs['category'] = Category.MODEL
-        _parts = self.parts(*args, **kwargs)
+        _parts = self._retrieve_single(self.parts, 'part', Part, {'category': Category.MODEL}, args, kwargs)
 
         if len(_parts) == 0:
             raise NotFoundError("No model fits criteria")
@@ -398,28 +1197,52 @@ class Client(object):
 
         return _parts[0]
 
-    def properties(self, name=None, pk=None, category=Category.INSTANCE):
-        # type: (Optional[str], Optional[str], Optional[str]) -> List[Property]
+    def properties(self, name=None, pk=None, category=Category.INSTANCE, fields=None, limit=None, batch=None,
+                   max_workers=None, deadline=None, progress=None):
+        # type: (...) -> List[Property]
         """Retrieve properties.
 
+        All pages of results are retrieved before the list is returned. Use :meth:`iter_properties` to process the
+        properties while they are being retrieved.
+
         :param name: name to limit the search for.
         :param pk: primary key or id (UUID) of the property to search for
         :param category: filter the properties by category. Defaults to INSTANCE. Other options MODEL or None
+        :param fields: (optional) list of fields to retrieve, eg. ['name', 'value']. The id and property type are
+                       always retrieved. Other attributes are retrieved on first access.
+        :param limit: (optional) limit the return to # items (default unlimited, so return all results)
+        :param batch: (optional) limit the batch size to # items (defaults to the page size of KE-chain)
+        :param max_workers: (optional) retrieve the batches concurrently using this number of threads
+        :param deadline: (optional) maximum time in seconds to retrieve all batches, otherwise a
+                         `DeadlineExceededError` is raised
+        :param progress: (optional) function that is called after every retrieved batch with the number of
+                         retrieved properties and the total number of properties (or None when unknown)
         :return: :obj:`list` of :obj:`Property`
-        :raises: NotFoundError
+        :raises: NotFoundError, DeadlineExceededError
         """
-        r = self._request('GET', self._build_url('properties'), params={
-            'name': name,
-            'id': pk,
-            'category': category
-        })
+        return list(self.iter_properties(name=name, pk=pk, category=category, fields=fields, limit=limit,
+                                         batch=batch, max_workers=max_workers, deadline=deadline, progress=progress))
 
-        if r.status_code != requests.codes.ok:  # pragma: no cover
-            raise NotFoundError("Could not retrieve properties")
+    def iter_properties(self, name=None, pk=None, category=Category.INSTANCE, fields=None, limit=None, batch=None,
+                        max_workers=None, deadline=None, progress=None):
+        # type: (...) -> Iterator[Property]
+        """Iterate over properties while they are retrieved page by page.
 
-        data = r.json()
+        Uses the same interface as the :meth:`properties` method, but returns a generator that yields the
+        properties of a page as soon as that page is retrieved.
 
-        return [Property.create(p, client=self) for p in data['results']]
+        :return: generator of :obj:`Property`
+        :raises: NotFoundError, DeadlineExceededError
+        """
+        request_params = {
+            'name': name,
+            'id': pk,
+            'category': category,
+            'fields': self._fields_param(fields, required=REQUIRED_PROPERTY_FIELDS)
+        }
+        return self._iter_objects(Property.create, 'properties', request_params, limit=limit, batch=batch,
+                                  max_workers=max_workers, deadline=deadline, progress=progress,
+                                  partial=fields is not None)
 
     def create_activity(self, process, name, activity_class="UserTask"):
         """Create a new activity.
@@ -440,9 +1263,9 @@ class Client(object):
         if r.status_code != requests.codes.created:  # pragma: no cover
             raise APIError("Could not create activity")
 
-        data = r.json()
+        data = self._decode(r)
 
-        return Activity(data['results'][0], client=self)
+        return self._load_object(Activity, data['results'][0])
 
     def _create_part(self, action, data):
         r = self._request('POST', self._build_url('parts'),
@@ -452,7 +1275,7 @@ class Client(object):
         if r.status_code != requests.codes.created:  # pragma: no cover
             raise APIError("Could not create part, {}: {}".format(str(r), r.content))
 
-        return Part(r.json()['results'][0], client=self)
+        return self._load_object(Part, self._decode(r)['results'][0])
 
     def create_part(self, parent, model, name=None):
         """Create a new part instance from a given model under a given parent.
@@ -550,7 +1373,7 @@ class Client(object):
         if r.status_code != requests.codes.created:
             raise APIError("Could not create property")
 
-        prop = Property.create(r.json()['results'][0], client=self)
+        prop = self._load_object(Property.create, self._decode(r)['results'][0])
 
         model.properties.append(prop)
 
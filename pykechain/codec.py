@@ -0,0 +1,100 @@
+import json
+from typing import Any, Optional, Union  # flake8: noqa
+
+import six
+
+
+class JSONCodec(object):
+    """The codec of a :class:`pykechain.Client` to decode the json of the responses and encode the json of requests.
+
+    This codec uses the `json` module of the standard library. The faster :class:`OrjsonCodec` and
+    :class:`UjsonCodec` are used by default when `orjson` or `ujson` is installed, see :func:`default_codec`.
+    Another codec can be used by the client, as long as it provides the `loads` and `dumps` methods.
+
+    Example
+    -------
+    >>> client = Client(url='https://default.localhost:9443', codec=JSONCodec())
+    >>> client.codec.name
+    'json'
+
+    """
+
+    name = 'json'
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke {} '{}'>".format(self.__class__.__name__, self.name)
+
+    def loads(self, data):
+        # type: (Union[bytes, str]) -> Any
+        """Decode json from a (utf-8 encoded) byte string or text string.
+
+        :raises: ValueError when the data is not valid json
+        """
+        if isinstance(data, six.binary_type) and not six.PY2:
+            data = data.decode('utf-8')
+        return json.loads(data)
+
+    def dumps(self, obj, indent=None):
+        # type: (Any, Optional[int]) -> str
+        """Encode an object as a json text string.
+
+        :param obj: the object to encode
+        :param indent: (optional) number of spaces to indent the json with, otherwise the json is compact
+        """
+        return json.dumps(obj, indent=indent)
+
+
+class OrjsonCodec(JSONCodec):
+    """A json codec using `orjson` (python 3.6+)."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        """Create the codec, which raises an ImportError when orjson is not installed."""
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data):
+        # type: (Union[bytes, str]) -> Any
+        """Decode json from a (utf-8 encoded) byte string or text string."""
+        return self._orjson.loads(data)
+
+    def dumps(self, obj, indent=None):
+        # type: (Any, Optional[int]) -> str
+        """Encode an object as a json text string, indentation is only supported with 2 spaces."""
+        if indent not in (None, 2):
+            return super(OrjsonCodec, self).dumps(obj, indent=indent)
+        option = self._orjson.OPT_NON_STR_KEYS | (self._orjson.OPT_INDENT_2 if indent else 0)
+        return self._orjson.dumps(obj, option=option).decode('utf-8')
+
+
+class UjsonCodec(JSONCodec):
+    """A json codec using `ujson`."""
+
+    name = 'ujson'
+
+    def __init__(self):
+        """Create the codec, which raises an ImportError when ujson is not installed."""
+        import ujson
+        self._ujson = ujson
+
+    def loads(self, data):
+        # type: (Union[bytes, str]) -> Any
+        """Decode json from a (utf-8 encoded) byte string or text string."""
+        return self._ujson.loads(data)
+
+    def dumps(self, obj, indent=None):
+        # type: (Any, Optional[int]) -> str
+        """Encode an object as a json text string."""
+        return self._ujson.dumps(obj, indent=indent or 0, escape_forward_slashes=False)
+
+
+def default_codec():
+    # type: () -> JSONCodec
+    """Return the fastest json codec that is installed: `orjson`, `ujson` or the standard library `json`."""
+    for codec_class in (OrjsonCodec, UjsonCodec):
+        try:
+            return codec_class()
+        except ImportError:
+            pass
+    return JSONCodec()
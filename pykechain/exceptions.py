@@ -31,6 +31,12 @@ class ClientError(APIError):
     pass
 
 
+class DeadlineExceededError(APIError):
+    """The deadline to complete a (paginated) retrieval has passed."""
+
+    pass
+
+
 class IllegalArgumentError(ValueError):
     """Error when provided illegal arguments to a function or method."""
 
@@ -0,0 +1,80 @@
+import threading
+import weakref
+from typing import Any, Callable, Dict, Optional  # flake8: noqa
+
+
+class IdentityMap(object):
+    """An identity map of KE-chain ids to the live pykechain model objects of a single client.
+
+    Each id maps to at most one model object. The map only keeps weak references to the objects, so an object is
+    dropped from the map as soon as it is no longer referenced by your code. The map is safe to use by multiple threads.
+
+    Example
+    -------
+    >>> client = Client(url='https://default.localhost:9443', identity_map=True)
+    >>> bike = client.part('Bike')
+    >>> bike is client.part('Bike')
+    True
+    >>> frame = client.part('Frame')
+    >>> frame.parent() is bike  # answered from the identity map, no request is made
+    True
+
+    """
+
+    def __init__(self):
+        # type: () -> None
+        """Create an empty identity map."""
+        self._objects = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary
+        self._lock = threading.RLock()
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke {} object {} objects>".format(self.__class__.__name__, len(self))
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __contains__(self, pk):
+        return pk in self._objects
+
+    def get(self, pk):
+        # type: (Optional[str]) -> Optional[Any]
+        """Return the live model object with the id or None if it is not in the map."""
+        if pk is None:
+            return None
+        return self._objects.get(pk)
+
+    def load(self, factory, json, **kwargs):
+        # type: (Callable[..., Any], Dict, **Any) -> Any
+        """Return the live model object for the json, refreshed in place, or create a new one.
+
+        When an object of the same class with the id of the json is in the map, it is re-initialised with the json,
+        so every reference to that object sees the retrieved data. The json of a partial retrieval (eg. with
+        `Client.parts(fields=...)`) is merged into the json of the object, so the fields that were not retrieved are
+        kept. Otherwise a new object is created with the factory and added to the map.
+
+        :param factory: model class or function (eg. `Property.create`) to create the model object with
+        :param json: the json of the model object as retrieved from KE-chain
+        :param kwargs: additional keyword arguments for the factory, eg. the `client`
+        :return: the model object
+        """
+        with self._lock:
+            obj = self.get(json.get('id'))
+
+            if obj is not None and (not isinstance(factory, type) or type(obj) is factory):
+                # refresh the live object in place, so every reference to it sees the retrieved data
+                if kwargs.get('partial'):
+                    json = obj._merged_json(json)
+                    kwargs = dict(kwargs, partial=obj._partial)
+                obj.__init__(json, **kwargs)
+                return obj
+
+            obj = factory(json, **kwargs)
+            if obj.id is not None:
+                self._objects[obj.id] = obj
+            return obj
+
+    def discard(self, pk):
+        # type: (str) -> None
+        """Remove the model object with the id from the map, eg. when it is deleted in KE-chain."""
+        with self._lock:
+            self._objects.pop(pk, None)
@@ -0,0 +1,323 @@
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple  # flake8: noqa
+
+from pykechain.exceptions import NotFoundError, IllegalArgumentError
+
+
+class PendingPart(object):
+    """The pending result of a :meth:`PartLoader.load`, available after the loader dispatched its lookups."""
+
+    def __init__(self, loader, pk):
+        # type: (PartLoader, str) -> None
+        """Construct a pending part for the loader."""
+        self._loader = loader
+        self.pk = pk
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke {} id {}>".format(self.__class__.__name__, self.pk[-8:])
+
+    def result(self):
+        # type: () -> Any
+        """Return the loaded part, dispatching the pending lookups of the loader when needed.
+
+        :return: :class:`pykechain.models.Part`
+        :raises: NotFoundError when no part with this id exists
+        """
+        return self._loader._result(self.pk)
+
+
+class PartLoader(object):
+    """Batch many lookups of parts by id into a few `id__in` list requests.
+
+    Every call to :meth:`load` registers the id and returns a :class:`PendingPart`. The pending ids are retrieved
+    together when the loader is dispatched: explicitly with :meth:`dispatch`, at the end of a `with` block or when
+    the result of a pending part is requested. The ids are sent in chunks that keep the url below
+    `max_url_length` characters. The parts that are already live in the identity map of the client are not
+    requested again.
+
+    Example
+    -------
+    Retrieve the models of all wheels in a few requests instead of a request per wheel
+
+    >>> wheels = project.parts('Wheel')
+    >>> with PartLoader(client) as loader:
+    ...     pending_models = [loader.load_model(wheel) for wheel in wheels]
+    >>> wheel_models = [pending.result() for pending in pending_models]
+
+    >>> loader = PartLoader(client)
+    >>> bike, frame = loader.load_many([bike_id, frame_id])
+
+    """
+
+    def __init__(self, client, max_url_length=None, **kwargs):
+        # type: (Any, Optional[int], **Any) -> None
+        """Create a loader for parts.
+
+        :param client: the :class:`pykechain.Client` to retrieve the parts with
+        :param max_url_length: (optional) maximum length of the url of a request, defaults to
+                               `pykechain.client.MAX_URL_LENGTH`
+        :param kwargs: additional filters for the /parts/ api, eg. `category`. Parts of any category are loaded
+                       by default.
+        """
+        self._client = client
+        self.max_url_length = max_url_length
+        self.filters = dict(dict(category=None), **kwargs)
+        self._pending = []  # type: List[str]
+        self._loaded = {}  # type: Dict[str, Any]
+        self._missing = set()  # type: Set[str]
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke {} object {} pending, {} loaded>".format(self.__class__.__name__, len(self._pending),
+                                                               len(self._loaded))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.dispatch()
+
+    def load(self, pk):
+        # type: (str) -> PendingPart
+        """Register the lookup of a part by id.
+
+        :param pk: id of the part
+        :return: :class:`PendingPart` of which the result is available after the loader is dispatched
+        """
+        if pk not in self._loaded and pk not in self._missing:
+            live_part = self._client._live_object(pk)
+            if live_part is not None:
+                self._loaded[pk] = live_part
+            else:
+                self._pending.append(pk)
+        return PendingPart(self, pk)
+
+    def load_related(self, obj, relation):
+        # type: (Any, str) -> Optional[PendingPart]
+        """Register the lookup of the part related to a part or property.
+
+        The id of the related part is read from the retrieved json of the object, without a request.
+
+        :param obj: the :class:`pykechain.models.Part` or :class:`pykechain.models.Property`
+        :param relation: the relation, one of `RELATIONS`: 'parent', 'model' or 'proxy_model' of a part, 'part'
+                         of a property or 'value' of a reference property
+        :return: :class:`PendingPart`, or None when the object has no related part
+        :raises: IllegalArgumentError when the relation is unknown
+        """
+        if relation not in RELATIONS:
+            raise IllegalArgumentError("Cannot load the {} of a part, choose from {}".format(
+                relation, ', '.join(RELATIONS)))
+        pk = _related_id(obj, relation)
+        return self.load(pk) if pk else None
+
+    def load_parent(self, part):
+        # type: (Any) -> Optional[PendingPart]
+        """Register the lookup of the parent of a part, see :meth:`load_related`."""
+        return self.load_related(part, 'parent')
+
+    def load_model(self, part):
+        # type: (Any) -> Optional[PendingPart]
+        """Register the lookup of the model of a part instance, see :meth:`load_related`."""
+        return self.load_related(part, 'model')
+
+    def load_part(self, prop):
+        # type: (Any) -> Optional[PendingPart]
+        """Register the lookup of the part that holds a property, see :meth:`load_related`."""
+        return self.load_related(prop, 'part')
+
+    def load_many(self, pks):
+        # type: (Iterable[str]) -> List[Any]
+        """Load the parts with the ids immediately, together with any other pending lookups.
+
+        :param pks: ids of the parts
+        :return: list of :class:`pykechain.models.Part` in the order of the ids
+        :raises: NotFoundError when a part with one of the ids does not exist
+        """
+        pending_parts = [self.load(pk) for pk in pks]
+        self.dispatch()
+        return [pending.result() for pending in pending_parts]
+
+    def dispatch(self):
+        # type: () -> None
+        """Retrieve all pending lookups, in as few requests as the url length allows."""
+        pks = [pk for pk in set(self._pending) if pk not in self._loaded]
+        self._pending = []
+
+        if pks:
+            for part in self._client._iter_parts_in('id', pks, max_url_length=self.max_url_length, **self.filters):
+                self._loaded[part.id] = part
+            self._missing.update(pk for pk in pks if pk not in self._loaded)
+
+    def _result(self, pk):
+        if pk not in self._loaded and pk in self._pending:
+            self.dispatch()
+        try:
+            return self._loaded[pk]
+        except KeyError:
+            raise NotFoundError("No part fits criteria")
+
+
+# the relations of parts and properties to other parts, see `PartLoader.load_related`
+RELATIONS = ('parent', 'model', 'proxy_model', 'part', 'value')
+
+
+def _related_id(obj, relation):
+    # type: (Any, str) -> Optional[str]
+    """Return the id of the part related to a part or property as found in its json, or None."""
+    from pykechain.models import Part, Property
+    from pykechain.models.property_reference import ReferenceProperty
+
+    if isinstance(obj, Part) and relation in ('parent', 'model', 'proxy_model'):
+        related = obj._json_data.get('proxy' if relation == 'proxy_model' else relation)
+    elif isinstance(obj, Property) and relation == 'part':
+        related = obj._json_data.get('part')
+    elif isinstance(obj, ReferenceProperty) and relation == 'value':
+        related = obj._value if not obj._partial or 'value' in obj._json_data else None
+    else:
+        return None
+    return related.get('id') if isinstance(related, dict) else related
+
+
+class BatchLoader(PartLoader):
+    """The scope of :meth:`pykechain.Client.batch`, which batches the navigation of parts and properties.
+
+    Within the scope the parts and properties retrieved by the client (and the `objects` provided) are tracked.
+    When a navigation method of one of these, eg. `Part.model()`, `Part.parent()`, `Part.proxy_model()`,
+    `Property.part` or the `value` of a reference property, needs a part that is not loaded yet, the related parts
+    of all tracked objects for that relation are loaded together in a few `id__in` requests. The navigation of the
+    other tracked objects is then answered without a request. Scopes are kept per thread.
+    """
+
+    def __init__(self, client, objects=None, max_url_length=None):
+        # type: (Any, Optional[Iterable[Any]], Optional[int]) -> None
+        """Create the batch scope of a client.
+
+        :param client: the :class:`pykechain.Client`
+        :param objects: (optional) parts and properties retrieved before the scope to batch the navigation of
+        :param max_url_length: (optional) maximum length of the url of a request
+        """
+        super(BatchLoader, self).__init__(client, max_url_length=max_url_length)
+        self._tracked = list(objects or [])  # type: List[Any]
+        self._outer_scope = None  # type: Optional[BatchLoader]
+
+    def __enter__(self):
+        self._outer_scope = self._client._batch_loader
+        self._client._batch_loader = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._client._batch_loader = self._outer_scope
+        super(BatchLoader, self).__exit__(exc_type, exc_val, exc_tb)
+
+    def track(self, obj):
+        # type: (Any) -> None
+        """Track a part or property, to load its related parts together with those of the other tracked objects."""
+        self._tracked.append(obj)
+
+    def related(self, obj, relation, pk):
+        # type: (Any, str, str) -> Any
+        """Return the related part of an object, loading the related parts of all tracked objects on a miss.
+
+        :raises: NotFoundError when the related part does not exist
+        """
+        if pk not in self._loaded and pk not in self._missing:
+            for tracked in self._tracked:
+                self.load_related(tracked, relation)
+            self.load(pk)
+            self.dispatch()
+        return self._result(pk)
+
+
+PREFETCH_RELATIONS = ('model', 'parent', 'references', 'children')
+
+
+def prefetch_related(client, parts, relations):
+    # type: (Any, List[Any], Iterable[str]) -> None
+    """Retrieve the related objects of all parts in a few batched requests and attach them to the parts.
+
+    After prefetching, `Part.model()`, `Part.parent()`, `Part.children()` and the `value` of reference properties
+    are answered from the attached objects without a request.
+
+    :param client: the :class:`pykechain.Client` to retrieve the related parts with
+    :param parts: the parts to prefetch the related objects of
+    :param relations: the relations to prefetch: 'model', 'parent', 'references' and/or 'children'
+    :raises: IllegalArgumentError when an unknown relation is provided
+    """
+    from pykechain.models.property_reference import ReferenceProperty
+
+    relations = set(relations)
+    unknown_relations = relations.difference(PREFETCH_RELATIONS)
+    if unknown_relations:
+        raise IllegalArgumentError("Cannot prefetch {}, choose from {}".format(
+            ', '.join(sorted(unknown_relations)), ', '.join(PREFETCH_RELATIONS)))
+
+    pending_objects = []  # type: List[Tuple[Any, str, PendingPart]]
+    loader = PartLoader(client)
+
+    for part in parts:
+        if 'model' in relations and part._json_data.get('model'):
+            pending_objects.append((part, 'model', loader.load(part._json_data['model']['id'])))
+        if 'parent' in relations and part.parent_id:
+            pending_objects.append((part, 'parent', loader.load(part.parent_id)))
+        if 'references' in relations:
+            for prop in part.properties:
+                if isinstance(prop, ReferenceProperty) and prop._value:
+                    pending_objects.append((prop, 'value', loader.load(prop._value['id'])))
+
+    loader.dispatch()
+    for obj, relation, pending_part in pending_objects:
+        try:
+            obj._prefetched_objects[relation] = pending_part.result()
+        except NotFoundError:
+            # leave the relation to be retrieved on navigation, which raises the appropriate error
+            pass
+
+    if 'children' in relations:
+        prefetch_children(client, parts)
+
+
+def prefetch_children(client, parts, **kwargs):
+    # type: (Any, List[Any], **Any) -> List[Any]
+    """Retrieve the children of all parts with batched `parent__in` requests and attach them to the parts.
+
+    The children of a part are attached to the part and the part is attached to its children as their parent, so
+    both `Part.children()` and `Part.parent()` make no requests afterwards.
+
+    The children that are in the parts themselves are not retrieved again: when the parts contain children of
+    other parts, only the ids of the children are listed and the other children are retrieved by id.
+
+    :param client: the :class:`pykechain.Client` to retrieve the children with
+    :param parts: the parts to retrieve the children of
+    :param kwargs: additional arguments for :meth:`pykechain.Client.iter_parts`, eg. `max_workers`
+    :return: list with the children of all parts
+    """
+    known_parts = dict((part.id, part) for part in parts)
+    sparse = any(part.parent_id in known_parts for part in parts)
+
+    parts_by_category = {}  # type: Dict[str, List[Any]]
+    for part in parts:
+        part._prefetched_objects['children'] = []
+        parts_by_category.setdefault(part.category, []).append(part)
+
+    all_children = []
+    for category, parents in parts_by_category.items():
+        parents_by_id = dict((parent.id, parent) for parent in parents)
+        if sparse:
+            listed_children = [(child.id, child.parent_id) for child in client._iter_parts_in(
+                'parent', parents_by_id, category=category, **dict(kwargs, fields=['parent']))]
+            missing_ids = [pk for pk, _ in listed_children if pk not in known_parts]
+            retrieved_children = dict((child.id, child) for child in client._iter_parts_in(
+                'id', missing_ids, category=category, **kwargs))
+            children = [known_parts[pk] if pk in known_parts else retrieved_children.get(pk)
+                        for pk, _ in listed_children]
+        else:
+            children = list(client._iter_parts_in('parent', parents_by_id, category=category, **kwargs))
+
+        for child in children:
+            if child is None:
+                # removed from KE-chain since the children were listed
+                continue
+            parent = parents_by_id[child.parent_id]
+            parent._prefetched_objects['children'].append(child)
+            child._prefetched_objects['parent'] = parent
+            all_children.append(child)
+    return all_children
@@ -9,6 +9,7 @@ from .property_attachment import AttachmentProperty
 from .property_selectlist import SelectListProperty
 from .property_reference import ReferenceProperty
 from .partset import PartSet
+from .partgraph import PartGraph
 
 __all__ = (
     'Base',
@@ -16,6 +17,7 @@ __all__ = (
     'Activity',
     'Part',
     'PartSet',
+    'PartGraph',
     'Property',
     'AttachmentProperty',
     'SelectListProperty',
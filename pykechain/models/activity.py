@@ -1,5 +1,4 @@
 import datetime
-import json
 from typing import Any  # flake8: noqa
 
 import requests
@@ -15,6 +14,10 @@ from pykechain.models.inspector_base import Customization, InspectorComponent
 class Activity(Base):
     """A virtual object representing a KE-chain activity."""
 
+    json_attributes = Base.json_attributes + (('scope', 'scope'), ('activity_type', 'activity_class'),
+                                              ('status', 'status'))
+    detail_resource = 'activity'
+
     def __init__(self, json, **kwargs):
         # type: (dict, **Any) -> None
         """Construct an Activity from a json object."""
@@ -24,6 +27,8 @@ class Activity(Base):
         self.activity_type = json.get('activity_class', None)
         self.status = json.get('status', None)
 
+        self._unset_missing_attributes()
+
     def parts(self, *args, **kwargs):
         """Retrieve parts belonging to this activity.
 
@@ -88,6 +93,8 @@ class Activity(Base):
         if r.status_code != requests.codes.no_content:
             raise APIError("Could not delete activity: {} with id {}".format(self.name, self.id))
 
+        self._client._forget_object(self.id)
+
     def subprocess(self):
         """Retrieve the subprocess in which this activity is defined.
 
@@ -106,7 +113,8 @@ class Activity(Base):
         if subprocess_id == self._json_data.get('root_container'):
             raise NotFoundError("Cannot find subprocess for this task '{}', "
                                 "as this task exist on top level.".format(self.name))
-        return self._client.activity(pk=subprocess_id, scope=self._json_data['scope']['id'])
+        return self._client._live_object(subprocess_id) or \
+            self._client.activity(pk=subprocess_id, scope=self._json_data['scope']['id'])
 
     def children(self):
         """Retrieve the direct activities of this subprocess.
@@ -299,12 +307,12 @@ class Activity(Base):
             raise Exception("Need to provide either a dictionary or Customization as input, got: '{}'".
                             format(type(config)))
 
+        config_json = self._client.codec.dumps(deprecated_customizations.as_dict(), indent=2)
         activity_widget_config = self._json_data.get('widget_config')
         # When an activity has been costumized at least once before, then its widget config already exists
         if activity_widget_config:
             widget_config_id = activity_widget_config['id']
-            request_update_dict = {'id': widget_config_id, 'config': json.dumps(deprecated_customizations.as_dict(),
-                                                                                indent=2)}
+            request_update_dict = {'id': widget_config_id, 'config': config_json}
             url = self._client._build_url('widget_config', widget_config_id=widget_config_id)
             r = self._client._request('PUT', url, json=request_update_dict)
         # When an activity was not customized before, then there is no widget config and a new one must be created for
@@ -313,12 +321,12 @@ class Activity(Base):
             r = self._client._request('POST', self._client._build_url('widgets_config'),
                                       data=dict(
                                           activity=self.id,
-                                          config=json.dumps(deprecated_customizations.as_dict(), indent=2))
+                                          config=config_json)
                                       )
 
         if r.status_code in (requests.codes.ok, requests.codes.created):
-            self._json_data['widget_config'] = {'id': r.json()['results'][0].get('id'),
-                                                'config': json.dumps(deprecated_customizations.as_dict(), indent=2)}
+            self._json_data['widget_config'] = {'id': self._client._decode(r)['results'][0].get('id'),
+                                                'config': config_json}
 
     def customization(self):
         """
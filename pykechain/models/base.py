@@ -1,15 +1,110 @@
+from typing import Any, Optional, Tuple  # flake8: noqa
+
+import requests
+
+from pykechain.exceptions import NotFoundError
+from pykechain.utils import intern_string
 
 
 class Base(object):
-    """Base model connecting retrieved data to a KE-chain client."""
+    """Base model connecting retrieved data to a KE-chain client.
+
+    Models that are retrieved in large numbers (parts and properties) define `__slots__` to limit their memory use
+    and share the values of the `interned_keys` of their json (eg. the category) with all other models. When the
+    client is created with `compact=True`, these models only keep the keys of the json listed in `json_keys`.
+    """
+
+    __slots__ = ('_json_data', '_client', 'id', 'name', '_prefetched_objects', '_partial', '__weakref__')
+
+    # the keys of the json used by the model, or None to keep the complete json
+    json_keys = None  # type: Optional[Tuple[str, ...]]
+
+    # the keys of the json with a limited number of distinct values, eg. the category
+    interned_keys = ()  # type: Tuple[str, ...]
+
+    # the attributes of the model with the key of the json they are set from, to retrieve when the key is missing
+    json_attributes = (('name', 'name'),)  # type: Tuple[Tuple[str, str], ...]
+
+    # the api resource to retrieve the complete json of a single model from
+    detail_resource = None  # type: Optional[str]
+
+    def __init__(self, json, client, partial=False):
+        """Construct a model from provided json data.
+
+        :param json: the json of the model as retrieved from KE-chain
+        :param client: the :class:`pykechain.Client`
+        :param partial: if the json was retrieved with only some of its fields. The missing attributes are then
+                        retrieved from KE-chain on first access.
+        """
+        json = self._compact_json(json, drop_keys=getattr(client, 'compact', False))
 
-    def __init__(self, json, client):
-        """Construct a model from provided json data."""
         self._json_data = json
         self._client = client
+        self._partial = partial
 
         self.id = json.get('id', None)
         self.name = json.get('name', None)
 
+        # related objects that are retrieved in advance, eg. with `Client.parts(prefetch=...)`, kept when refreshed
+        # in place
+        self._prefetched_objects = getattr(self, '_prefetched_objects', {})
+
+    def __getattr__(self, name):
+        # only called for attributes that are not set, which are the attributes of fields that were not retrieved
+        if name in dict(type(self).json_attributes):
+            if self._partial:
+                self._fault_in()
+                return getattr(self, name)
+            return None
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+    def _unset_missing_attributes(self):
+        # type: () -> None
+        """Unset the attributes of which the json key was not retrieved, so they are retrieved on first access."""
+        if self._partial:
+            for attribute, key in self.json_attributes:
+                if key not in self._json_data:
+                    try:
+                        delattr(self, attribute)
+                    except AttributeError:
+                        # the attribute is set by the __init__ of a subclass
+                        pass
+
+    def _json_value(self, key, default=None):
+        # type: (str, Any) -> Any
+        """Return the value of a key of the json, retrieving the complete json when the key was not retrieved."""
+        if self._partial and key not in self._json_data:
+            self._fault_in()
+        return self._json_data.get(key, default)
+
+    def _fault_in(self):
+        # type: () -> None
+        """Retrieve the complete json of this model from KE-chain and re-initialise the model with it."""
+        url = self._client._build_url(self.detail_resource, **{self.detail_resource + '_id': self.id})
+        r = self._client._request('GET', url)
+
+        if r.status_code != requests.codes.ok:  # pragma: no cover
+            raise NotFoundError("Could not retrieve {} with id {}".format(self.detail_resource, self.id))
+
+        self.__init__(self._client._decode(r)['results'][0], client=self._client)
+
+    def _merged_json(self, json):
+        # type: (dict) -> dict
+        """Return the json of this model updated with the (partially) retrieved json, keeping the other fields."""
+        merged = dict(self._json_data)
+        merged.update(json)
+        return merged
+
+    @classmethod
+    def _compact_json(cls, json, drop_keys=True):
+        # type: (dict, bool) -> dict
+        """Return the json with interned values of the `interned_keys` and (optionally) only the `json_keys`."""
+        if drop_keys and cls.json_keys is not None and any(key not in cls.json_keys for key in json):
+            json = dict((key, json[key]) for key in cls.json_keys if key in json)
+        for key in cls.interned_keys:
+            if key in json:
+                json[key] = intern_string(json[key])
+        return json
+
     def __repr__(self):  # pragma: no cover
         return "<pyke {} '{}' id {}>".format(self.__class__.__name__, self.name, self.id[-8:])
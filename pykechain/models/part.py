@@ -1,5 +1,4 @@
-import json
-from typing import Any, AnyStr  # flake8: noqa
+from typing import Any, AnyStr, Dict, List, Optional, Tuple  # flake8: noqa
 
 import requests
 from six import text_type
@@ -8,7 +7,6 @@ from pykechain.enums import Multiplicity, Category
 from pykechain.exceptions import NotFoundError, APIError, MultipleFoundError, IllegalArgumentError
 from pykechain.models.base import Base
 from pykechain.models.property import Property
-from pykechain.utils import find
 
 
 class Part(Base):
@@ -49,23 +47,97 @@ class Part(Base):
 
     """
 
+    __slots__ = ('category', 'parent_id', 'multiplicity', '_properties', '_property_indexes', '_graph')
+
+    json_keys = ('id', 'name', 'category', 'parent', 'model', 'proxy', 'multiplicity', 'properties')
+    interned_keys = ('category', 'multiplicity')
+    json_attributes = Base.json_attributes + (('category', 'category'), ('parent_id', 'parent'),
+                                              ('multiplicity', 'multiplicity'))
+    detail_resource = 'part'
+
     def __init__(self, json, **kwargs):
         # type: (dict, **Any) -> None
         """Construct a part from provided json data."""
         super(Part, self).__init__(json, **kwargs)
 
-        self.category = json.get('category')
+        if getattr(self._client, 'compact', False) and 'properties' in self._json_data:
+            # compact the json of the properties, which are only created on first access
+            self._json_data['properties'] = [Property._compact_json(p) for p in self._json_data['properties']]
+
+        self.category = self._json_data.get('category')
         self.parent_id = json['parent'].get('id') if 'parent' in json and json.get('parent') else None
-        self.properties = [Property.create(p, client=self._client) for p in json['properties']]
-        self.multiplicity = json.get('multiplicity', None)
+        # the properties are created from the json on first access
+        self._properties = None  # type: Optional[List[Property]]
+        if getattr(self._client, 'identity_map', None) is not None:
+            # refresh the live properties in place, as they are referenced already
+            for property_json in json.get('properties', []):
+                if property_json.get('id') in self._client.identity_map:
+                    self._client._load_object(Property.create, property_json, partial=self._partial)
+        self.multiplicity = self._json_data.get('multiplicity', None)
+
+        # indexes of the properties on name and id, built on the first lookup
+        self._property_indexes = None  # type: Optional[Tuple[Tuple[int, int], Dict, Dict]]
+
+        # the `PartGraph` that answers the navigation of this part when attached, kept when refreshed in place
+        self._graph = getattr(self, '_graph', None)
+
+        self._unset_missing_attributes()
+
+    def _merged_json(self, json):
+        # type: (dict) -> dict
+        """Return the json of this part updated with the (partially) retrieved json, keeping the other fields.
+
+        The json of the properties is merged per property as well.
+        """
+        merged = super(Part, self)._merged_json(json)
+        if json.get('properties') is not None and self._json_data.get('properties') is not None:
+            known = dict((p.get('id'), p) for p in self._json_data['properties'])
+            merged['properties'] = [dict(known.get(p.get('id'), {}), **p) for p in json['properties']]
+        return merged
+
+    @property
+    def properties(self):
+        # type: () -> List[Property]
+        """The list of :class:`pykechain.models.Property` objects belonging to this part.
+
+        The property objects are created on first access, so retrieving many parts of which the properties are not
+        used stays fast.
+        """
+        if self._properties is None:
+            self._properties = [self._client._load_object(Property.create, p, partial=self._partial)
+                                for p in self._json_value('properties', [])]
+        return self._properties
+
+    @properties.setter
+    def properties(self, properties):
+        # type: (List[Property]) -> None
+        self._properties = properties
+
+    def _property_index(self, rebuild=False):
+        # type: (bool) -> Tuple[Dict[str, Property], Dict[str, Property]]
+        """Return the indexes of the properties on their name and id.
+
+        The indexes are rebuilt when the list of properties is replaced or changes in length, eg. after
+        `create_property` appends a property.
+        """
+        indexed_properties = (id(self.properties), len(self.properties))
+        if rebuild or self._property_indexes is None or self._property_indexes[0] != indexed_properties:
+            by_name, by_id = {}, {}  # type: Dict[str, Property], Dict[str, Property]
+            for prop in self.properties:
+                # the first property with a name is found, as with a linear search
+                by_name.setdefault(prop.name, prop)
+                by_id[prop.id] = prop
+            self._property_indexes = (indexed_properties, by_name, by_id)
+        return self._property_indexes[1], self._property_indexes[2]
 
     def property(self, name):
         # type: (str) -> Property
-        """Retrieve the property with name belonging to this part.
+        """Retrieve the property with name or id belonging to this part.
 
-        If you need to retrieve the property using eg. the id, use :meth:`pykechain.Client.properties`.
+        The properties are looked up in indexes on their name and id, so retrieving many properties of a part with
+        many properties stays fast.
 
-        :param name: property name to search for
+        :param name: property name or id to search for
         :return: a single :class:`pykechain.models.Property`
         :raises: NotFoundError
 
@@ -81,7 +153,13 @@ class Part(Base):
         >>> gears.value
         6
         """
-        found = find(self.properties, lambda p: name == p.name)
+        by_name, by_id = self._property_index()
+        found = by_name.get(name) or by_id.get(name)
+
+        if found is None or name not in (found.name, found.id):
+            # the index is outdated when a property is renamed or the list of properties is changed in place
+            by_name, by_id = self._property_index(rebuild=True)
+            found = by_name.get(name) or by_id.get(name)
 
         if not found:
             raise NotFoundError("Could not find property with name {}".format(name))
@@ -102,8 +180,13 @@ class Part(Base):
         >>> bike = part.parent()
 
         """
+        if 'parent' in self._prefetched_objects:
+            return self._prefetched_objects['parent']
+        if self._graph is not None and self.parent_id in self._graph:
+            return self._graph.parent(self)
         if self.parent_id:
-            return self._client.part(pk=self.parent_id, category=self.category)
+            return self._client._related_part(self, 'parent', self.parent_id, self._client.part,
+                                              category=self.category)
         else:
             return None
 
@@ -120,6 +203,11 @@ class Part(Base):
         >>> bike = project.part('Bike')
         >>> direct_descendants_of_bike = bike.children()
         """
+        if 'children' in self._prefetched_objects:
+            from pykechain.models.partset import PartSet
+            return PartSet(self._prefetched_objects['children'])
+        if self._graph is not None:
+            return self._graph.children(self)
         return self._client.parts(parent=self.id, category=self.category)
 
     def siblings(self):
@@ -131,12 +219,33 @@ class Part(Base):
         :return: a set of `Part`s as :class:`pykechain.model.PartSet`. Will be empty if no siblings
         :raises: APIError
         """
+        if self._graph is not None and self.parent_id:
+            return self._graph.siblings(self)
         if self.parent_id:
             return self._client.parts(parent=self.parent_id, category=self.category)
         else:
             from pykechain.models.partset import PartSet
             return PartSet(parts=[])
 
+    def subtree(self, depth=None, max_workers=None):
+        # type: (Optional[int], Optional[int]) -> Any
+        """Retrieve this `Part` and all parts below it, a complete level of the tree per request.
+
+        See :meth:`pykechain.Client.part_tree` for available parameters.
+
+        :return: a set of `Part`s as :class:`pykechain.model.PartSet`, starting with this part
+        :raises: APIError
+
+        Example
+        -------
+        >>> bike = project.part('Bike')
+        >>> bike_tree = bike.subtree()
+        >>> for wheel in bike.children():  # no requests are made
+        ...     spokes = wheel.children()
+
+        """
+        return self._client.part_tree(self, depth=depth, max_workers=max_workers)
+
     def model(self):
         """
         Retrieve the model of this `Part` as `Part`.
@@ -153,9 +262,13 @@ class Part(Base):
         >>> front_fork_model = front_fork.model()
 
         """
+        if 'model' in self._prefetched_objects:
+            return self._prefetched_objects['model']
         if self.category == Category.INSTANCE:
-            model_id = self._json_data['model'].get('id')
-            return self._client.model(pk=model_id)
+            model_id = self._json_value('model').get('id')
+            if self._graph is not None and model_id in self._graph:
+                return self._graph.model(self)
+            return self._client._related_part(self, 'model', model_id, self._client.model)
         else:
             raise NotFoundError("Part {} has no model".format(self.name))
 
@@ -177,6 +290,8 @@ class Part(Base):
 
         """
         if self.category == Category.MODEL:
+            if self._graph is not None:
+                return self._graph.instances(self)
             return self._client.parts(model=self, category=Category.INSTANCE)
         else:
             raise NotFoundError("Part {} has no instances or is not a model".format(self.name))
@@ -219,9 +334,9 @@ class Part(Base):
         """
         if self.category != Category.MODEL:
             raise IllegalArgumentError("Part {} is not a model, therefore it cannot have a proxy model".format(self))
-        if 'proxy' in self._json_data and self._json_data.get('proxy'):
+        if self._json_value('proxy'):
             catalog_model_id = self._json_data['proxy'].get('id')
-            return self._client.model(pk=catalog_model_id)
+            return self._client._related_part(self, 'proxy_model', catalog_model_id, self._client.model)
         else:
             raise NotFoundError("Part {} is not a proxy".format(self.name))
 
@@ -330,6 +445,8 @@ class Part(Base):
         if r.status_code != requests.codes.no_content:  # pragma: no cover
             raise APIError("Could not delete part: {} with id {}".format(self.name, self.id))
 
+        self._client._forget_object(self.id)
+
     def edit(self, name=None, description=None, **kwargs):
         # type: (AnyStr, AnyStr, Any) -> None
         """
@@ -435,7 +552,7 @@ class Part(Base):
                 if not isinstance(name, str):
                     raise IllegalArgumentError("Name of the part should be provided as a string")
             r = self._client._request('PUT', self._client._build_url('part', part_id=self.id),
-                                      data=dict(name=name, properties=json.dumps(request_body), **kwargs),
+                                      data=dict(name=name, properties=self._client.codec.dumps(request_body), **kwargs),
                                       params=dict(select_action=action))
             if r.status_code != requests.codes.ok:  # pragma: no cover
                 raise APIError('{}: {}'.format(str(r), r.content))
@@ -477,14 +594,14 @@ class Part(Base):
                                           name=name,
                                           model=model.id,
                                           parent=self.id,
-                                          properties=json.dumps(properties_update_dict),
+                                          properties=self._client.codec.dumps(properties_update_dict),
                                           **kwargs
                                       ),
                                       params=dict(select_action=action))
 
             if r.status_code != requests.codes.created:  # pragma: no cover
                 raise APIError('{}: {}'.format(str(r), r.content))
-            return Part(r.json()['results'][0], client=self._client)
+            return self._client._load_object(Part, self._client._decode(r)['results'][0])
         else:  # do the old way
             new_part = self.add(model, name=name)  # type: Part
             new_part.update(update_dict=update_dict, bulk=bulk)
@@ -533,15 +650,15 @@ class Part(Base):
 
         order_dict = dict()
 
-        for prop in property_list:
+        for index, prop in enumerate(property_list):
             if isinstance(prop, (str, text_type)):
-                order_dict[self.property(name=prop).id] = property_list.index(prop)
+                order_dict.setdefault(self.property(name=prop).id, index)
             else:
-                order_dict[prop.id] = property_list.index(prop)
+                order_dict.setdefault(prop.id, index)
 
         r = self._client._request('PUT', self._client._build_url('part', part_id=self.id),
                                   data=dict(
-                                      property_order=json.dumps(order_dict)
+                                      property_order=self._client.codec.dumps(order_dict)
                                   ))
         if r.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError("Could not reorder properties")
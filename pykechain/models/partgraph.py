@@ -0,0 +1,131 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional  # flake8: noqa
+
+from pykechain.models.part import Part
+from pykechain.models.partset import PartSet
+
+
+class PartGraph(object):
+    """An in-memory graph of KE-chain parts, indexed for navigation without requests.
+
+    The graph indexes the parts on their id, the id of their parent and the id of their model. When the graph is
+    attached to its parts, `Part.parent()`, `Part.children()`, `Part.siblings()`, `Part.model()` and
+    `Part.instances()` are answered from the graph in constant time. The answers are as complete as the parts the
+    graph is built from: a relation to a part outside of the graph is still retrieved from KE-chain, but the
+    children, siblings and instances are only those that are in the graph. Build the graph from a complete scope with
+    :meth:`from_scope` to navigate the whole scope.
+
+    Example
+    -------
+    >>> graph = PartGraph.from_scope(project)
+    >>> bike = graph.get(name='Bike')
+    >>> for wheel in bike.children():  # no requests are made
+    ...     print(wheel.model().name)
+
+    >>> graph = PartGraph(project.parts(category=None)).attach()
+
+    """
+
+    def __init__(self, parts):
+        # type: (Iterable[Part]) -> None
+        """Build the graph from the parts.
+
+        :param parts: the parts of the graph, eg. a :class:`PartSet`
+        """
+        self._parts = {}  # type: Dict[str, Part]
+        self._children = {}  # type: Dict[Optional[str], List[Part]]
+        self._instances = {}  # type: Dict[str, List[Part]]
+
+        for part in parts:
+            self._parts[part.id] = part
+            self._children.setdefault(part.parent_id, []).append(part)
+            model_id = self._model_id(part)
+            if model_id:
+                self._instances.setdefault(model_id, []).append(part)
+
+    @classmethod
+    def from_scope(cls, scope, attach=True, **kwargs):
+        # type: (Any, bool, **Any) -> PartGraph
+        """Build the graph from all parts (models and instances) of a scope.
+
+        :param scope: the :class:`pykechain.models.Scope`
+        :param attach: if to attach the graph to its parts (defaults to True)
+        :param kwargs: additional arguments for :meth:`pykechain.models.Scope.parts`, eg. `category` or `max_workers`
+        :return: :class:`PartGraph`
+        """
+        graph = cls(scope.parts(**dict(dict(category=None), **kwargs)))
+        return graph.attach() if attach else graph
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke {} object {} parts>".format(self.__class__.__name__, len(self))
+
+    def __len__(self):
+        return len(self._parts)
+
+    def __iter__(self):
+        # type: () -> Iterator[Part]
+        return iter(self._parts.values())
+
+    def __contains__(self, part):
+        return (part.id if isinstance(part, Part) else part) in self._parts
+
+    @staticmethod
+    def _model_id(part):
+        # type: (Part) -> Optional[str]
+        model = part._json_data.get('model')
+        return model.get('id') if model else None
+
+    def attach(self):
+        # type: () -> PartGraph
+        """Attach the graph to its parts, to answer their navigation from the graph.
+
+        :return: the graph itself
+        """
+        for part in self._parts.values():
+            part._graph = self
+        return self
+
+    def detach(self):
+        # type: () -> None
+        """Detach the graph from its parts, after which their navigation is retrieved from KE-chain again."""
+        for part in self._parts.values():
+            if part._graph is self:
+                part._graph = None
+
+    def get(self, pk=None, name=None):
+        # type: (Optional[str], Optional[str]) -> Optional[Part]
+        """Return the part of the graph with the id or name, or None when it is not in the graph.
+
+        :param pk: the id of the part
+        :param name: the name of the part, when no id is provided
+        """
+        if pk is not None:
+            return self._parts.get(pk)
+        for part in self._parts.values():
+            if part.name == name:
+                return part
+        return None
+
+    def parent(self, part):
+        # type: (Part) -> Optional[Part]
+        """Return the parent of the part, or None when the part has no parent or the parent is not in the graph."""
+        return self._parts.get(part.parent_id) if part.parent_id else None
+
+    def children(self, part):
+        # type: (Part) -> PartSet
+        """Return the children of the part in the graph."""
+        return PartSet(self._children.get(part.id, []))
+
+    def siblings(self, part):
+        # type: (Part) -> PartSet
+        """Return the parts in the graph with the same parent as the part, including the part itself."""
+        return PartSet(self._children.get(part.parent_id, []) if part.parent_id else [])
+
+    def model(self, part):
+        # type: (Part) -> Optional[Part]
+        """Return the model of the part, or None when the model is not in the graph."""
+        return self._parts.get(self._model_id(part))
+
+    def instances(self, model):
+        # type: (Part) -> PartSet
+        """Return the instances of the model in the graph."""
+        return PartSet(self._instances.get(model.id, []))
@@ -1,16 +1,79 @@
-from typing import Sized, Any, Iterable  # flake8: noqa
+import numbers
+from collections import OrderedDict
+from typing import Sized, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union  # flake8: noqa
 
+from six import string_types, text_type
+
+from pykechain.exceptions import IllegalArgumentError
 from pykechain.models.part import Part
 
+# the fields of the parts to filter, order and group a `PartSet` on, next to `properties__<name>`
+PART_FIELDS = ('id', 'name', 'category', 'parent', 'model', 'multiplicity')
+
+# the lookups of `PartSet.filter()`, eg. `name__icontains`, with the test of a value against the argument
+LOOKUPS = {
+    'exact': lambda value, arg: value == arg,
+    'iexact': lambda value, arg: value is not None and text_type(value).lower() == text_type(arg).lower(),
+    'contains': lambda value, arg: value is not None and arg in value,
+    'icontains': lambda value, arg: value is not None and text_type(arg).lower() in text_type(value).lower(),
+    'startswith': lambda value, arg: value is not None and text_type(value).startswith(arg),
+    'endswith': lambda value, arg: value is not None and text_type(value).endswith(arg),
+    'gt': lambda value, arg: value is not None and value > arg,
+    'gte': lambda value, arg: value is not None and value >= arg,
+    'lt': lambda value, arg: value is not None and value < arg,
+    'lte': lambda value, arg: value is not None and value <= arg,
+    'in': lambda value, arg: value in arg,
+    'isnull': lambda value, arg: (value is None) == bool(arg),
+}  # type: Dict[str, Callable[[Any, Any], bool]]
+
+
+def _normalise(value):
+    # type: (Any) -> Any
+    """Return a value to filter on: the id of a part or related object (eg. a reference) and a tuple of a list."""
+    if isinstance(value, Part):
+        return value.id
+    if isinstance(value, dict):
+        return value.get('id')
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _sort_key(value):
+    # type: (Any) -> Tuple[int, str, Any]
+    """Return a key to order values of different types on: numbers first, then text, then other values per type."""
+    if isinstance(value, numbers.Real):
+        return 0, '', value
+    if isinstance(value, string_types):
+        return 1, '', value
+    return 2, type(value).__name__, value
+
 
 class PartSet(Sized):
     """A set of KE-chain parts.
 
     Adding set-like methods on a list of parts:
-     * iterable
-     * len()
-     * get()
+     * iterable, as often as needed
+     * len() and count()
+     * indexing and slicing, eg. `part_set[0]` and `part_set[10:20]`, or on id or name, eg. `part_set['Wheel']`
+     * membership tests of parts or ids, eg. `part in part_set`
+     * lookup on id or name with get() and `by_name`
+     * property values as NumPy arrays with values()
+     * export to a pandas DataFrame with to_dataframe() or an Arrow table with to_arrow()
+     * querying with filter(), order_by() and group_by()
      * iPython notebook support for HTML table
+
+    The lookups on id and name use indexes that are built on first use, so they take constant time.
+
+    Example
+    -------
+    >>> wheels = project.parts(name='Wheel')
+    >>> front_wheel = wheels.get(pk=front_wheel_id)
+    >>> front_wheel in wheels
+    True
+    >>> project.parts().by_name['Wheel']
+    <pyke PartSet object 2 parts>
+
     """
 
     def __init__(self, parts):
@@ -18,28 +81,464 @@ class PartSet(Sized):
         """Construct a PartSet from a part iterable."""
         self._parts = list(parts)
         self._iter = iter(self._parts)
+        self._id_index = None  # type: Optional[Dict[str, Part]]
+        self._name_index = None  # type: Optional[Dict[str, PartSet]]
+        self._columns = {}  # type: Dict[str, List[Any]]
+        self._column_json = {}  # type: Dict[str, Dict[str, Any]]
+        self._field_columns = {}  # type: Dict[str, List[Any]]
+        self._field_indexes = {}  # type: Dict[str, Optional[Dict[Any, List[int]]]]
 
     def __repr__(self):  # pragma: no cover
         return "<pyke {} object {} parts>".format(self.__class__.__name__, self.__len__())
 
     def __iter__(self):
-        return self
+        # type: () -> Iterator[Part]
+        return iter(self._parts)
 
     def __len__(self):
         return len(self._parts)
 
+    def __contains__(self, part):
+        # type: (Union[Part, str]) -> bool
+        return (part.id if isinstance(part, Part) else part) in self._ids()
+
     def __next__(self):
-        # py3.4 and up style next
+        # py3.4 and up style next, kept to step through the parts with `next(part_set)`
         return next(self._iter)
 
     next = __next__  # py2.7 alias
 
+    def count(self):
+        # type: () -> int
+        """Return the number of parts in the set.
+
+        The parts of a set are already retrieved. To count parts without retrieving them, use
+        :meth:`pykechain.Client.count_parts`.
+        """
+        return len(self._parts)
+
     def __getitem__(self, k):
-        # type: (Any) -> Part
+        # type: (Any) -> Union[Part, PartSet]
         if isinstance(k, int):
             return self._parts[k]
+        if isinstance(k, slice):
+            return PartSet(self._parts[k])
+        if isinstance(k, string_types):
+            # the part with the id, or the first part with the name, as with `get()`
+            part = self._ids().get(k) or self.get(name=k)
+            if part is None:
+                raise KeyError(k)
+            return part
+
+        raise TypeError("PartSet indices must be integers, slices or the id or name of a part, not {}".format(
+            type(k).__name__))
+
+    def _ids(self):
+        # type: () -> Dict[str, Part]
+        """Return the index of the parts on their id, which is built on first use."""
+        if self._id_index is None:
+            self._id_index = dict((part.id, part) for part in self._parts)
+        return self._id_index
+
+    @property
+    def by_name(self):
+        # type: () -> Dict[str, PartSet]
+        """Index of the parts on their name, with a :class:`PartSet` of the parts of every name.
+
+        The index is built on first use.
+
+        Example
+        -------
+        >>> wheels = part_set.by_name['Wheel']
+        >>> 'Wheel' in part_set.by_name
+        True
+
+        """
+        if self._name_index is None:
+            parts_by_name = {}  # type: Dict[str, list]
+            for part in self._parts:
+                parts_by_name.setdefault(part.name, []).append(part)
+            self._name_index = dict((name, PartSet(parts)) for name, parts in parts_by_name.items())
+        return self._name_index
+
+    def get(self, pk=None, name=None, id=None):
+        # type: (Optional[str], Optional[str], Optional[str]) -> Optional[Part]
+        """Return the part of the set with the id or name, or None when it is not in the set.
+
+        :param pk: the id of the part
+        :param name: the name of the part, when no id is provided. The first part with the name is returned.
+        :param id: alias of `pk`
+        :return: the :class:`Part` or None
+        """
+        pk = pk or id
+        if pk is not None:
+            return self._ids().get(pk)
+        parts = self.by_name.get(name)
+        return parts[0] if parts else None
+
+    def _property_columns(self, names):
+        # type: (Iterable[str]) -> List[List[Any]]
+        """Return the values of the properties with the names of all parts, with None for missing values.
+
+        The values of all properties that are not yet extracted are read in a single pass over the json of the
+        properties of the parts, without creating property objects. The values are kept for later use: they are
+        the values of the properties when the set was created (or when they were first used).
+        """
+        names = list(names)
+        missing = set(name for name in names if name not in self._columns)
+
+        if missing:
+            columns = dict((name, []) for name in missing)  # type: Dict[str, List[Any]]
+            for part in self._parts:
+                values = {}
+                for name, value, prop_json in self._iter_property_values(part):
+                    # the first property with a name is used, as with `Part.property()`
+                    if name in missing and name not in values:
+                        values[name] = value
+                        self._column_json.setdefault(name, prop_json)
+                for name in missing:
+                    columns[name].append(values.get(name))
+            self._columns.update(columns)
+
+        return [self._columns[name] for name in names]
+
+    @staticmethod
+    def _iter_property_values(part):
+        # type: (Part) -> Iterator[Any]
+        """Iterate over the name, value and json of the properties of a part, without creating property objects."""
+        if part._properties is not None:
+            # the values of the property objects, which are updated with the property
+            return ((prop.name, prop._value, prop._json_data) for prop in part._properties)
+        return ((prop.get('name'), prop.get('value'), prop) for prop in part._json_value('properties', []))
+
+    def _property_names(self):
+        # type: () -> List[str]
+        """Return the names of the properties of all parts, in the order in which they are first found."""
+        names = []  # type: List[str]
+        found = set()
+        for part in self._parts:
+            for name, _, _ in self._iter_property_values(part):
+                if name not in found:
+                    found.add(name)
+                    names.append(name)
+        return names
+
+    def _export_columns(self, properties=None):
+        # type: (Optional[Iterable[str]]) -> List[Any]
+        """Return the columns to export the parts with, as tuples of the name, values and property json.
+
+        The first columns are the id and name of the parts, without property json. The values of reference
+        properties are the ids of the referenced parts.
+        """
+        names = list(properties) if properties is not None else self._property_names()
+
+        columns = [('id', [part.id for part in self._parts], None),
+                   ('name', [part.name for part in self._parts], None)]
+        for name, values in zip(names, self._property_columns(names)):
+            prop_json = self._column_json.get(name)
+            if prop_json and prop_json.get('property_type') == 'REFERENCE_VALUE':
+                values = [value.get('id') if isinstance(value, dict) else value for value in values]
+            columns.append((name, values, prop_json))
+        return columns
+
+    @staticmethod
+    def _select_list_options(prop_json, values):
+        # type: (Optional[Dict[str, Any]], List[Any]) -> Optional[List[Any]]
+        """Return the options of a select list property to encode its values with, or None for other properties.
+
+        The options of the property are used when they contain all values, otherwise the distinct values are used.
+        """
+        if not prop_json or prop_json.get('property_type') != 'SINGLE_SELECT_VALUE':
+            return None
+
+        options = list((prop_json.get('options') or {}).get('value_choices') or [])
+        distinct = set(value for value in values if value is not None)
+        if not distinct.issubset(options):
+            options = sorted(distinct, key=str)
+        return options
+
+    def to_dataframe(self, properties=None):
+        # type: (Optional[Iterable[str]]) -> Any
+        """Export the parts and the values of their properties to a pandas DataFrame.
+
+        The DataFrame has a row for every part, indexed on the id of the part, with a `name` column and a column for
+        every property. The columns are filled directly from the json of the properties, without creating property
+        objects. The values of select list properties are categorical, with the options of the property as
+        categories, and the values of reference properties are the ids of the referenced parts. Missing values are
+        NaN or None. Requires pandas (`pip install pykechain[pandas]`).
+
+        :param properties: (optional) the names of the properties to export, defaults to all properties
+        :return: :class:`pandas.DataFrame`
+        :raises: ImportError when pandas is not installed
+
+        Example
+        -------
+        >>> wheels = project.parts(model=wheel_model)
+        >>> df = wheels.to_dataframe(properties=['Diameter', 'Spokes', 'Rim Material'])
+        >>> df.groupby('Rim Material')['Diameter'].mean()
+
+        """
+        import pandas
+
+        columns = self._export_columns(properties)
+        (_, ids, _), export_columns = columns[0], columns[1:]
+
+        data = {}
+        for name, values, prop_json in export_columns:
+            options = self._select_list_options(prop_json, values)
+            data[name] = pandas.Categorical(values, categories=options) if options is not None else values
+
+        return pandas.DataFrame(data, index=pandas.Index(ids, name='id'),
+                                columns=[name for name, _, _ in export_columns])
+
+    def to_arrow(self, properties=None):
+        # type: (Optional[Iterable[str]]) -> Any
+        """Export the parts and the values of their properties to an Apache Arrow table.
+
+        The table has a row for every part, with an `id` and `name` column and a column for every property. The
+        columns are filled directly from the json of the properties, without creating property objects. The values
+        of select list properties are dictionary encoded with the options of the property as dictionary, and the
+        values of reference properties are the ids of the referenced parts. Missing values are null. Requires
+        pyarrow (`pip install pykechain[arrow]`).
+
+        :param properties: (optional) the names of the properties to export, defaults to all properties
+        :return: :class:`pyarrow.Table`
+        :raises: ImportError when pyarrow is not installed
+
+        Example
+        -------
+        >>> table = project.parts(model=wheel_model).to_arrow()
+        >>> pyarrow.parquet.write_table(table, 'wheels.parquet')
+
+        """
+        import pyarrow
+
+        names, arrays = [], []
+        for name, values, prop_json in self._export_columns(properties):
+            options = self._select_list_options(prop_json, values)
+            if options is not None:
+                codes = dict((option, code) for code, option in enumerate(options))
+                array = pyarrow.DictionaryArray.from_arrays(
+                    pyarrow.array([codes.get(value) for value in values], type=pyarrow.int32()),
+                    pyarrow.array(options))
+            else:
+                array = pyarrow.array(values)
+            names.append(name)
+            arrays.append(array)
+
+        return pyarrow.Table.from_arrays(arrays, names=names)
+
+    def values(self, *names, **kwargs):
+        # type: (*str, **Any) -> Any
+        """Return the values of one or more properties of all parts as NumPy arrays.
+
+        The values are read from the json of the properties in a single pass over the parts, without creating
+        property objects. Every array is a masked array (:class:`numpy.ma.MaskedArray`) with the values in the
+        order of the parts. A part without the property, or with an empty value (None or an empty string), is
+        masked, so aggregations like `mean()` and `sum()` skip it. Requires NumPy (`pip install pykechain[numpy]`).
+
+        :param names: the names of the properties
+        :param dtype: (optional) the NumPy dtype of the arrays, eg. `float`. Defaults to the dtype of the values.
+        :return: a masked array for a single name, or a `dict` with a masked array for every name
+        :raises: IllegalArgumentError, ImportError when NumPy is not installed
+
+        Example
+        -------
+        >>> wheels = project.parts(model=wheel_model)
+        >>> diameters = wheels.values('Diameter', dtype=float)
+        >>> diameters.mean()
+        60.2
+
+        >>> columns = wheels.values('Diameter', 'Spokes')
+        >>> numpy.histogram(columns['Spokes'].compressed(), bins=5)
+
+        """
+        import numpy
+
+        if not names:
+            raise IllegalArgumentError("Provide the name of at least one property")
+        dtype = kwargs.pop('dtype', None)
+
+        arrays = {}
+        for name, column in zip(names, self._property_columns(names)):
+            mask = numpy.fromiter((value is None or value == '' for value in column), dtype=bool, count=len(column))
+            present = [value for value, masked in zip(column, mask) if not masked]
+
+            data = numpy.zeros(len(column), dtype=dtype or (numpy.asarray(present).dtype if present else float))
+            data[~mask] = present
+            arrays[name] = numpy.ma.MaskedArray(data, mask=mask)
+
+        return arrays[names[0]] if len(names) == 1 else arrays
+
+    def _field_column(self, field):
+        # type: (str) -> List[Any]
+        """Return the normalised values of a field (eg. 'name' or 'properties__Gears') of all parts.
+
+        The column is built on first use and kept for later queries on the set.
+
+        :raises: IllegalArgumentError when the field is unknown
+        """
+        if field not in self._field_columns:
+            if field.startswith('properties__'):
+                values = self._property_columns([field[len('properties__'):]])[0]
+            elif field == 'parent':
+                values = [part.parent_id for part in self._parts]
+            elif field == 'model':
+                values = [part._json_value('model') for part in self._parts]
+            elif field in PART_FIELDS:
+                values = [getattr(part, field) for part in self._parts]
+            else:
+                raise IllegalArgumentError("Cannot query parts on '{}', use one of {} or "
+                                           "'properties__<name>'".format(field, ', '.join(PART_FIELDS)))
+            self._field_columns[field] = [_normalise(value) for value in values]
+        return self._field_columns[field]
+
+    def _field_index(self, field):
+        # type: (str) -> Optional[Dict[Any, List[int]]]
+        """Return the index of a field, with the positions of the parts for every value.
+
+        The index is built on first use and kept for later queries on the set. It is None when the values of the
+        field cannot be indexed.
+        """
+        if field not in self._field_indexes:
+            index = OrderedDict()  # type: Dict[Any, List[int]]
+            try:
+                for position, value in enumerate(self._field_column(field)):
+                    index.setdefault(value, []).append(position)
+            except TypeError:
+                # unhashable values
+                index = None
+            self._field_indexes[field] = index
+        return self._field_indexes[field]
+
+    @staticmethod
+    def _parse_lookup(key):
+        # type: (str) -> Tuple[str, str]
+        """Split a keyword of `filter()` (eg. `properties__Gears__gt`) in the field and the lookup."""
+        field, _, lookup = key.rpartition('__')
+        if field and lookup in LOOKUPS and field != 'properties':
+            return field, lookup
+        return key, 'exact'
+
+    def filter(self, **kwargs):
+        # type: (**Any) -> PartSet
+        """Return the parts of the set that fit all conditions, in the order of the set.
+
+        The conditions are keywords of a field and an optional lookup, eg. `name__icontains='wheel'`. The fields are
+        the id, name, category, parent, model and multiplicity of the parts and the value of their properties as
+        `properties__<name>`. The lookups are `exact` (the default), `iexact`, `contains`, `icontains`,
+        `startswith`, `endswith`, `gt`, `gte`, `lt`, `lte`, `in` and `isnull`. A part or the json of a reference
+        is compared on its id. A value that cannot be compared to the argument (eg. text with a number) does not fit
+        the condition.
+
+        The conditions are evaluated on columns of the values of every field, without creating property objects.
+        The `exact` and `in` lookups use an index on the values. The columns and indexes are built on first use and
+        reused by later queries on the same set.
+
+        :param kwargs: the conditions
+        :return: :class:`PartSet`
+        :raises: IllegalArgumentError
+
+        Example
+        -------
+        >>> bikes = project.parts(category=None)
+        >>> bikes.filter(model=bike_model, properties__Gears__gt=10, name__icontains='race')
+        <pyke PartSet object 2 parts>
+
+        Use a `dict` for property names with spaces
+
+        >>> bikes.filter(**{'properties__Rim Material__in': ['Steel', 'Carbon']})
+
+        """
+        conditions = [self._parse_lookup(key) + (value,) for key, value in kwargs.items()]
+        # the conditions with an index narrow down the parts for the other conditions
+        conditions.sort(key=lambda condition: condition[1] not in ('exact', 'in'))
+
+        selected = None  # type: Optional[Set[int]]
+        for field, lookup, arg in conditions:
+            if lookup == 'in':
+                arg = set(_normalise(value) for value in arg)
+            elif lookup != 'isnull':
+                arg = _normalise(arg)
+
+            index = self._field_index(field) if lookup in ('exact', 'in') else None
+            if index is not None:
+                matched = set()  # type: Set[int]
+                for value in (arg if lookup == 'in' else [arg]):
+                    matched.update(index.get(value, []))
+            else:
+                column, test = self._field_column(field), LOOKUPS[lookup]
+                matched = set(position for position in (range(len(self._parts)) if selected is None else selected)
+                              if self._test(test, column[position], arg))
+            selected = matched if selected is None else selected & matched
+
+        if selected is None:
+            return PartSet(self._parts)
+        return PartSet(self._parts[position] for position in sorted(selected))
+
+    @staticmethod
+    def _test(test, value, arg):
+        # type: (Callable[[Any, Any], bool], Any, Any) -> bool
+        try:
+            return test(value, arg)
+        except TypeError:
+            # values that cannot be compared to the argument, eg. text with a number
+            return False
+
+    def order_by(self, *fields):
+        # type: (*str) -> PartSet
+        """Return the parts of the set ordered on one or more fields.
+
+        Uses the fields of :meth:`filter`, prefixed with a `-` for a descending order. Parts without a value are
+        ordered last. Values of different types are ordered on their type: numbers, then text, then other values.
+
+        :param fields: the fields to order on, eg. `'name'` or `'-properties__Gears'`
+        :return: :class:`PartSet`
+        :raises: IllegalArgumentError
+
+        Example
+        -------
+        >>> bikes.order_by('-properties__Gears', 'name')
+
+        """
+        positions = list(range(len(self._parts)))
+        # sort on the last field first, as the sorts are stable
+        for field in reversed(fields):
+            descending = field.startswith('-')
+            column = self._field_column(field.lstrip('-'))
+
+            present = [position for position in positions if column[position] is not None]
+            try:
+                present.sort(key=lambda position: _sort_key(column[position]), reverse=descending)
+            except TypeError:
+                raise IllegalArgumentError("Cannot order on '{}', its values cannot be compared".format(field))
+            positions = present + [position for position in positions if column[position] is None]
+
+        return PartSet(self._parts[position] for position in positions)
+
+    def group_by(self, field):
+        # type: (str) -> Dict[Any, PartSet]
+        """Return the parts of the set grouped on the value of a field.
+
+        Uses the fields of :meth:`filter`. The groups are in the order in which their value is first found. Parts
+        are grouped on the id of their parent and model, and on the id of the part referenced by a property.
+
+        :param field: the field to group on, eg. 'model' or 'properties__Rim Material'
+        :return: ordered `dict` of the value of the field and a :class:`PartSet` of the parts with that value
+        :raises: IllegalArgumentError
+
+        Example
+        -------
+        >>> for material, wheels in project.parts(name='Wheel').group_by('properties__Rim Material').items():
+        ...     print(material, len(wheels))
+
+        """
+        index = self._field_index(field)
+        if index is None:
+            raise IllegalArgumentError("Cannot group parts on the values of '{}'".format(field))
 
-        raise NotImplementedError
+        return OrderedDict((value, PartSet(self._parts[position] for position in positions))
+                           for value, positions in index.items())
 
     def _repr_html_(self):
         # type: () -> str
@@ -10,6 +10,13 @@ from pykechain.models.base import Base
 class Property(Base):
     """A virtual object representing a KE-chain property."""
 
+    __slots__ = ('_output', '_value')
+
+    json_keys = ('id', 'name', 'value', 'part', 'output', 'property_type', 'category', 'options', 'model')
+    interned_keys = ('category', 'property_type')
+    json_attributes = Base.json_attributes + (('_output', 'output'), ('_value', 'value'))
+    detail_resource = 'property'
+
     def __init__(self, json, **kwargs):
         # type: (dict, **Any) -> None
         """Construct a Property from a json object."""
@@ -18,6 +25,8 @@ class Property(Base):
         self._output = json.get('output')
         self._value = json.get('value')
 
+        self._unset_missing_attributes()
+
     @property
     def output(self):
         """Return true if the property is configured as an output.
@@ -45,9 +54,10 @@ class Property(Base):
     @property
     def part(self):
         """Retrieve the part that holds this Property."""
-        part_id = self._json_data['part']
+        part_id = self._json_value('part')
 
-        return self._client.part(pk=part_id, category=self._json_data['category'])
+        return self._client._related_part(self, 'part', part_id, self._client.part,
+                                          category=self._json_value('category'))
 
     def delete(self):
         """Delete this property.
@@ -60,6 +70,8 @@ class Property(Base):
         if r.status_code != requests.codes.no_content: # pragma: no cover
             raise APIError("Could not delete property: {} with id {}".format(self.name, self.id))
 
+        self._client._forget_object(self.id)
+
     def _put_value(self, value):
         url = self._client._build_url('property', property_id=self.id)
 
@@ -68,7 +80,7 @@ class Property(Base):
         if r.status_code != requests.codes.ok:  # pragma: no cover
             raise APIError("Could not update property value")
 
-        return r.json()['results'][0]['value']
+        return self._client._decode(r)['results'][0]['value']
 
     @classmethod
     def create(cls, json, **kwargs):
@@ -1,4 +1,3 @@
-import json
 import io
 import requests
 
@@ -9,6 +8,8 @@ from pykechain.models.property import Property
 class AttachmentProperty(Property):
     """A virtual object representing a KE-chain attachment property."""
 
+    __slots__ = ()
+
     @property
     def value(self):
         """Retrieve the data value of this attachment.
@@ -58,7 +59,7 @@ class AttachmentProperty(Property):
         >>> json_attachment = project.part('Bike').property('json_attachment')
         >>> deserialised_json = json_attachment.json_load()
         """
-        return self._download().json()
+        return self._client._decode(self._download())
 
     def upload(self, data, **kwargs):
         """Upload a file to the attachment property.
@@ -112,7 +113,7 @@ class AttachmentProperty(Property):
             raise APIError("Could not upload attachment")
 
     def _upload_json(self, content, name='data.json'):
-        data = (name, json.dumps(content), 'application/json')
+        data = (name, self._client.codec.dumps(content), 'application/json')
 
         self._upload(data)
 
@@ -7,6 +7,8 @@ from pykechain.models.property import Property
 class ReferenceProperty(Property):
     """A virtual object representing a KE-chain reference property."""
 
+    __slots__ = ()
+
     @property
     def value(self):
         """Value of a reference property.
@@ -51,8 +53,10 @@ class ReferenceProperty(Property):
         """
         if not self._value:
             return None
+        if 'value' in self._prefetched_objects:
+            return self._prefetched_objects['value']
 
-        return self._client.part(pk=self._value['id'])
+        return self._client._related_part(self, 'value', self._value['id'], self._client.part)
 
     @value.setter
     def value(self, value):
@@ -65,6 +69,7 @@ class ReferenceProperty(Property):
             raise ValueError("Reference must be a Part, Part id or None. type: {}".format(type(value)))
 
         self._value = self._put_value(part_id)
+        self._prefetched_objects.pop('value', None)
 
     def choices(self):
         """Retrieve the parts that you can reference for this `ReferenceProperty`.
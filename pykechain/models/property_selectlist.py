@@ -5,10 +5,16 @@ from pykechain.models.property import Property
 class SelectListProperty(Property):
     """A select list property that needs to update its options."""
 
+    __slots__ = ('_options',)
+
+    json_attributes = Property.json_attributes + (('_options', 'options'),)
+
     def __init__(self, json, **kwargs):
         """Construct a Property from a json object."""
         super(SelectListProperty, self).__init__(json, **kwargs)
-        self._options = self._json_data.get('options').get('value_choices')
+        self._options = (self._json_data.get('options') or {}).get('value_choices')
+
+        self._unset_missing_attributes()
 
     @property
     def options(self):
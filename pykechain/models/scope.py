@@ -9,6 +9,9 @@ from pykechain.exceptions import APIError, NotFoundError
 class Scope(Base):
     """A virtual object representing a KE-chain scope."""
 
+    json_attributes = Base.json_attributes + (('bucket', 'bucket'), ('process', 'process'))
+    detail_resource = 'scope'
+
     def __init__(self, json, **kwargs):
         # type: (dict, **Any) -> None
         """Construct a scope from provided json data."""
@@ -17,6 +20,8 @@ class Scope(Base):
         self.bucket = json.get('bucket', {})
         self.process = json.get('process')
 
+        self._unset_missing_attributes()
+
     def __repr__(self):  # pragma: no cover
         return "<pyke Scope '{}' id {}>".format(self.name, self.id[-8:])
 
@@ -27,6 +32,35 @@ class Scope(Base):
         """
         return self._client.parts(*args, bucket=self.bucket.get('id'), **kwargs)
 
+    def iter_parts(self, *args, **kwargs):
+        """Iterate over the parts belonging to this scope while they are retrieved page by page.
+
+        See :class:`pykechain.Client.iter_parts` for available parameters.
+        """
+        return self._client.iter_parts(*args, bucket=self.bucket.get('id'), **kwargs)
+
+    def parts_query(self, **kwargs):
+        """Build a lazy query of the parts belonging to this scope.
+
+        See :class:`pykechain.Client.parts_query` for available parameters.
+        """
+        return self._client.parts_query(bucket=self.bucket.get('id'), **kwargs)
+
+    def count_parts(self, *args, **kwargs):
+        """Count the parts belonging to this scope, without retrieving them.
+
+        See :class:`pykechain.Client.count_parts` for available parameters.
+        """
+        return self._client.count_parts(*args, bucket=self.bucket.get('id'), **kwargs)
+
+    def part_graph(self, **kwargs):
+        """Retrieve all parts of this scope as an attached :class:`pykechain.models.PartGraph`.
+
+        See :meth:`pykechain.models.PartGraph.from_scope` for available parameters.
+        """
+        from pykechain.models.partgraph import PartGraph
+        return PartGraph.from_scope(self, **kwargs)
+
     def part(self, *args, **kwargs):
         """Retrieve a single part belonging to this scope.
 
@@ -55,6 +89,13 @@ class Scope(Base):
         """
         return self._client.activities(*args, scope=self.id, **kwargs)
 
+    def count_activities(self, *args, **kwargs):
+        """Count the activities belonging to this scope, without retrieving them.
+
+        See :class:`pykechain.Client.count_activities` for available parameters.
+        """
+        return self._client.count_activities(*args, scope=self.id, **kwargs)
+
     def activity(self, *args, **kwargs):
         """Retrieve a single activity belonging to this scope.
 
@@ -0,0 +1,246 @@
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple  # flake8: noqa
+
+from pykechain.enums import Category
+from pykechain.exceptions import IllegalArgumentError
+from pykechain.models.partset import PartSet, PART_FIELDS, _normalise
+
+# the conditions that the `/parts` api filters on, with the argument of `Client.iter_parts` to send them with
+SERVER_FILTERS = {
+    ('id', 'exact'): 'pk',
+    ('id', 'in'): 'id__in',
+    ('name', 'exact'): 'name',
+    ('category', 'exact'): 'category',
+    ('parent', 'exact'): 'parent',
+    ('parent', 'in'): 'parent__in',
+    ('model', 'exact'): 'model',
+    ('bucket', 'exact'): 'bucket',
+    ('activity', 'exact'): 'activity',
+}  # type: Dict[Tuple[str, str], str]
+
+# the fields that can only be filtered on by the api, as they are not part of the json of a part
+SERVER_ONLY_FIELDS = ('bucket', 'activity')
+
+
+class PartQuery(object):
+    """A lazy query of KE-chain parts, which pushes the conditions that the api supports down to the `/parts` api.
+
+    A query is built by chaining :meth:`filter`, :meth:`only` and :meth:`limit`, which each return a new query.
+    No request is made until the query is iterated over (or :meth:`all`, :meth:`first` or :meth:`count` is
+    called). The conditions are those of :meth:`pykechain.models.PartSet.filter`. The conditions that the api
+    supports (eg. `name`, `model` and `parent__in`) are sent as filters of the request. The other conditions (eg.
+    `name__icontains` or `properties__Gears__gt`) are evaluated on the parts while they are streamed page by page,
+    so only a single page of parts is in memory at a time. Use :meth:`explain` to see where every condition runs.
+
+    By default, as with :meth:`pykechain.Client.parts`, only part instances are retrieved. Use
+    `filter(category=None)` to retrieve models and instances.
+
+    Example
+    -------
+    >>> query = project.parts_query().filter(model=bike_model, properties__Gears__gt=10).only('name').limit(5)
+    >>> print(query.explain())
+    api:    bucket = '40003527-1c2a-476a-8270-eb7572e69ee0', category = 'INSTANCE', model = '8f3a...'
+    client: properties__Gears__gt = 10
+    fields: name, properties
+    limit:  5 (client)
+    >>> for bike in query:
+    ...     print(bike.name)
+
+    """
+
+    def __init__(self, client, batch=100, **kwargs):
+        # type: (Any, int, **Any) -> None
+        """Construct a query of the parts of KE-chain.
+
+        :param client: the :class:`pykechain.Client`
+        :param batch: the number of parts to retrieve per request (defaults to 100)
+        :param kwargs: (optional) initial conditions, see :meth:`filter`
+        """
+        self._client = client
+        self._batch = batch
+        self._conditions = [(('category', 'exact'), Category.INSTANCE)]  # type: List[Tuple[Tuple[str, str], Any]]
+        self._fields = None  # type: Optional[List[str]]
+        self._limit = None  # type: Optional[int]
+
+        if kwargs:
+            self._add_conditions(kwargs)
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke {} object {} conditions>".format(self.__class__.__name__, len(self._conditions))
+
+    def _clone(self):
+        # type: () -> PartQuery
+        query = PartQuery(self._client, batch=self._batch)
+        query._conditions = list(self._conditions)
+        query._fields = self._fields
+        query._limit = self._limit
+        return query
+
+    def _add_conditions(self, conditions):
+        # type: (Dict[str, Any]) -> None
+        for key, value in conditions.items():
+            field, lookup = PartSet._parse_lookup(key)
+            if field in SERVER_ONLY_FIELDS and lookup != 'exact':
+                raise IllegalArgumentError("Parts can only be filtered on the exact {}".format(field))
+            if field not in PART_FIELDS + SERVER_ONLY_FIELDS and not field.startswith('properties__'):
+                raise IllegalArgumentError("Cannot query parts on '{}', use one of {} or "
+                                           "'properties__<name>'".format(field, ', '.join(PART_FIELDS)))
+            if field == 'category':
+                # a single category condition, which replaces the default condition on instances
+                self._conditions = [c for c in self._conditions if c[0] != ('category', 'exact')]
+                if lookup == 'exact' and value is None:
+                    continue
+            self._conditions.append(((field, lookup), value))
+
+    def filter(self, **kwargs):
+        # type: (**Any) -> PartQuery
+        """Return a new query with additional conditions.
+
+        The conditions are those of :meth:`pykechain.models.PartSet.filter`, eg. `name__icontains='wheel'` or
+        `properties__Gears__gt=10`, and `bucket` and `activity` to filter on the bucket and activity (the api only).
+
+        :return: :class:`PartQuery`
+        :raises: IllegalArgumentError when a field or lookup is not supported
+        """
+        query = self._clone()
+        query._add_conditions(kwargs)
+        return query
+
+    def only(self, *fields):
+        # type: (*str) -> PartQuery
+        """Return a new query that retrieves only the given fields of the parts, eg. 'name' and 'parent'.
+
+        The fields that the conditions evaluated by pykechain need are retrieved as well. Other attributes of the
+        parts are retrieved for a single part on first access, see :meth:`pykechain.Client.parts`.
+
+        :return: :class:`PartQuery`
+        """
+        query = self._clone()
+        query._fields = list(fields)
+        return query
+
+    def limit(self, limit):
+        # type: (int) -> PartQuery
+        """Return a new query that stops after a number of parts.
+
+        :return: :class:`PartQuery`
+        """
+        query = self._clone()
+        query._limit = limit
+        return query
+
+    def _plan(self):
+        # type: () -> Tuple[Dict[str, Any], List[Tuple[Tuple[str, str], Any]], Optional[List[str]]]
+        """Split the conditions in the arguments for the api and the conditions to evaluate on the parts.
+
+        Only a single `in` condition is sent to the api, as its values are split over requests (see
+        :meth:`_iter_server`). Other `in` conditions are evaluated on the parts.
+
+        :return: the arguments of `Client.iter_parts`, the conditions to evaluate and the fields to retrieve
+        """
+        server, client = {}, []  # type: Dict[str, Any], List[Tuple[Tuple[str, str], Any]]
+        for (field, lookup), value in self._conditions:
+            argument = SERVER_FILTERS.get((field, lookup))
+            if lookup == 'in' and any(a.endswith('__in') for a in server):
+                argument = None
+            if argument is not None and argument not in server:
+                server[argument] = [_normalise(v) for v in value] if lookup == 'in' else _normalise(value)
+            else:
+                client.append(((field, lookup), value))
+        server.setdefault('category', None)
+
+        fields = None
+        if self._fields is not None:
+            fields = list(self._fields)
+            for (field, _), _ in client:
+                needed = 'properties' if field.startswith('properties__') else field
+                if needed not in fields:
+                    fields.append(needed)
+        return server, client, fields
+
+    def __iter__(self):
+        # type: () -> Iterator[Any]
+        server, client, fields = self._plan()
+
+        if not client:
+            return self._iter_server(server, fields, limit=self._limit)
+
+        return islice(self._evaluate(self._iter_server(server, fields), client), self._limit)
+
+    def _iter_server(self, server, fields, limit=None):
+        # type: (Dict[str, Any], Optional[List[str]], Optional[int]) -> Iterator[Any]
+        """Iterate over the parts that fit the conditions of the api.
+
+        The values of an `in` condition (eg. `id__in`) are split over as few requests as possible, keeping the url
+        of every request below the maximum url length, see :meth:`pykechain.Client._iter_parts_in`.
+        """
+        arguments = dict(server)
+        in_argument = next((a for a in arguments if a.endswith('__in')), None)
+        if in_argument is None:
+            return self._client.iter_parts(limit=limit, batch=self._batch, fields=fields, **arguments)
+
+        values = arguments.pop(in_argument)
+        parts = self._client._iter_parts_in(in_argument[:-len('__in')], values, batch=self._batch, fields=fields,
+                                            **arguments)
+        return islice(parts, limit)
+
+    def _evaluate(self, parts, conditions):
+        # type: (Iterator[Any], List[Tuple[Tuple[str, str], Any]]) -> Iterator[Any]
+        """Yield the parts that fit the conditions, evaluated per page of parts."""
+        while True:
+            page = PartSet(islice(parts, self._batch))
+            if not len(page):
+                return
+            for (field, lookup), value in conditions:
+                page = page.filter(**{'{}__{}'.format(field, lookup): value})
+            for part in page:
+                yield part
+
+    def all(self):
+        # type: () -> PartSet
+        """Retrieve the parts of the query.
+
+        :return: :class:`pykechain.models.PartSet`
+        """
+        return PartSet(self)
+
+    def first(self):
+        # type: () -> Optional[Any]
+        """Retrieve the first part of the query, or None when no part fits the query."""
+        return next(iter(self.limit(1)), None)
+
+    def count(self):
+        # type: () -> int
+        """Count the parts of the query.
+
+        When all conditions run in the api (other than an `in` condition), the parts are counted with
+        :meth:`pykechain.Client.count_parts` without retrieving them. Otherwise the parts are retrieved and counted.
+
+        :return: the number of parts
+        """
+        server, client, _ = self._plan()
+        if client or any(argument.endswith('__in') for argument in server):
+            return sum(1 for _ in self)
+
+        count = self._client.count_parts(**server)
+        return min(count, self._limit) if self._limit else count
+
+    def explain(self):
+        # type: () -> str
+        """Describe where every condition of the query is evaluated: in the api or by pykechain.
+
+        :return: a description with a line for the conditions of the api, the conditions evaluated by pykechain,
+                 the retrieved fields (next to the id and category) and the limit
+        """
+        server, client, fields = self._plan()
+
+        lines = [
+            'api:    ' + (', '.join('{} = {!r}'.format(argument, value) for argument, value in sorted(server.items())
+                                    if value is not None) or '-'),
+            'client: ' + (', '.join('{}__{} = {!r}'.format(field, lookup, value) if lookup != 'exact' else
+                                    '{} = {!r}'.format(field, value) for (field, lookup), value in client) or '-'),
+            'fields: ' + (', '.join(fields) if fields is not None else 'all'),
+        ]
+        if self._limit:
+            lines.append('limit:  {} ({})'.format(self._limit, 'client' if client else 'api'))
+        return '\n'.join(lines)
@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+from email.utils import parsedate_tz, mktime_tz
+from typing import Any, Iterable, Optional  # flake8: noqa
+
+import requests
+
+
+class RetryPolicy(object):
+    """The policy of a :class:`pykechain.Client` to retry requests that failed because KE-chain is (too) busy.
+
+    A request is retried when the response has one of the `statuses` (by default 429 Too Many Requests, 502 Bad
+    Gateway, 503 Service Unavailable and 504 Gateway Timeout) or when the connection failed, up to a maximum
+    number of attempts in total. Only idempotent requests are retried by default. Between the attempts the client
+    waits the time requested by the `Retry-After` header of the response or otherwise an exponentially growing
+    backoff time with random jitter.
+
+    The number of attempts and the total backoff time of the last request are recorded on the client as
+    `client.last_attempts` and `client.last_backoff`; the totals over all requests are kept in `retries` and `backoff`
+    of the policy.
+
+    :ivar retries: total number of retried requests
+    :ivar backoff: total time (in seconds) waited before retrying requests
+
+    Example
+    -------
+    >>> client = Client(url='https://default.localhost:9443', retry=RetryPolicy(max_attempts=5, backoff_factor=1.0))
+    >>> parts = client.parts(batch=1000)
+    >>> client.retry.retries, client.retry.backoff
+    (2, 3.1)
+
+    """
+
+    IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE', 'TRACE')
+    RETRY_STATUSES = (requests.codes.too_many_requests, requests.codes.bad_gateway,
+                      requests.codes.service_unavailable, requests.codes.gateway_timeout)
+
+    def __init__(self, max_attempts=3, backoff_factor=0.5, max_backoff=60, jitter=True, statuses=RETRY_STATUSES,
+                 methods=IDEMPOTENT_METHODS):
+        # type: (int, float, float, bool, Iterable[int], Iterable[str]) -> None
+        """Create a retry policy.
+
+        :param max_attempts: maximum number of attempts of a request, including the first attempt (defaults to 3)
+        :param backoff_factor: backoff time in seconds before the first retry, doubled for every next retry
+                               (defaults to 0.5 seconds)
+        :param max_backoff: maximum backoff time in seconds between two attempts, also when a longer time is
+                            requested by the `Retry-After` header (defaults to 60 seconds)
+        :param jitter: if to randomise the exponential backoff time between 50% and 100% of its value, to avoid
+                       that concurrent clients retry simultaneously (defaults to True)
+        :param statuses: the response status codes to retry
+        :param methods: the request methods to retry (defaults to the idempotent methods)
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.retries = 0
+        self.backoff = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self):  # pragma: no cover
+        return "<pyke {} max_attempts {}>".format(self.__class__.__name__, self.max_attempts)
+
+    def is_retryable(self, method, attempt, response=None):
+        # type: (str, int, Optional[requests.Response]) -> bool
+        """Return True if the request should be retried after the attempt.
+
+        :param method: the method of the request
+        :param attempt: the number of the attempt that was just made (starting at 1)
+        :param response: the response of the attempt, or None when the connection failed
+        """
+        if attempt >= self.max_attempts or method.upper() not in self.methods:
+            return False
+        return response is None or response.status_code in self.statuses
+
+    def backoff_time(self, attempt, response=None):
+        # type: (int, Optional[requests.Response]) -> float
+        """Return the time in seconds to wait before the next attempt.
+
+        :param attempt: the number of the attempt that was just made (starting at 1)
+        :param response: the response of the attempt, or None when the connection failed
+        """
+        retry_after = self._retry_after(response)
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        backoff = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        if self.jitter:
+            backoff *= random.uniform(0.5, 1.0)
+        return backoff
+
+    @staticmethod
+    def _retry_after(response):
+        # type: (Optional[requests.Response]) -> Optional[float]
+        """Return the number of seconds requested in the `Retry-After` header, given in seconds or as a date."""
+        value = response.headers.get('Retry-After') if response is not None else None
+        if not value:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            parsed_date = parsedate_tz(value)
+            if parsed_date is None:
+                return None
+            return max(mktime_tz(parsed_date) - time.time(), 0.0)
+
+    def record(self, attempts, backoff):
+        # type: (int, float) -> None
+        """Add the retries and backoff time of a request to the totals of this policy."""
+        with self._lock:
+            self.retries += attempts - 1
+            self.backoff += backoff
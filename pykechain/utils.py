@@ -1,7 +1,27 @@
-from typing import TypeVar, Iterable, Callable, Optional  # flake8: noqa
+import time
+from typing import TypeVar, Iterable, Callable, Optional, Any, Dict  # flake8: noqa
 
 T = TypeVar('T')
 
+# clock to measure durations with, that is not affected by changes of the system time (falls back on python 2.7)
+monotonic = getattr(time, 'monotonic', time.time)  # type: Callable[[], float]
+
+
+# canonical copies of the frequently repeated strings of the retrieved json, eg. the category of a part
+_interned_strings = {}  # type: Dict[Any, Any]
+
+
+def intern_string(value):
+    # type: (Optional[T]) -> Optional[T]
+    """Return a canonical copy of a string, so it is shared by all objects that hold an equal string.
+
+    Only use this for strings with a limited number of distinct values, such as categories and types. Both byte and
+    unicode strings are supported (unlike `intern()` on python 2.7).
+    """
+    if value is None:
+        return None
+    return _interned_strings.setdefault(value, value)
+
 
 def find(iterable, predicate):
     # type: (Iterable[T], Callable[[T], bool]) -> Optional[T]
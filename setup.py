@@ -89,6 +89,15 @@ setup(
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=['requests', 'envparse', 'typing', 'six', 'jsonschema'],
 
+    # Optional dependencies, eg. `pip install pykechain[async]` for the asynchronous client (python 3.6+)
+    extras_require={
+        'async': ['aiohttp>=3.3'],
+        'fastjson': ['orjson; python_version >= "3.6"', 'ujson; python_version < "3.6"'],
+        'numpy': ['numpy'],
+        'pandas': ['pandas'],
+        'arrow': ['pyarrow'],
+    },
+
     setup_requires=['pytest-runner'],
     tests_require=['pytest', 'pytz', 'betamax', 'six'],
 
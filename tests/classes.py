@@ -1,8 +1,15 @@
+import json
+import time
+import uuid
 from unittest import TestCase
 
 import os
+import requests
 import six
 from betamax import Betamax
+from betamax.matchers import URIMatcher
+from requests.adapters import BaseAdapter
+from six.moves.urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
 if six.PY2:
     from test.test_support import EnvironmentVarGuard
@@ -12,10 +19,44 @@ elif six.PY3:
 from pykechain import Client
 from tests.utils import TEST_TOKEN, TEST_URL, TEST_SCOPE_NAME
 
+class SingleLookupURIMatcher(URIMatcher):
+    """Match the uri of a request, replaying the recorded list requests of the single object lookups of the client.
+
+    The single object lookups of the client retrieve at most two objects from the list endpoint (eg.
+    `client.scope(name=...)` with `limit=2`) or a single object from the detail endpoint (eg. `client.part(pk=...)`).
+    The cassettes hold the responses of the list requests of these lookups without a limit, or with the id as
+    filter, which hold the same results in the same `results` envelope: these responses are replayed.
+    """
+
+    name = 'single-lookup-uri'
+
+    def match(self, request, recorded_request):
+        if super(SingleLookupURIMatcher, self).match(request, recorded_request):
+            return True
+
+        url, recorded_url = urlparse(request.url), urlparse(recorded_request['uri'])
+        query = parse_qs(url.query, keep_blank_values=True)
+        recorded_query = parse_qs(recorded_url.query, keep_blank_values=True)
+
+        if query.pop('limit', None) == ['2']:
+            # a lookup on the list endpoint, recorded with the default page size
+            recorded_query.pop('limit', None)
+            return url.path == recorded_url.path and query == recorded_query
+
+        resource, _, detail = url.path.rpartition('/')
+        if request.method == 'GET' and not query and detail.endswith('.json'):
+            # a lookup on the detail endpoint, recorded as a lookup on the id on the list endpoint
+            return recorded_url.path == resource + '.json' and recorded_query.get('id') == [detail[:-len('.json')]]
+        return False
+
+
+Betamax.register_request_matcher(SingleLookupURIMatcher)
+
 with Betamax.configure() as config:
     config.cassette_library_dir = os.path.join(os.path.dirname(__file__), 'cassettes')
     config.define_cassette_placeholder('<API_URL>', TEST_URL)
     config.define_cassette_placeholder('<AUTH_TOKEN>', TEST_TOKEN)
+    config.default_cassette_options['match_requests_on'] = ['method', SingleLookupURIMatcher.name]
 
 
 class TestBetamax(TestCase):
@@ -50,3 +91,129 @@ class TestBetamax(TestCase):
         else:
             return super(__class__, self).assertRaisesRegex(expected_exception, expected_regex,
                                                             *args, **kwargs)
+
+
+class FakeKechainAdapter(BaseAdapter):
+    """A requests transport adapter that serves the paginated `/parts` api from an in-memory list of part json.
+
+    Used to test the client without recorded cassettes. All handled requests are kept in `requests` and their
+    timeouts in `timeouts`. Every response is delayed with `delay` seconds. The detail api of a single object and
+    the `fields` parameter to select fields (eg. `id,name,properties.value`) are supported as well.
+    Other list apis (eg. `/activities`) are served from the json in `resources`, eg. `{'activities': [...]}`.
+    Set `report_count` to False to leave out the total count of the paginated responses.
+    """
+
+    def __init__(self, parts, delay=0, resources=None):
+        super(FakeKechainAdapter, self).__init__()
+        self.parts = parts
+        self.resources = resources or {}
+        self.report_count = True
+        self.delay = delay
+        self.requests = []
+        self.timeouts = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        self.timeouts.append(kwargs.get('timeout'))
+        time.sleep(self.delay)
+
+        if request.method != 'GET':
+            return self._response(request, {'results': []})
+
+        url = urlparse(request.url)
+        query = dict((k, v[0]) for k, v in parse_qs(url.query).items())
+        limit = int(query.pop('limit', 100))
+        offset = int(query.pop('offset', 0))
+        fields = query.pop('fields', None)
+
+        resource, _, detail_id = url.path.split('/api/')[-1].rpartition('/')
+        detail_id = detail_id[:-len('.json')]
+        if resource:
+            if resource == 'parts':
+                collection = self.parts
+            elif resource == 'properties':
+                collection = [prop for p in self.parts for prop in p['properties']]
+            else:
+                collection = self.resources.get(resource, [])
+            results = [obj for obj in collection if obj['id'] == detail_id]
+            return self._response(request, {'results': results}, 200 if results else 404)
+
+        collection = self.parts if detail_id == 'parts' else self.resources.get(detail_id, [])
+        results = [p for p in collection if self._matches(p, query)]
+        page = [self._select(p, fields) for p in results[offset:offset + limit]]
+
+        next_url = None
+        if offset + limit < len(results):
+            next_query = dict(query, limit=limit, offset=offset + limit)
+            next_url = urlunparse(url._replace(query=urlencode(sorted(next_query.items()))))
+
+        data = {'count': len(results), 'next': next_url, 'previous': None, 'results': page}
+        if not self.report_count:
+            del data['count']
+        return self._response(request, data)
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def _select(part, fields):
+        if fields is None:
+            return part
+
+        fields = fields.split(',')
+        selected = dict((key, value) for key, value in part.items() if key in fields)
+        property_fields = [field.split('.', 1)[1] for field in fields if field.startswith('properties.')]
+        if property_fields:
+            selected['properties'] = [dict((key, value) for key, value in prop.items() if key in property_fields)
+                                      for prop in part['properties']]
+        return selected
+
+    @staticmethod
+    def _matches(part, query):
+        for key, value in query.items():
+            field, is_in = (key[:-len('__in')], True) if key.endswith('__in') else (key, False)
+            attribute = part.get(field)
+            if isinstance(attribute, dict):
+                attribute = attribute.get('id')
+            if (attribute not in value.split(',')) if is_in else (attribute != value):
+                return False
+        return True
+
+    @staticmethod
+    def _response(request, data, status_code=200):
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers['Content-Type'] = 'application/json'
+        response._content = json.dumps(data).encode('utf-8')
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def make_part_json(name, category='INSTANCE', parent_id=None, model_id=None, properties=None):
+    """Create the json of a part as it is provided by the KE-chain api."""
+    part_id = str(uuid.uuid4())
+    for prop in properties or []:
+        prop.setdefault('part', part_id)
+        prop.setdefault('category', category)
+
+    return {
+        'id': part_id,
+        'name': name,
+        'category': category,
+        'parent': {'id': parent_id} if parent_id else None,
+        'model': {'id': model_id} if model_id else None,
+        'multiplicity': 'ZERO_MANY',
+        'properties': properties or []
+    }
+
+
+class TestOffline(TestCase):
+    """Test the client against the `FakeKechainAdapter` with a set of parts."""
+
+    parts_json = []  # type: list
+
+    def setUp(self):
+        self.client = Client(url=TEST_URL)
+        self.adapter = FakeKechainAdapter(self.parts_json)
+        self.client.session.mount(TEST_URL, self.adapter)
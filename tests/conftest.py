@@ -0,0 +1,7 @@
+import sys
+
+# the asynchronous client uses python 3.6+ syntax (async generators and comprehensions), which cannot be compiled
+# by the older python versions that pykechain supports
+collect_ignore = []
+if sys.version_info < (3, 6):
+    collect_ignore.append('test_async_client.py')
@@ -0,0 +1,196 @@
+import uuid
+from unittest import TestCase
+
+import pytest
+import requests
+
+# the module is not collected on python < 3.6, see `conftest.py`
+aiohttp = pytest.importorskip('aiohttp')
+
+import asyncio  # noqa: E402
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from pykechain.async_client import AsyncClient, AsyncPart, AsyncScope  # noqa: E402
+from pykechain.cache import ResponseCache  # noqa: E402
+from pykechain.codec import JSONCodec  # noqa: E402
+from pykechain.exceptions import MultipleFoundError  # noqa: E402
+from pykechain.models import PartSet, PartGraph  # noqa: E402
+from pykechain.retry import RetryPolicy  # noqa: E402
+from tests.classes import FakeKechainAdapter, make_part_json  # noqa: E402
+from tests.test_retry import BusyKechainAdapter  # noqa: E402
+
+BIKE_JSON = make_part_json('Bike', properties=[
+    {'id': str(uuid.uuid4()), 'name': 'Gears', 'value': 10, 'property_type': 'INTEGER_VALUE'}])
+WHEELS_JSON = [make_part_json('Wheel {}'.format(i), parent_id=BIKE_JSON['id']) for i in range(12)]
+
+
+class TestAsyncClient(TestCase):
+    """Run the async client against the `FakeKechainAdapter` served over http by aiohttp."""
+
+    parts_json = [BIKE_JSON] + WHEELS_JSON
+
+    def setUp(self):
+        self.adapter = FakeKechainAdapter(self.parts_json)
+        self.loop = asyncio.new_event_loop()
+
+        async def handler(request):
+            prepared = requests.Request(request.method, str(request.url)).prepare()
+            response = self.adapter.send(prepared)
+            return web.Response(body=response.content, status=response.status_code, content_type='application/json')
+
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', handler)
+        self.server = TestServer(app)
+        self.run_until_complete(self.server.start_server())
+
+        self.client = AsyncClient(url=str(self.server.make_url('/')))
+
+    def tearDown(self):
+        self.run_until_complete(self.client.close())
+        self.run_until_complete(self.server.close())
+        self.loop.close()
+
+    def run_until_complete(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def collect(self, async_iterator):
+        async def _collect():
+            return [item async for item in async_iterator]
+        return self.run_until_complete(_collect())
+
+    def test_parts(self):
+        parts = self.run_until_complete(self.client.parts(batch=5))
+
+        self.assertIsInstance(parts, PartSet)
+        self.assertEqual(len(parts), 13)
+        self.assertTrue(all(isinstance(p, AsyncPart) for p in parts))
+        self.assertEqual(len(self.adapter.requests), 3)
+
+    def test_iter_parts_respects_limit(self):
+        parts = self.collect(self.client.iter_parts(batch=5, limit=7))
+
+        self.assertEqual(len(parts), 7)
+        self.assertEqual(len(self.adapter.requests), 2)
+
+    def test_part_navigation(self):
+        bike = self.run_until_complete(self.client.part(name='Bike'))
+        wheel = self.run_until_complete(self.client.part(name='Wheel 3'))
+
+        self.assertEqual(len(self.run_until_complete(bike.children())), 12)
+        self.assertEqual(self.run_until_complete(wheel.parent()).id, bike.id)
+        self.assertEqual(len(self.run_until_complete(wheel.siblings())), 12)
+        self.assertIsNone(self.run_until_complete(bike.parent()))
+
+    def test_concurrent_requests_share_session(self):
+        async def gather():
+            return await asyncio.gather(*[self.client.part(name='Wheel {}'.format(i)) for i in range(12)])
+
+        wheels = self.run_until_complete(gather())
+
+        self.assertEqual([w.name for w in wheels], ['Wheel {}'.format(i) for i in range(12)])
+        self.assertEqual(len(self.adapter.requests), 12)
+
+    def test_part_multiple_found(self):
+        with self.assertRaises(MultipleFoundError):
+            self.run_until_complete(self.client.part())
+
+    def test_count_parts(self):
+        self.assertEqual(self.run_until_complete(self.client.count_parts(parent=BIKE_JSON['id'])), 12)
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_count_parts_without_count(self):
+        self.adapter.report_count = False
+
+        self.assertEqual(self.run_until_complete(self.client.count_parts()), 13)
+
+    def test_iter_properties(self):
+        self.adapter.resources['properties'] = BIKE_JSON['properties']
+
+        properties = self.collect(self.client.iter_properties(batch=10))
+
+        self.assertEqual([p.name for p in properties], ['Gears'])
+
+    def test_synchronous_methods_are_refused(self):
+        bike = self.run_until_complete(self.client.part(name='Bike'))
+        prop = bike.property('Gears')
+        requests_made = len(self.adapter.requests)
+
+        with self.assertRaises(TypeError):
+            prop.value = 12
+        with self.assertRaises(NotImplementedError):
+            self.client.parts_query(name='Bike')
+        with self.assertRaises(NotImplementedError):
+            bike.subtree()
+        with self.assertRaises(NotImplementedError):
+            self.client.batch()
+
+        self.assertEqual(len(self.adapter.requests), requests_made)
+
+    def test_synchronous_options_are_refused(self):
+        for option in ('prefetch', 'deadline', 'max_workers', 'progress'):
+            with self.assertRaises(TypeError):
+                self.run_until_complete(self.client.parts(**{option: 1}))
+            with self.assertRaises(TypeError):
+                self.collect(self.client.iter_parts(**{option: 1}))
+
+        self.assertEqual(len(self.adapter.requests), 0)
+
+    def test_parts_with_fields(self):
+        parts = self.run_until_complete(self.client.parts(fields=['name']))
+
+        self.assertEqual(len(parts), 13)
+        self.assertTrue(all(p._partial for p in parts))
+        self.assertIn('fields=', self.adapter.requests[0].url)
+
+    def test_part_graph(self):
+        bucket_id = str(uuid.uuid4())
+        self.adapter.parts = [dict(p, bucket={'id': bucket_id}) for p in self.parts_json]
+        scope = AsyncScope({'id': str(uuid.uuid4()), 'name': 'Bike Project', 'bucket': {'id': bucket_id}},
+                           client=self.client)
+
+        graph = self.run_until_complete(scope.part_graph())
+
+        self.assertIsInstance(graph, PartGraph)
+        self.assertEqual(len(graph), 13)
+        self.assertEqual(len(graph.children(graph.get(name='Bike'))), 12)
+        self.assertTrue(all(p._graph is None for p in graph))
+
+    def test_last_request(self):
+        self.run_until_complete(self.client.part(name='Bike'))
+
+        self.assertEqual(self.client.last_request.method, 'GET')
+        self.assertIn('name=Bike', self.client.last_request.url)
+
+    def test_response_uses_codec(self):
+        class CountingCodec(JSONCodec):
+            decoded = 0
+
+            def loads(self, data):
+                CountingCodec.decoded += 1
+                return super(CountingCodec, self).loads(data)
+
+        self.client.codec = CountingCodec()
+        self.run_until_complete(self.client.part(name='Bike'))
+
+        self.assertTrue(CountingCodec.decoded > 0)
+        self.assertIs(self.client.last_response._codec, self.client.codec)
+
+    def test_response_cache(self):
+        self.client.cache = ResponseCache()
+
+        self.run_until_complete(self.client.part(name='Bike'))
+        self.run_until_complete(self.client.part(name='Bike'))
+
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertEqual(self.client.last_attempts, 0)
+
+    def test_retry_busy_responses(self):
+        self.adapter = BusyKechainAdapter(self.parts_json, [(503, {}), (429, {'Retry-After': '0'})])
+        self.client.retry = RetryPolicy(max_attempts=3, backoff_factor=0.001, jitter=False)
+
+        bike = self.run_until_complete(self.client.part(name='Bike'))
+
+        self.assertEqual(bike.name, 'Bike')
+        self.assertEqual(self.client.last_attempts, 3)
+        self.assertEqual(self.client.retry.retries, 2)
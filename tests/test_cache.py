@@ -0,0 +1,85 @@
+import time
+from unittest import TestCase
+
+from pykechain import Client
+from pykechain.cache import ResponseCache, resource_of
+from tests.classes import TestOffline, make_part_json
+from tests.utils import TEST_URL
+
+
+class TestResponseCache(TestCase):
+    def test_resource_of_url(self):
+        self.assertEqual(resource_of('http://localhost:8000/api/parts.json'), 'parts')
+        self.assertEqual(resource_of('http://localhost:8000/api/parts/1234.json?limit=10'), 'parts')
+        self.assertEqual(resource_of('http://localhost:8000/api/properties/1234/upload'), 'properties')
+        self.assertIsNone(resource_of('http://localhost:8000/admin/'))
+
+    def test_key_is_normalised(self):
+        self.assertEqual(ResponseCache.key('http://localhost/api/parts.json?limit=5', {'name': 'Bike', 'id': None}),
+                         ResponseCache.key('http://localhost/api/parts.json', {'limit': 5, 'name': 'Bike'}))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ResponseCache(maxsize=2)
+        cache.set('http://localhost/api/parts.json', {'name': 'a'}, 'a')
+        cache.set('http://localhost/api/parts.json', {'name': 'b'}, 'b')
+        cache.get('http://localhost/api/parts.json', {'name': 'a'})
+        cache.set('http://localhost/api/parts.json', {'name': 'c'}, 'c')
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('http://localhost/api/parts.json', {'name': 'a'}), 'a')
+        self.assertIsNone(cache.get('http://localhost/api/parts.json', {'name': 'b'}))
+
+    def test_expired_response_is_not_returned(self):
+        cache = ResponseCache(ttl=0.01)
+        cache.set('http://localhost/api/parts.json', None, 'a')
+        time.sleep(0.02)
+
+        self.assertIsNone(cache.get('http://localhost/api/parts.json'))
+        self.assertEqual(cache.stats, {'hits': 0, 'misses': 1, 'size': 0})
+
+    def test_invalidate_related_resources(self):
+        cache = ResponseCache()
+        cache.set('http://localhost/api/parts.json', None, 'parts')
+        cache.set('http://localhost/api/scopes.json', None, 'scopes')
+
+        cache.invalidate('http://localhost/api/properties/1234.json')
+
+        self.assertIsNone(cache.get('http://localhost/api/parts.json'))
+        self.assertEqual(cache.get('http://localhost/api/scopes.json'), 'scopes')
+
+    def test_activity_writes_invalidate_parts(self):
+        cache = ResponseCache()
+        cache.set('http://localhost/api/parts.json', {'activity_id': '1234'}, 'parts')
+
+        cache.invalidate('http://localhost/api/activities/1234.json')
+
+        self.assertIsNone(cache.get('http://localhost/api/parts.json', {'activity_id': '1234'}))
+
+
+class TestClientCache(TestOffline):
+    parts_json = [make_part_json('Bike'), make_part_json('Wheel')]
+
+    def setUp(self):
+        super(TestClientCache, self).setUp()
+        self.client = Client(url=TEST_URL, cache=ResponseCache())
+        self.client.session.mount(TEST_URL, self.adapter)
+
+    def test_repeated_get_is_cached(self):
+        for _ in range(3):
+            self.assertEqual(self.client.part(name='Bike').name, 'Bike')
+
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertEqual(self.client.cache.stats, {'hits': 2, 'misses': 1, 'size': 1})
+
+    def test_write_invalidates_resource(self):
+        bike = self.client.part(name='Bike')
+        bike.edit(name='Bike')
+        self.client.part(name='Bike')
+
+        self.assertEqual([r.method for r in self.adapter.requests], ['GET', 'PUT', 'GET'])
+
+    def test_login_clears_cache(self):
+        self.client.part(name='Bike')
+        self.client.login(token='123123')
+
+        self.assertEqual(len(self.client.cache), 0)
@@ -1,16 +1,21 @@
+import uuid
 from unittest import TestCase
 
 import six
 import warnings
+from multiprocessing.pool import ThreadPool
 
 if six.PY2:
     from test.test_support import EnvironmentVarGuard
 elif six.PY3:
     from test.support import EnvironmentVarGuard
 
+from pykechain import client as client_module
 from pykechain.client import Client
-from pykechain.exceptions import ForbiddenError, ClientError
-from tests.classes import TestBetamax
+from pykechain.exceptions import ForbiddenError, ClientError, DeadlineExceededError, MultipleFoundError, \
+    NotFoundError
+from tests.classes import TestBetamax, TestOffline, make_part_json
+from tests.utils import TEST_URL
 
 
 class TestClient(TestCase):
@@ -83,3 +88,274 @@ class TestClientLive(TestBetamax):
 
         with self.assertRaises(ForbiddenError):
             self.client.parts()
+
+
+BIKE_JSON = make_part_json('Bike', properties=[{'id': 'e5a1c4f6-gears', 'name': 'Gears', 'value': 10,
+                                                'property_type': 'INT_VALUE'}])
+FRAME_JSON = make_part_json('Frame', parent_id=BIKE_JSON['id'])
+
+
+class TestClientIdentityMap(TestOffline):
+    parts_json = [BIKE_JSON, FRAME_JSON]
+
+    def setUp(self):
+        super(TestClientIdentityMap, self).setUp()
+        self.client = Client(url=TEST_URL, identity_map=True)
+        self.client.session.mount(TEST_URL, self.adapter)
+
+    def tearDown(self):
+        BIKE_JSON['name'] = 'Bike'
+
+    def test_single_object_per_id(self):
+        bike = self.client.part(name='Bike')
+
+        self.assertIs(self.client.part(name='Bike'), bike)
+        self.assertIs(self.client.parts()[0], bike)
+        self.assertIs(self.client.part(name='Bike').property('Gears'), bike.property('Gears'))
+
+    def test_refresh_in_place(self):
+        bike = self.client.part(name='Bike')
+        BIKE_JSON['name'] = 'Racing Bike'
+
+        self.client.parts()
+
+        self.assertEqual(bike.name, 'Racing Bike')
+
+    def test_navigation_from_identity_map(self):
+        bike = self.client.part(name='Bike')
+        frame = self.client.part(name='Frame')
+        number_of_requests = len(self.adapter.requests)
+
+        self.assertIs(frame.parent(), bike)
+        self.assertIs(bike.property('Gears').part, bike)
+        self.assertEqual(len(self.adapter.requests), number_of_requests)
+
+    def test_weak_references(self):
+        self.client.parts()
+        self.assertEqual(len(self.client.identity_map), 0)
+
+        bike = self.client.part(name='Bike')
+        self.assertIn(bike.id, self.client.identity_map)
+        self.assertIn(bike.property('Gears').id, self.client.identity_map)
+
+    def test_refresh_live_property_in_place(self):
+        gears = self.client.part(name='Bike').property('Gears')
+        BIKE_JSON['properties'][0]['value'] = 12
+
+        try:
+            self.client.parts()
+            self.assertEqual(gears.value, 12)
+        finally:
+            BIKE_JSON['properties'][0]['value'] = 10
+
+    def test_no_identity_map_by_default(self):
+        client = Client(url=TEST_URL)
+        client.session.mount(TEST_URL, self.adapter)
+
+        self.assertIsNone(client.identity_map)
+        self.assertIsNot(client.part(name='Bike'), client.part(name='Bike'))
+
+
+class TestClientTimeouts(TestOffline):
+    parts_json = [make_part_json('Part {}'.format(i)) for i in range(10)]
+
+    def test_connection_pool_size(self):
+        client = Client(url=TEST_URL, pool_connections=2, pool_maxsize=32)
+        adapter = client.session.get_adapter(TEST_URL)
+
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+
+    def test_timeout_applied_to_requests(self):
+        self.client.timeout = (3.05, 27)
+
+        self.client.parts()
+
+        self.assertEqual(self.adapter.timeouts, [(3.05, 27)])
+
+    def test_deadline_shortens_timeout(self):
+        self.client.timeout = (3.05, 27)
+
+        self.client.parts(deadline=10)
+
+        connect_timeout, read_timeout = self.adapter.timeouts[0]
+        self.assertEqual(connect_timeout, 3.05)
+        self.assertTrue(9 < read_timeout <= 10)
+
+    def test_deadline_exceeded(self):
+        # a clock that advances 20 ms with every request, instead of waiting for the deadline
+        clock = [0.0]
+        send = self.adapter.send
+
+        def slow_send(request, **kwargs):
+            clock[0] += 0.02
+            return send(request, **kwargs)
+
+        self.adapter.send = slow_send
+        monotonic = client_module.monotonic
+        client_module.monotonic = lambda: clock[0]
+        self.addCleanup(setattr, client_module, 'monotonic', monotonic)
+
+        with self.assertRaises(DeadlineExceededError):
+            self.client.parts(batch=2, deadline=0.05)
+        self.assertEqual(len(self.adapter.requests), 3)
+
+
+class TestClientThreadSafety(TestOffline):
+    parts_json = [make_part_json('Part {}'.format(i)) for i in range(8)]
+
+    def test_last_request_per_thread(self):
+        def retrieve(name):
+            self.client.part(name=name)
+            return self.client.last_response.json()['results'][0]['name']
+
+        names = ['Part {}'.format(i) for i in range(8)] * 4
+        pool = ThreadPool(8)
+        try:
+            self.assertEqual(pool.map(retrieve, names), names)
+        finally:
+            pool.terminate()
+
+        self.assertIsNone(self.client.last_response)
+
+
+class TestClientPagination(TestOffline):
+    parts_json = [make_part_json('Part {}'.format(i)) for i in range(25)]
+
+    def setUp(self):
+        super(TestClientPagination, self).setUp()
+        self.adapter.resources = {
+            'activities': [{'id': str(uuid.uuid4()), 'name': 'Task {}'.format(i), 'scope': 'project'}
+                           for i in range(25)],
+            'scopes': [{'id': str(uuid.uuid4()), 'name': 'Project {}'.format(i), 'status': 'ACTIVE'}
+                       for i in range(3)],
+        }
+
+    def test_activities_all_pages(self):
+        activities = self.client.activities(batch=10)
+
+        self.assertEqual(len(activities), 25)
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertEqual(activities[-1].name, 'Task 24')
+
+    def test_activities_limit(self):
+        activities = self.client.activities(limit=12, batch=5)
+
+        self.assertEqual([a.name for a in activities], ['Task {}'.format(i) for i in range(12)])
+        self.assertEqual(len(self.adapter.requests), 3)
+
+    def test_activities_concurrently(self):
+        activities = self.client.activities(batch=4, max_workers=4)
+
+        self.assertEqual([a.name for a in activities], ['Task {}'.format(i) for i in range(25)])
+
+    def test_iter_activities_is_lazy(self):
+        activities = self.client.iter_activities(batch=10)
+        self.assertEqual(len(self.adapter.requests), 0)
+
+        next(activities)
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_scopes_single_page_by_default(self):
+        self.assertEqual(len(self.client.scopes()), 3)
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertNotIn('limit', self.adapter.requests[0].url)
+
+    def test_progress(self):
+        reported = []
+
+        self.client.parts(batch=10, progress=lambda retrieved, total: reported.append((retrieved, total)))
+        self.assertEqual(reported, [(10, 25), (20, 25), (25, 25)])
+
+        del reported[:]
+        self.client.activities(limit=15, batch=10, progress=lambda retrieved, total: reported.append((retrieved, total)))
+        self.assertEqual(reported, [(10, 15), (15, 15)])
+
+
+class TestClientSingleObject(TestOffline):
+    parts_json = [make_part_json('Bolt') for _ in range(250)] + [make_part_json('Wheel', category='MODEL')]
+
+    def setUp(self):
+        super(TestClientSingleObject, self).setUp()
+        self.adapter.resources = {
+            'activities': [{'id': str(uuid.uuid4()), 'name': 'Task', 'scope': {'id': 'project', 'name': 'Project'}}],
+        }
+
+    def test_multiple_found_with_single_small_request(self):
+        with self.assertRaises(MultipleFoundError):
+            self.client.part(name='Bolt')
+
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertIn('limit=2', self.adapter.requests[0].url)
+
+    def test_single_found_by_name(self):
+        self.assertEqual(self.client.model(name='Wheel').name, 'Wheel')
+        self.assertIn('limit=2', self.adapter.requests[0].url)
+
+    def test_lookup_by_pk_uses_detail_endpoint(self):
+        bolt_id = self.parts_json[0]['id']
+
+        self.assertEqual(self.client.part(pk=bolt_id).id, bolt_id)
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertIn('/api/parts/{}.json'.format(bolt_id), self.adapter.requests[0].url)
+
+    def test_lookup_by_pk_checks_category(self):
+        wheel_id = self.parts_json[-1]['id']
+
+        with self.assertRaises(NotFoundError):
+            self.client.part(pk=wheel_id)
+        self.assertEqual(self.client.model(pk=wheel_id).id, wheel_id)
+        self.assertEqual(self.client.part(pk=wheel_id, category=None).id, wheel_id)
+        with self.assertRaises(NotFoundError):
+            self.client.model(pk=self.parts_json[0]['id'])
+
+    def test_lookup_by_unknown_pk(self):
+        with self.assertRaises(NotFoundError):
+            self.client.part(pk=str(uuid.uuid4()))
+
+    def test_activity_by_pk_and_scope(self):
+        task_id = self.adapter.resources['activities'][0]['id']
+
+        self.assertEqual(self.client.activity(pk=task_id, scope='project').name, 'Task')
+        with self.assertRaises(NotFoundError):
+            self.client.activity(pk=task_id, scope='other project')
+        self.assertTrue(all('/api/activities/' in request.url for request in self.adapter.requests))
+
+    def test_without_fast_lookups(self):
+        self.client.fast_lookups = False
+        bolt_id = self.parts_json[0]['id']
+
+        self.assertEqual(self.client.part(pk=bolt_id).id, bolt_id)
+        with self.assertRaises(MultipleFoundError):
+            self.client.part(name='Bolt')
+
+        self.assertTrue(all('/api/parts.json' in request.url for request in self.adapter.requests))
+        self.assertFalse(any('limit=2' in request.url for request in self.adapter.requests))
+
+
+class TestClientCount(TestOffline):
+    parts_json = [make_part_json('Bolt') for _ in range(250)] + [make_part_json('Wheel', category='MODEL')]
+
+    def test_count_parts(self):
+        self.assertEqual(self.client.count_parts(), 250)
+        self.assertEqual(self.client.count_parts(category=None), 251)
+        self.assertEqual(self.client.count_parts(name='Wheel'), 0)
+
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertTrue(all('limit=1' in request.url for request in self.adapter.requests))
+
+    def test_count_activities(self):
+        self.adapter.resources = {'activities': [{'id': str(i), 'name': 'Task', 'status': 'OPEN'} for i in range(7)]}
+
+        self.assertEqual(self.client.count_activities(status='OPEN'), 7)
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_count_without_total(self):
+        self.adapter.report_count = False
+
+        self.assertEqual(self.client.count_parts(), 250)
+        self.assertEqual(self.client.count_parts(name='Wheel', category='MODEL'), 1)
+        self.assertIn('fields=id', self.adapter.requests[1].url)
+
+    def test_part_set_count(self):
+        self.assertEqual(self.client.parts(name='Wheel', category=None).count(), 1)
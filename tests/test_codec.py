@@ -0,0 +1,86 @@
+from unittest import TestCase, skipIf
+
+from pykechain import Client
+from pykechain.codec import JSONCodec, OrjsonCodec, UjsonCodec, default_codec
+from tests.classes import TestOffline, make_part_json
+from tests.utils import TEST_URL
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class TestJSONCodecs(TestCase):
+    data = {'name': 'Bike', 'url': 'https://localhost/api/parts.json', 'gears': 10, 'ratio': 2.5, 'tags': [None, True]}
+
+    def assertRoundTrip(self, codec):
+        self.assertEqual(codec.loads(codec.dumps(self.data)), self.data)
+        self.assertEqual(codec.loads(codec.dumps(self.data).encode('utf-8')), self.data)
+        self.assertEqual(codec.loads(codec.dumps(self.data, indent=2)), self.data)
+        self.assertIn('\n  "', codec.dumps(self.data, indent=2))
+        self.assertIn('https://localhost', codec.dumps(self.data))
+
+    def test_standard_library(self):
+        self.assertRoundTrip(JSONCodec())
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        self.assertRoundTrip(OrjsonCodec())
+
+    @skipIf(ujson is None, "ujson is not installed")
+    def test_ujson(self):
+        self.assertRoundTrip(UjsonCodec())
+
+    def test_default_codec(self):
+        expected_name = 'orjson' if orjson else 'ujson' if ujson else 'json'
+        self.assertEqual(default_codec().name, expected_name)
+
+    def test_invalid_json(self):
+        for codec in (JSONCodec(), default_codec()):
+            with self.assertRaises(ValueError):
+                codec.loads(b'<html>')
+
+
+class TestClientCodec(TestOffline):
+    parts_json = [make_part_json('Bike', properties=[{'id': 'gears', 'name': 'Gears', 'value': 10,
+                                                      'property_type': 'INT_VALUE'},
+                                                     {'id': 'drawing', 'name': 'Drawing', 'value': None,
+                                                      'property_type': 'ATTACHMENT_VALUE'}])]
+
+    def test_codec_decodes_and_encodes(self):
+        class CountingCodec(JSONCodec):
+            decoded, encoded = 0, 0
+
+            def loads(self, data):
+                CountingCodec.decoded += 1
+                return super(CountingCodec, self).loads(data)
+
+            def dumps(self, obj, indent=None):
+                CountingCodec.encoded += 1
+                return super(CountingCodec, self).dumps(obj, indent=indent)
+
+        client = Client(url=TEST_URL, codec=CountingCodec())
+        client.session.mount(TEST_URL, self.adapter)
+
+        gears = client.part('Bike').property('Gears')
+        self.assertEqual(CountingCodec.decoded, 1)
+
+        client._request('PUT', client._build_url('property', property_id=gears.id), json={'value': 11})
+        self.assertEqual(CountingCodec.encoded, 1)
+        self.assertEqual(self.adapter.requests[-1].body, '{"value": 11}')
+        self.assertEqual(self.adapter.requests[-1].headers['Content-Type'], 'application/json')
+
+    def test_codec_encodes_json_attachments(self):
+        codec = JSONCodec()
+        codec.dumps = lambda obj, indent=None: 'encoded'
+        self.client.codec = codec
+
+        self.client.part('Bike').property('Drawing').upload({'gears': 10})
+
+        self.assertIn(b'encoded', self.adapter.requests[-1].body)
@@ -0,0 +1,215 @@
+from six.moves.urllib.parse import urlparse, parse_qs
+
+from pykechain import Client
+from pykechain.exceptions import NotFoundError, IllegalArgumentError
+from pykechain.identity_map import IdentityMap
+from pykechain.loader import PartLoader
+from tests.classes import TestOffline, make_part_json
+from tests.utils import TEST_URL
+
+WHEEL_MODEL_JSON = make_part_json('Wheel', category='MODEL')
+WHEELS_JSON = [make_part_json('Wheel {}'.format(i), model_id=WHEEL_MODEL_JSON['id']) for i in range(50)]
+
+MATERIAL_JSON = make_part_json('Aluminium')
+BIKE_JSON = make_part_json('Bike', properties=[{'id': 'b1ce4f6a-material', 'name': 'Material',
+                                                'property_type': 'REFERENCE_VALUE',
+                                                'value': {'id': MATERIAL_JSON['id']}}])
+FRONT_WHEEL_JSON = make_part_json('Front Wheel', parent_id=BIKE_JSON['id'], model_id=WHEEL_MODEL_JSON['id'])
+REAR_WHEEL_JSON = make_part_json('Rear Wheel', parent_id=BIKE_JSON['id'], model_id=WHEEL_MODEL_JSON['id'])
+SPOKE_JSON = make_part_json('Spoke', parent_id=FRONT_WHEEL_JSON['id'])
+
+
+class TestPartLoader(TestOffline):
+    parts_json = [WHEEL_MODEL_JSON] + WHEELS_JSON
+
+    def id_filters(self):
+        return [parse_qs(urlparse(r.url).query).get('id__in', [''])[0] for r in self.adapter.requests]
+
+    def test_batched_lookup(self):
+        with PartLoader(self.client) as loader:
+            pending_parts = [loader.load(wheel['id']) for wheel in reversed(WHEELS_JSON[:20])]
+
+        self.assertEqual(len(self.adapter.requests), 1)
+        self.assertEqual([p.result().name for p in pending_parts], [w['name'] for w in reversed(WHEELS_JSON[:20])])
+
+    def test_duplicate_ids_are_requested_once(self):
+        loader = PartLoader(self.client)
+        wheel_models = loader.load_many([WHEEL_MODEL_JSON['id']] * 3)
+
+        self.assertEqual(self.id_filters(), [WHEEL_MODEL_JSON['id']])
+        self.assertEqual(len(set(wheel_models)), 1)
+        self.assertEqual(wheel_models[0].category, 'MODEL')
+
+    def test_chunked_by_url_length(self):
+        loader = PartLoader(self.client, max_url_length=500)
+        wheels = loader.load_many([wheel['id'] for wheel in WHEELS_JSON])
+
+        self.assertEqual([w.id for w in wheels], [w['id'] for w in WHEELS_JSON])
+        self.assertGreater(len(self.adapter.requests), 1)
+        self.assertTrue(all(len(r.url) <= 500 for r in self.adapter.requests))
+        self.assertEqual(sum(len(ids.split(',')) for ids in self.id_filters()), len(WHEELS_JSON))
+
+    def test_result_dispatches_pending_lookups(self):
+        loader = PartLoader(self.client)
+        pending_wheel = loader.load(WHEELS_JSON[0]['id'])
+
+        self.assertEqual(len(self.adapter.requests), 0)
+        self.assertEqual(pending_wheel.result().name, 'Wheel 0')
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_missing_part(self):
+        loader = PartLoader(self.client)
+        pending_part = loader.load('does-not-exist')
+
+        with self.assertRaises(NotFoundError):
+            pending_part.result()
+
+    def test_live_parts_are_not_requested(self):
+        self.client = Client(url=TEST_URL, identity_map=True)
+        self.client.session.mount(TEST_URL, self.adapter)
+        wheel_model = self.client.model('Wheel')
+
+        loader = PartLoader(self.client)
+        wheel = loader.load_many([WHEEL_MODEL_JSON['id'], WHEELS_JSON[0]['id']])
+
+        self.assertIs(wheel[0], wheel_model)
+        self.assertEqual(self.id_filters()[-1], WHEELS_JSON[0]['id'])
+
+
+class TestBatchScope(TestOffline):
+    parts_json = [WHEEL_MODEL_JSON, MATERIAL_JSON, BIKE_JSON, FRONT_WHEEL_JSON, REAR_WHEEL_JSON, SPOKE_JSON]
+
+    def test_navigation_is_batched(self):
+        with self.client.batch():
+            wheels = self.client.parts(model=WHEEL_MODEL_JSON['id'])
+            self.assertEqual(len(self.adapter.requests), 1)
+
+            self.assertEqual([wheel.model().id for wheel in wheels], [WHEEL_MODEL_JSON['id']] * 2)
+            self.assertEqual([wheel.parent().name for wheel in wheels], ['Bike', 'Bike'])
+            self.assertEqual(len(self.adapter.requests), 3)
+
+        self.assertIsNone(self.client._batch_loader)
+        wheels[0].parent()
+        self.assertEqual(len(self.adapter.requests), 4)
+
+    def test_batch_objects_retrieved_before(self):
+        bike = self.client.part(name='Bike')
+        wheels = self.client.parts(parent=BIKE_JSON['id'])
+        number_of_requests = len(self.adapter.requests)
+
+        with self.client.batch(objects=list(wheels) + [bike]):
+            self.assertEqual(bike.property('Material').value.name, 'Aluminium')
+            self.assertEqual(wheels[1].model().name, 'Wheel')
+            self.assertEqual(wheels[0].model().name, 'Wheel')
+            self.assertEqual(len(self.adapter.requests), number_of_requests + 2)
+
+    def test_missing_related_part(self):
+        self.adapter.parts = [part for part in self.parts_json if part is not WHEEL_MODEL_JSON]
+
+        with self.client.batch():
+            wheels = self.client.parts(model=WHEEL_MODEL_JSON['id'])
+            for wheel in wheels:
+                with self.assertRaises(NotFoundError):
+                    wheel.model()
+        self.assertEqual(len(self.adapter.requests), 2)
+
+    def test_load_related(self):
+        wheel = self.client.part(name='Front Wheel')
+
+        loader = PartLoader(self.client)
+        pending_model, pending_parent = loader.load_model(wheel), loader.load_parent(wheel)
+
+        self.assertIsNone(loader.load_model(self.client.model(name='Wheel')))
+        self.assertEqual(pending_model.result().name, 'Wheel')
+        self.assertEqual(pending_parent.result().name, 'Bike')
+        self.assertEqual(len(self.adapter.requests), 3)
+        with self.assertRaises(IllegalArgumentError):
+            loader.load_related(wheel, 'grandparent')
+
+
+class TestPrefetchRelated(TestOffline):
+    parts_json = [WHEEL_MODEL_JSON, MATERIAL_JSON, BIKE_JSON, FRONT_WHEEL_JSON, REAR_WHEEL_JSON, SPOKE_JSON]
+
+    def test_prefetch_model_and_parent(self):
+        wheels = self.client.parts(name='Front Wheel', prefetch=['model', 'parent'])
+        self.assertEqual(len(self.adapter.requests), 2)
+
+        front_wheel = wheels[0]
+        self.assertEqual(front_wheel.model().id, WHEEL_MODEL_JSON['id'])
+        self.assertEqual(front_wheel.parent().name, 'Bike')
+        self.assertEqual(len(self.adapter.requests), 2)
+
+    def test_prefetch_references(self):
+        bike = self.client.parts(name='Bike', prefetch=['references'])[0]
+        number_of_requests = len(self.adapter.requests)
+
+        self.assertEqual(bike.property('Material').value.name, 'Aluminium')
+        self.assertEqual(len(self.adapter.requests), number_of_requests)
+
+    def test_prefetch_children(self):
+        parts = self.client.parts(prefetch=['children'])
+        self.assertEqual(len(self.adapter.requests), 2)
+
+        children = dict((part.name, sorted(child.name for child in part.children())) for part in parts)
+        self.assertEqual(children['Bike'], ['Front Wheel', 'Rear Wheel'])
+        self.assertEqual(children['Front Wheel'], ['Spoke'])
+        self.assertEqual(children['Rear Wheel'], [])
+        self.assertEqual(len(self.adapter.requests), 2)
+
+    def test_prefetch_children_reuses_parts(self):
+        parts = self.client.parts(prefetch=['children'])
+        bike, front_wheel = parts.get(name='Bike'), parts.get(name='Front Wheel')
+
+        self.assertIs(bike.children().get(name='Front Wheel'), front_wheel)
+        self.assertIs(front_wheel.parent(), bike)
+        self.assertEqual(parse_qs(urlparse(self.adapter.requests[1].url).query)['fields'], ['id,category,parent'])
+
+    def test_prefetch_children_retrieves_missing_children(self):
+        bike = self.client.parts(name='Bike', prefetch=['children'])[0]
+
+        self.assertEqual(len(self.adapter.requests), 2)
+        self.assertEqual(sorted(child.name for child in bike.children()), ['Front Wheel', 'Rear Wheel'])
+        self.assertFalse(any(child._partial for child in bike.children()))
+
+    def test_prefetch_with_identity_map(self):
+        self.client.identity_map = IdentityMap()
+
+        parts = self.client.parts(prefetch=['model', 'children'])
+        number_of_requests = len(self.adapter.requests)
+        front_wheel = parts.get(name='Front Wheel')
+
+        self.assertEqual(front_wheel.model().id, WHEEL_MODEL_JSON['id'])
+        self.assertIs(parts.get(name='Bike').children().get(name='Front Wheel'), front_wheel)
+        self.assertFalse(front_wheel._partial)
+        self.assertEqual(len(self.adapter.requests), number_of_requests)
+
+    def test_prefetch_unknown_relation(self):
+        with self.assertRaises(IllegalArgumentError):
+            self.client.parts(prefetch=['grandparents'])
+
+
+class TestPartTree(TestOffline):
+    parts_json = [MATERIAL_JSON, BIKE_JSON, FRONT_WHEEL_JSON, REAR_WHEEL_JSON, SPOKE_JSON]
+
+    def test_subtree_requests_per_level(self):
+        bike = self.client.part('Bike')
+        number_of_requests = len(self.adapter.requests)
+
+        tree = bike.subtree()
+
+        self.assertEqual([part.name for part in tree][:2], ['Bike', 'Front Wheel'])
+        self.assertEqual(len(tree), 4)
+        # one request per level, and one for the level without children
+        self.assertEqual(len(self.adapter.requests) - number_of_requests, 3)
+
+        front_wheel = [wheel for wheel in bike.children() if wheel.name == 'Front Wheel'][0]
+        self.assertIs(front_wheel.parent(), bike)
+        self.assertEqual([spoke.name for spoke in front_wheel.children()], ['Spoke'])
+        self.assertEqual(len(self.adapter.requests) - number_of_requests, 3)
+
+    def test_subtree_with_depth(self):
+        bike = self.client.part('Bike')
+
+        tree = self.client.part_tree(bike, depth=1)
+
+        self.assertEqual(sorted(part.name for part in tree), ['Bike', 'Front Wheel', 'Rear Wheel'])
@@ -1,7 +1,14 @@
+import json
+
+from six.moves.urllib.parse import parse_qs, urlparse
+
+from pykechain import Client
 from pykechain.enums import Multiplicity, Category
 from pykechain.exceptions import NotFoundError, MultipleFoundError, APIError, IllegalArgumentError
-from pykechain.models import Part, PartSet
-from tests.classes import TestBetamax
+from pykechain.identity_map import IdentityMap
+from pykechain.models import Part, PartSet, PartGraph, Property
+from tests.classes import TestBetamax, TestOffline, make_part_json
+from tests.utils import TEST_URL
 
 
 class TestParts(TestBetamax):
@@ -45,8 +52,10 @@ class TestParts(TestBetamax):
     def test_part_set_get_item_invalid(self):
         part_set = self.project.parts()
 
-        with self.assertRaises(NotImplementedError):
+        with self.assertRaises(KeyError):
             part_set['testing']
+        with self.assertRaises(TypeError):
+            part_set[None]
 
     def test_part_add_delete_part(self):
         project = self.client.scope('Bike Project (pykechain testing)')
@@ -528,3 +537,348 @@ class TestPartCreateWithProperties(TestBetamax):
 
         with self.assertRaises(APIError):
             front_fork_instance.order_properties(property_list=desired_order_list)
+
+
+class TestPartsStreaming(TestOffline):
+    parts_json = [make_part_json('Part {}'.format(i)) for i in range(25)]
+
+    def test_iter_parts_is_lazy(self):
+        parts = self.client.iter_parts(batch=10)
+        self.assertEqual(len(self.adapter.requests), 0)
+
+        first_part = next(parts)
+        self.assertIsInstance(first_part, Part)
+        self.assertEqual(first_part.name, 'Part 0')
+        self.assertEqual(len(self.adapter.requests), 1)
+
+        remaining_parts = list(parts)
+        self.assertEqual(len(remaining_parts), 24)
+        self.assertEqual(len(self.adapter.requests), 3)
+
+    def test_iter_parts_respects_limit(self):
+        parts = list(self.client.iter_parts(limit=15, batch=10))
+
+        self.assertEqual(len(parts), 15)
+        self.assertEqual(len(self.adapter.requests), 2)
+
+    def test_parts_respects_limit_over_multiple_batches(self):
+        parts = self.client.parts(limit=15, batch=10)
+
+        self.assertIsInstance(parts, PartSet)
+        self.assertEqual(len(parts), 15)
+        self.assertEqual([p.name for p in parts], ['Part {}'.format(i) for i in range(15)])
+
+    def test_parts_with_concurrent_batches(self):
+        parts = self.client.parts(batch=4, max_workers=3)
+
+        self.assertEqual([p.name for p in parts], ['Part {}'.format(i) for i in range(25)])
+        self.assertEqual(len(self.adapter.requests), 7)
+        self.assertTrue(all('offset=' in r.url for r in self.adapter.requests[1:]))
+
+    def test_iter_parts_with_concurrent_batches_respects_limit(self):
+        parts = list(self.client.iter_parts(batch=4, limit=10, max_workers=3))
+
+        self.assertEqual([p.name for p in parts], ['Part {}'.format(i) for i in range(10)])
+        self.assertEqual(len(self.adapter.requests), 3)
+
+
+class TestPartGraph(TestOffline):
+    wheel_model_json = make_part_json('Wheel', category=Category.MODEL)
+    bike_json = make_part_json('Bike')
+    front_wheel_json = make_part_json('Front Wheel', parent_id=bike_json['id'], model_id=wheel_model_json['id'])
+    rear_wheel_json = make_part_json('Rear Wheel', parent_id=bike_json['id'], model_id=wheel_model_json['id'])
+    parts_json = [wheel_model_json, bike_json, front_wheel_json, rear_wheel_json]
+
+    def setUp(self):
+        super(TestPartGraph, self).setUp()
+        self.graph = PartGraph(self.client.parts(category=None)).attach()
+        self.number_of_requests = len(self.adapter.requests)
+
+    def test_indexes(self):
+        self.assertEqual(len(self.graph), 4)
+        self.assertIn(self.bike_json['id'], self.graph)
+        self.assertEqual(self.graph.get(name='Bike').id, self.bike_json['id'])
+        self.assertIsNone(self.graph.get(pk='unknown'))
+
+    def test_navigation_from_graph(self):
+        bike = self.graph.get(self.bike_json['id'])
+        front_wheel = self.graph.get(self.front_wheel_json['id'])
+        wheel_model = self.graph.get(self.wheel_model_json['id'])
+
+        self.assertIs(front_wheel.parent(), bike)
+        self.assertEqual(sorted(p.name for p in bike.children()), ['Front Wheel', 'Rear Wheel'])
+        self.assertEqual(sorted(p.name for p in front_wheel.siblings()), ['Front Wheel', 'Rear Wheel'])
+        self.assertIs(front_wheel.model(), wheel_model)
+        self.assertEqual(len(wheel_model.instances()), 2)
+        self.assertIsNone(bike.parent())
+        self.assertEqual(len(self.adapter.requests), self.number_of_requests)
+
+    def test_detach(self):
+        bike = self.graph.get(self.bike_json['id'])
+        self.graph.detach()
+
+        self.assertEqual(len(bike.children()), 2)
+        self.assertEqual(len(self.adapter.requests), self.number_of_requests + 1)
+
+
+class TestPartPropertyIndex(TestOffline):
+    parts_json = [make_part_json('Wheel', category=Category.MODEL, properties=[
+        {'id': 'p{}'.format(i), 'name': 'Property {}'.format(i), 'value': i, 'property_type': 'INT_VALUE'}
+        for i in range(200)
+    ] + [{'id': 'duplicate', 'name': 'Property 0', 'value': None, 'property_type': 'INT_VALUE'}])]
+
+    def setUp(self):
+        super(TestPartPropertyIndex, self).setUp()
+        self.wheel_model = self.client.model('Wheel')
+
+    def test_lookup_by_name_and_id(self):
+        self.assertEqual(self.wheel_model.property('Property 150').value, 150)
+        self.assertEqual(self.wheel_model.property('p150').name, 'Property 150')
+        self.assertEqual(self.wheel_model.property('Property 0').id, 'p0')
+
+        with self.assertRaises(NotFoundError):
+            self.wheel_model.property('Property 200')
+
+    def test_index_follows_changes(self):
+        self.wheel_model.property('Property 1')
+
+        self.wheel_model.property('Property 1').name = 'Renamed'
+        self.assertEqual(self.wheel_model.property('Renamed').id, 'p1')
+        with self.assertRaises(NotFoundError):
+            self.wheel_model.property('Property 1')
+
+        added = Property({'id': 'added', 'name': 'Added', 'value': None}, client=self.client)
+        self.wheel_model.properties.append(added)
+        self.assertIs(self.wheel_model.property('Added'), added)
+
+    def test_order_properties(self):
+        self.wheel_model.order_properties(['Property 2', self.wheel_model.property('p1'), 'Property 2'])
+
+        order_request = self.adapter.requests[-1]
+        self.assertEqual(order_request.method, 'PUT')
+        self.assertIn('property_order', order_request.body)
+        self.assertEqual(json.loads(parse_qs(order_request.body)['property_order'][0]), {'p2': 0, 'p1': 1})
+
+    def test_properties_are_created_on_first_access(self):
+        wheel_model = self.client.model('Wheel')
+        self.assertIsNone(wheel_model._properties)
+
+        self.assertEqual(wheel_model.name, 'Wheel')
+        self.assertIsNone(wheel_model._properties)
+
+        self.assertEqual(len(wheel_model.properties), 201)
+        self.assertIs(wheel_model.properties[0], wheel_model.property('p0'))
+
+
+class TestPartMemoryFootprint(TestOffline):
+    parts_json = [make_part_json('Wheel {}'.format(i), properties=[
+        {'id': 'p{}'.format(i), 'name': 'Diameter', 'value': 60.8, 'property_type': 'FLOAT_VALUE',
+         'description': 'The diameter of the wheel', 'order': 1}
+    ]) for i in range(2)]
+
+    def test_slots(self):
+        wheel = self.client.part('Wheel 0')
+
+        self.assertFalse(hasattr(wheel, '__dict__'))
+        self.assertFalse(hasattr(wheel.property('Diameter'), '__dict__'))
+        self.assertIn('<td>Diameter</td>', wheel._repr_html_())
+
+    def test_interned_strings(self):
+        wheel_0, wheel_1 = self.client.parts()
+
+        self.assertIs(wheel_0.category, wheel_1.category)
+        self.assertIs(wheel_0.property('Diameter')._json_data['property_type'],
+                      wheel_1.property('Diameter')._json_data['property_type'])
+
+    def test_compact_json(self):
+        client = Client(url=TEST_URL, compact=True)
+        client.session.mount(TEST_URL, self.adapter)
+
+        wheel = client.part('Wheel 0')
+
+        self.assertNotIn('description', wheel.property('Diameter')._json_data)
+        self.assertEqual(wheel.property('Diameter').value, 60.8)
+        self.assertEqual(wheel.multiplicity, 'ZERO_MANY')
+
+
+class TestPartsSparseFields(TestOffline):
+    bike_json = make_part_json('Bike', properties=[
+        {'id': 'gears', 'name': 'Gears', 'value': 10, 'property_type': 'INT_VALUE', 'description': 'Number of gears'}
+    ])
+    frame_json = make_part_json('Frame', parent_id=bike_json['id'])
+    parts_json = [bike_json, frame_json]
+
+    def test_fields_parameter(self):
+        self.client.parts(fields=['name', 'parent'])
+        self.assertEqual(parse_qs(urlparse(self.adapter.requests[-1].url).query)['fields'], ['id,category,name,parent'])
+
+        self.client.parts(fields=['name', 'properties'], property_fields=['value'])
+        self.assertEqual(parse_qs(urlparse(self.adapter.requests[-1].url).query)['fields'],
+                         ['id,category,name,properties.id,properties.property_type,properties.value'])
+
+        self.client.parts()
+        self.assertNotIn('fields', parse_qs(urlparse(self.adapter.requests[-1].url).query))
+
+    def test_selected_fields_make_no_requests(self):
+        frame = self.client.parts(name='Frame', fields=['name', 'parent'])[0]
+
+        self.assertEqual(frame.name, 'Frame')
+        self.assertEqual(frame.parent_id, self.bike_json['id'])
+        self.assertNotIn('properties', frame._json_data)
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_missing_fields_are_retrieved_on_access(self):
+        bike = self.client.parts(name='Bike', fields=['parent'])[0]
+        self.assertEqual(len(self.adapter.requests), 1)
+
+        self.assertEqual(bike.name, 'Bike')
+        self.assertEqual(len(self.adapter.requests), 2)
+        self.assertEqual(bike.multiplicity, 'ZERO_MANY')
+        self.assertEqual(bike.property('Gears').value, 10)
+        self.assertEqual(len(self.adapter.requests), 2)
+
+    def test_missing_property_fields_are_retrieved_on_access(self):
+        bike = self.client.parts(name='Bike', fields=['name', 'properties'], property_fields=['name'])[0]
+        gears = bike.property('Gears')
+        self.assertNotIn('value', gears._json_data)
+
+        self.assertEqual(gears.value, 10)
+        self.assertTrue(self.adapter.requests[-1].url.endswith('/api/properties/gears.json'))
+
+    def test_partial_json_merged_into_live_object(self):
+        self.client.identity_map = IdentityMap()
+        bike = self.client.part(name='Bike')
+        gears = bike.property('Gears')
+
+        self.assertIs(self.client.parts(name='Bike', fields=['name', 'properties'], property_fields=['value'])[0],
+                      bike)
+        self.assertFalse(bike._partial)
+        self.assertEqual(bike.multiplicity, 'ZERO_MANY')
+        self.assertIs(bike.property('Gears'), gears)
+        self.assertFalse(gears._partial)
+        self.assertEqual(gears._json_data['description'], 'Number of gears')
+        self.assertEqual(len(self.adapter.requests), 2)
+
+
+class TestPartSet(TestOffline):
+    parts_json = [make_part_json('Wheel') for _ in range(2)] + [make_part_json('Part {}'.format(i)) for i in range(8)]
+
+    def setUp(self):
+        super(TestPartSet, self).setUp()
+        self.part_set = self.client.parts()
+
+    def test_reiterable(self):
+        self.assertEqual(len(list(self.part_set)), 10)
+        self.assertEqual(len(list(self.part_set)), 10)
+
+    def test_slicing(self):
+        part_slice = self.part_set[2:5]
+
+        self.assertIsInstance(part_slice, PartSet)
+        self.assertEqual([part.name for part in part_slice], ['Part 0', 'Part 1', 'Part 2'])
+        self.assertEqual(self.part_set[-1].name, 'Part 7')
+
+    def test_lookup_on_id_or_name(self):
+        wheel_id = self.parts_json[1]['id']
+
+        self.assertIs(self.part_set[wheel_id], self.part_set[1])
+        self.assertIs(self.part_set['Part 3'], self.part_set[5])
+        with self.assertRaises(KeyError):
+            self.part_set['unknown']
+        with self.assertRaises(TypeError):
+            self.part_set[1.5]
+
+    def test_get(self):
+        wheel_id = self.parts_json[1]['id']
+
+        self.assertIs(self.part_set.get(pk=wheel_id), self.part_set[1])
+        self.assertIs(self.part_set.get(id=wheel_id), self.part_set[1])
+        self.assertIs(self.part_set.get(name='Part 3'), self.part_set[5])
+        self.assertIsNone(self.part_set.get(pk='unknown'))
+        self.assertIsNone(self.part_set.get(name='unknown'))
+
+    def test_by_name(self):
+        wheels = self.part_set.by_name['Wheel']
+
+        self.assertEqual(len(wheels), 2)
+        self.assertIn('Part 7', self.part_set.by_name)
+        self.assertIs(self.part_set.by_name, self.part_set.by_name)
+        with self.assertRaises(KeyError):
+            self.part_set.by_name['unknown']
+
+    def test_membership(self):
+        part = self.part_set[3]
+
+        self.assertIn(part, self.part_set)
+        self.assertIn(part.id, self.part_set)
+        self.assertNotIn(part, self.part_set[4:])
+        self.assertNotIn('unknown', self.part_set)
+
+
+def make_bike_json(name, model_id, gears, material):
+    return make_part_json(name, model_id=model_id, properties=[
+        {'id': str(gears), 'name': 'Gears', 'value': gears, 'property_type': 'INT_VALUE'},
+        {'id': material, 'name': 'Rim Material', 'value': material, 'property_type': 'SINGLE_SELECT_VALUE'}])
+
+
+class TestPartSetQuery(TestOffline):
+    parts_json = [make_bike_json('Race Bike', 'bike', 22, 'Carbon'), make_bike_json('City Bike', 'bike', 7, 'Steel'),
+                  make_bike_json('Mountain Bike', 'bike', None, 'Aluminium'),
+                  make_bike_json('Racing Trike', 'trike', 11, 'Steel')]
+
+    def setUp(self):
+        super(TestPartSetQuery, self).setUp()
+        self.bikes = self.client.parts()
+
+    def names(self, part_set):
+        return [part.name for part in part_set]
+
+    def test_filter(self):
+        self.assertEqual(self.names(self.bikes.filter(model='bike', properties__Gears__gt=10)), ['Race Bike'])
+        self.assertEqual(self.names(self.bikes.filter(name__icontains='RAC')), ['Race Bike', 'Racing Trike'])
+        self.assertEqual(self.names(self.bikes.filter(properties__Gears__isnull=True)), ['Mountain Bike'])
+        self.assertEqual(self.names(self.bikes.filter(**{'properties__Rim Material__in': ['Steel', 'Carbon'],
+                                                         'properties__Gears__lte': 11})),
+                         ['City Bike', 'Racing Trike'])
+        self.assertEqual(len(self.bikes.filter()), 4)
+
+    def test_filter_on_part(self):
+        bike = self.bikes[0]
+
+        self.assertEqual(self.names(self.bikes.filter(id=bike)), ['Race Bike'])
+        self.assertEqual(self.names(self.bikes.filter(id__in=[bike, self.bikes[1].id])), ['Race Bike', 'City Bike'])
+
+    def test_filter_reuses_columns(self):
+        self.bikes.filter(properties__Gears__gt=10)
+        columns = self.bikes._field_columns['properties__Gears']
+
+        self.bikes.filter(properties__Gears__lt=10)
+        self.assertIs(self.bikes._field_columns['properties__Gears'], columns)
+        self.assertTrue(all(part._properties is None for part in self.bikes))
+
+    def test_filter_unknown_field(self):
+        with self.assertRaises(IllegalArgumentError):
+            self.bikes.filter(colour='red')
+
+    def test_order_by(self):
+        self.assertEqual(self.names(self.bikes.order_by('-properties__Gears')),
+                         ['Race Bike', 'Racing Trike', 'City Bike', 'Mountain Bike'])
+        self.assertEqual(self.names(self.bikes.order_by('model', '-name')),
+                         ['Race Bike', 'Mountain Bike', 'City Bike', 'Racing Trike'])
+
+    def test_order_by_mixed_types(self):
+        self.adapter.parts = self.parts_json + [make_bike_json('Unicycle', 'unicycle', 'one', 'Steel')]
+        bikes = self.client.parts()
+
+        self.assertEqual(self.names(bikes.order_by('properties__Gears')),
+                         ['City Bike', 'Racing Trike', 'Race Bike', 'Unicycle', 'Mountain Bike'])
+        self.assertEqual(self.names(bikes.order_by('-properties__Gears')),
+                         ['Unicycle', 'Race Bike', 'Racing Trike', 'City Bike', 'Mountain Bike'])
+        self.assertEqual(self.names(bikes.filter(properties__Gears__gt=10)), ['Race Bike', 'Racing Trike'])
+
+    def test_group_by(self):
+        groups = self.bikes.group_by('properties__Rim Material')
+
+        self.assertEqual(list(groups), ['Carbon', 'Steel', 'Aluminium'])
+        self.assertEqual(self.names(groups['Steel']), ['City Bike', 'Racing Trike'])
+        self.assertEqual([len(bikes) for bikes in self.bikes.group_by('model').values()], [3, 1])
@@ -0,0 +1,61 @@
+import pytest
+
+from tests.classes import TestOffline, make_part_json
+
+
+def make_wheel_json(diameter, material, rim_id=None):
+    return make_part_json('Wheel', properties=[
+        {'id': 'diameter', 'name': 'Diameter', 'value': diameter, 'property_type': 'FLOAT_VALUE'},
+        {'id': 'material', 'name': 'Material', 'value': material, 'property_type': 'SINGLE_SELECT_VALUE',
+         'options': {'value_choices': ['Steel', 'Aluminium', 'Carbon']}},
+        {'id': 'rim', 'name': 'Rim', 'value': {'id': rim_id, 'name': 'Rim'} if rim_id else None,
+         'property_type': 'REFERENCE_VALUE'},
+    ])
+
+
+class TestPartSetExport(TestOffline):
+    parts_json = [make_wheel_json(60.0, 'Aluminium', rim_id='rim-1'), make_wheel_json(62.5, 'Carbon'),
+                  make_wheel_json(None, None)]
+
+    def setUp(self):
+        super(TestPartSetExport, self).setUp()
+        self.wheels = self.client.parts()
+
+    def test_to_dataframe(self):
+        pandas = pytest.importorskip('pandas')
+
+        df = self.wheels.to_dataframe()
+
+        self.assertEqual(list(df.columns), ['name', 'Diameter', 'Material', 'Rim'])
+        self.assertEqual(list(df.index), [part['id'] for part in self.parts_json])
+        self.assertEqual(df.index.name, 'id')
+        self.assertAlmostEqual(df['Diameter'].mean(), 61.25)
+        self.assertTrue(pandas.isnull(df['Diameter'].iloc[2]))
+        self.assertEqual(df['Rim'].iloc[0], 'rim-1')
+
+    def test_to_dataframe_categorical_select_list(self):
+        pytest.importorskip('pandas')
+
+        material = self.wheels.to_dataframe(properties=['Material'])['Material']
+
+        self.assertEqual(str(material.dtype), 'category')
+        self.assertEqual(list(material.cat.categories), ['Steel', 'Aluminium', 'Carbon'])
+        self.assertEqual(material.value_counts()['Steel'], 0)
+
+    def test_to_dataframe_no_property_objects_created(self):
+        pytest.importorskip('pandas')
+
+        self.wheels.to_dataframe()
+
+        self.assertTrue(all(part._properties is None for part in self.wheels))
+
+    def test_to_arrow(self):
+        pyarrow = pytest.importorskip('pyarrow')
+
+        table = self.wheels.to_arrow(properties=['Diameter', 'Material'])
+
+        self.assertEqual(table.column_names, ['id', 'name', 'Diameter', 'Material'])
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(table.column('Diameter').null_count, 1)
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('Material').type))
+        self.assertEqual(table.column('Material').to_pylist(), ['Aluminium', 'Carbon', None])
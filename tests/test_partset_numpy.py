@@ -0,0 +1,68 @@
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from pykechain.exceptions import IllegalArgumentError  # noqa: E402
+from tests.classes import TestOffline, make_part_json  # noqa: E402
+
+
+def make_wheel_json(diameter, spokes, material='Aluminium'):
+    properties = [{'id': 'diameter', 'name': 'Diameter', 'value': diameter, 'property_type': 'FLOAT_VALUE'},
+                  {'id': 'material', 'name': 'Material', 'value': material, 'property_type': 'CHAR_VALUE'}]
+    if spokes is not None:
+        properties.append({'id': 'spokes', 'name': 'Spokes', 'value': spokes, 'property_type': 'INT_VALUE'})
+    return make_part_json('Wheel', properties=properties)
+
+
+class TestPartSetValues(TestOffline):
+    parts_json = [make_wheel_json(60.0, 24), make_wheel_json(62.5, None), make_wheel_json(None, 32, 'Carbon')]
+
+    def setUp(self):
+        super(TestPartSetValues, self).setUp()
+        self.wheels = self.client.parts()
+
+    def test_single_property(self):
+        diameters = self.wheels.values('Diameter')
+
+        self.assertIsInstance(diameters, numpy.ma.MaskedArray)
+        self.assertEqual(diameters.dtype, numpy.float64)
+        self.assertEqual(diameters.mask.tolist(), [False, False, True])
+        self.assertAlmostEqual(diameters.mean(), 61.25)
+
+    def test_multiple_properties(self):
+        columns = self.wheels.values('Spokes', 'Material', 'Unknown')
+
+        self.assertEqual(set(columns), {'Spokes', 'Material', 'Unknown'})
+        self.assertEqual(columns['Spokes'].sum(), 56)
+        self.assertEqual(columns['Material'].tolist(), ['Aluminium', 'Aluminium', 'Carbon'])
+        self.assertTrue(columns['Unknown'].mask.all())
+
+    def test_empty_values_are_masked(self):
+        self.adapter.parts = self.parts_json + [make_wheel_json('', 28, '')]
+        wheels = self.client.parts()
+
+        columns = wheels.values('Diameter', 'Material')
+
+        self.assertEqual(columns['Diameter'].mask.tolist(), [False, False, True, True])
+        self.assertEqual(columns['Material'].mask.tolist(), [False, False, False, True])
+        self.assertEqual(columns['Material'].compressed().tolist(), ['Aluminium', 'Aluminium', 'Carbon'])
+
+    def test_dtype(self):
+        spokes = self.wheels.values('Spokes', dtype=float)
+
+        self.assertEqual(spokes.dtype, numpy.float64)
+        self.assertEqual(spokes.compressed().tolist(), [24.0, 32.0])
+
+    def test_no_property_objects_created(self):
+        self.wheels.values('Diameter', 'Spokes')
+
+        self.assertTrue(all(part._properties is None for part in self.wheels))
+
+    def test_values_of_property_objects(self):
+        self.wheels[0].property('Diameter')._value = 70.0
+
+        self.assertEqual(self.wheels.values('Diameter')[0], 70.0)
+
+    def test_no_names(self):
+        with self.assertRaises(IllegalArgumentError):
+            self.wheels.values()
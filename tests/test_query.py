@@ -0,0 +1,107 @@
+import uuid
+
+from six.moves.urllib.parse import parse_qs, urlparse
+
+from pykechain.client import MAX_URL_LENGTH
+from pykechain.exceptions import IllegalArgumentError
+from pykechain.query import PartQuery
+from tests.classes import TestOffline, make_part_json
+
+MODEL_JSON = make_part_json('Bike', category='MODEL')
+
+
+def make_bike_json(name, gears):
+    return make_part_json(name, model_id=MODEL_JSON['id'], properties=[
+        {'id': name, 'name': 'Gears', 'value': gears, 'property_type': 'INT_VALUE'}])
+
+
+class TestPartQuery(TestOffline):
+    parts_json = [MODEL_JSON] + [make_bike_json('Bike {}'.format(i), i) for i in range(25)]
+
+    def query_params(self, request_number=0):
+        return dict((key, value[0]) for key, value in
+                    parse_qs(urlparse(self.adapter.requests[request_number].url).query).items())
+
+    def test_lazy(self):
+        query = self.client.parts_query(name='Bike 1')
+
+        self.assertIsInstance(query, PartQuery)
+        self.assertEqual(len(self.adapter.requests), 0)
+        self.assertEqual([part.name for part in query], ['Bike 1'])
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_server_conditions_pushed_down(self):
+        parts = self.client.parts_query(model=MODEL_JSON['id']).limit(5).all()
+
+        self.assertEqual(len(parts), 5)
+        self.assertEqual(len(self.adapter.requests), 1)
+        params = self.query_params()
+        self.assertEqual(params['model'], MODEL_JSON['id'])
+        self.assertEqual(params['category'], 'INSTANCE')
+        self.assertEqual(params['limit'], '5')
+
+    def test_client_conditions_on_stream(self):
+        query = self.client.parts_query(batch=10).filter(properties__Gears__gte=8, name__endswith='2')
+
+        self.assertEqual([part.name for part in query], ['Bike 12', 'Bike 22'])
+        self.assertEqual(len(self.adapter.requests), 3)
+        self.assertNotIn('properties__Gears__gte', self.query_params())
+
+    def test_client_limit_stops_streaming(self):
+        query = self.client.parts_query(batch=10).filter(properties__Gears__gte=3).limit(4)
+
+        self.assertEqual([part.name for part in query], ['Bike 3', 'Bike 4', 'Bike 5', 'Bike 6'])
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_category(self):
+        self.assertEqual(self.client.parts_query(category=None).count(), 26)
+        self.assertEqual(self.client.parts_query(category='MODEL').first().name, 'Bike')
+        self.assertEqual(self.client.parts_query().count(), 25)
+
+    def test_only(self):
+        query = self.client.parts_query().only('name').filter(properties__Gears=3)
+
+        self.assertEqual(query.first().name, 'Bike 3')
+        self.assertEqual(self.query_params()['fields'], 'id,category,name,properties')
+
+    def test_chaining_returns_new_queries(self):
+        query = self.client.parts_query()
+        limited = query.limit(1)
+
+        self.assertIsNot(query, limited)
+        self.assertEqual(len(query.all()), 25)
+        self.assertEqual(len(limited.all()), 1)
+
+    def test_in_conditions_are_chunked(self):
+        ids = [str(uuid.uuid4()) for _ in range(75)] + [part['id'] for part in self.parts_json[1:]]
+
+        query = self.client.parts_query(id__in=ids, parent__in=[None])
+
+        self.assertEqual(query.count(), 25)
+        self.assertTrue(len(self.adapter.requests) > 1)
+        self.assertTrue(all(len(request.url) <= MAX_URL_LENGTH for request in self.adapter.requests))
+        self.assertIn('id__in', self.query_params())
+        self.assertNotIn('parent__in', self.query_params())
+        self.assertEqual(len(query.limit(3).all()), 3)
+
+    def test_count(self):
+        self.assertEqual(self.client.parts_query(model=MODEL_JSON['id']).count(), 25)
+        self.assertEqual(self.query_params()['limit'], '1')
+        self.assertEqual(self.client.parts_query(properties__Gears__lt=5).count(), 5)
+
+    def test_explain(self):
+        query = self.client.parts_query(model=MODEL_JSON['id'], properties__Gears__gt=10).only('name').limit(5)
+
+        self.assertEqual(query.explain().splitlines(), [
+            "api:    category = 'INSTANCE', model = '{}'".format(MODEL_JSON['id']),
+            "client: properties__Gears__gt = 10",
+            "fields: name, properties",
+            "limit:  5 (client)",
+        ])
+        self.assertEqual(len(self.adapter.requests), 0)
+
+    def test_unsupported_conditions(self):
+        with self.assertRaises(IllegalArgumentError):
+            self.client.parts_query(colour='red')
+        with self.assertRaises(IllegalArgumentError):
+            self.client.parts_query(bucket__in=['a', 'b'])
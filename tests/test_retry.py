@@ -0,0 +1,95 @@
+import time
+
+import requests
+from unittest import TestCase
+
+from pykechain import Client
+from pykechain.exceptions import NotFoundError, DeadlineExceededError
+from pykechain.retry import RetryPolicy
+from tests.classes import FakeKechainAdapter, make_part_json
+from tests.utils import TEST_URL
+
+
+class BusyKechainAdapter(FakeKechainAdapter):
+    """Respond with the given failures (status code, headers) before serving the requests."""
+
+    def __init__(self, parts, failures):
+        super(BusyKechainAdapter, self).__init__(parts)
+        self.failures = list(failures)
+
+    def send(self, request, **kwargs):
+        if not self.failures:
+            return super(BusyKechainAdapter, self).send(request, **kwargs)
+
+        self.requests.append(request)
+        status_code, headers = self.failures.pop(0)
+        if status_code is None:
+            raise requests.exceptions.ConnectionError("Connection refused")
+        response = self._response(request, {'results': [{'detail': 'Busy'}]}, status_code=status_code)
+        response.headers.update(headers)
+        return response
+
+
+class TestRetryPolicy(TestCase):
+    def setUp(self):
+        self.retry = RetryPolicy(max_attempts=3, backoff_factor=0.001, jitter=False)
+        self.client = Client(url=TEST_URL, retry=self.retry)
+
+    def mount(self, failures):
+        self.adapter = BusyKechainAdapter([make_part_json('Bike')], failures)
+        self.client.session.mount(TEST_URL, self.adapter)
+
+    def test_retry_busy_responses(self):
+        self.mount([(503, {}), (429, {'Retry-After': '0.002'})])
+
+        self.assertEqual(self.client.part(name='Bike').name, 'Bike')
+        self.assertEqual(self.client.last_attempts, 3)
+        self.assertAlmostEqual(self.client.last_backoff, 0.003)
+        self.assertEqual(self.retry.retries, 2)
+
+    def test_retry_connection_errors(self):
+        self.mount([(None, {})])
+
+        self.assertEqual(self.client.part(name='Bike').name, 'Bike')
+        self.assertEqual(self.client.last_attempts, 2)
+
+    def test_backoff_respects_deadline(self):
+        self.retry.max_backoff = 60
+        self.mount([(503, {'Retry-After': '30'})])
+
+        start = time.time()
+        with self.assertRaises(DeadlineExceededError):
+            self.client.parts(deadline=1)
+        self.assertLess(time.time() - start, 1)
+        self.assertEqual(len(self.adapter.requests), 1)
+
+    def test_give_up_after_max_attempts(self):
+        self.mount([(503, {})] * 3)
+
+        with self.assertRaises(NotFoundError):
+            self.client.part(name='Bike')
+        self.assertEqual(len(self.adapter.requests), 3)
+
+    def test_no_retry_of_non_idempotent_methods(self):
+        self.mount([(503, {})])
+
+        response = self.client._request('POST', self.client._build_url('parts'))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.client.last_attempts, 1)
+
+    def test_no_retry_by_default(self):
+        client = Client(url=TEST_URL)
+        self.mount([(503, {})])
+        client.session.mount(TEST_URL, self.adapter)
+
+        with self.assertRaises(NotFoundError):
+            client.part(name='Bike')
+
+    def test_backoff_time(self):
+        retry = RetryPolicy(backoff_factor=1, max_backoff=5)
+        busy_response = requests.Response()
+        busy_response.headers['Retry-After'] = '120'
+
+        self.assertTrue(1 <= retry.backoff_time(2) <= 2)
+        self.assertEqual(retry.backoff_time(5, busy_response), 5)